@@ -5,29 +5,30 @@ from setuptools import find_packages
 
 here = Path(__file__).absolute().parent
 
+PACKAGES = find_packages(exclude=['tests', 'tests.*'])
+
 
 EXTRAS = frozenset({
     'third_party',
 })
 
 
-def extras_require(all_extras=EXTRAS):
-    """ Get map of all extra requirements
-    """
-    return {
-        x: requirements(here / 'requirements' / 'extras' / f'{x}.txt') for x in all_extras
-    }
+def requirements(at_path: Path):
+    rows = (row.strip() for row in at_path.read_text().splitlines())
+    return [
+        row for row in rows
+        # includes of other requirement files (-r) are not requirements themselves
+        if row and not row.startswith(('#', 'http', '-'))
+    ]
+
 
+INSTALL_REQUIRES = requirements(here / 'requirements' / 'minimal.txt')
 
-def requirements(at_path: Path):
-    with at_path.open() as f:
-        rows = f.read().strip().split('\n')
-        requires = []
-        for row in rows:
-            row = row.strip()
-            if row and not (row.startswith('#') or row.startswith('http')):
-                requires.append(row)
-    return requires
+# Map of all extra requirements
+EXTRAS_REQUIRE = {
+    **{x: requirements(here / 'requirements' / 'extras' / f'{x}.txt') for x in EXTRAS},
+    'test': requirements(here / 'requirements' / 'test.txt'),
+}
 
 
 with (here / 'README.rst').open() as f:
@@ -48,19 +49,21 @@ setup(name='typeit',
           'License :: OSI Approved :: MIT License',
           'Programming Language :: Python',
           'Programming Language :: Python :: 3',
+          'Programming Language :: Python :: 3.10',
+          'Programming Language :: Python :: 3.11',
           'Operating System :: POSIX',
       ],
       author='Maxim Avanov',
       author_email='maxim.avanov@gmail.com',
       url='https://github.com/avanov/typeit',
       keywords='utils typing json yaml serialization deserialization structured-data',
-      packages=find_packages(exclude=['tests', 'tests.*']),
+      python_requires='>=3.10',
+      packages=PACKAGES,
       include_package_data=True,
       zip_safe=False,
       test_suite='tests',
-      tests_require=['pytest', 'coverage'],
-      install_requires=requirements(here / 'requirements' / 'minimal.txt'),
-      extras_require=extras_require(),
+      install_requires=INSTALL_REQUIRES,
+      extras_require=EXTRAS_REQUIRE,
       entry_points={
           'console_scripts': [
               'typeit = typeit.cli:main'
@@ -0,0 +1,28 @@
+import json
+
+import pytest
+
+import typeit
+from typeit import codegen as cg
+from typeit.codegen import TypeitSchema
+from typeit.combinator.constructor import TypeTools
+
+from .paths import GITHUB_PR_PAYLOAD
+
+
+@pytest.fixture(scope='session')
+def github_pr_dict():
+    with GITHUB_PR_PAYLOAD.open('r') as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope='session')
+def github_pr_schema(github_pr_dict) -> TypeitSchema:
+    parsed, overrides = cg.parse_mapping(github_pr_dict)
+    typ, overrides_ = cg.construct_type('main', parsed)
+    return TypeitSchema(typ, overrides.update(overrides_))
+
+
+@pytest.fixture(scope='session')
+def github_pr_constructor(github_pr_schema) -> TypeTools:
+    return typeit.TypeConstructor(github_pr_schema.typ, overrides=github_pr_schema.overrides)
@@ -3,7 +3,6 @@ from typing import get_type_hints
 
 import pytest
 
-import typeit
 from typeit import codegen as cg
 from typeit.codegen import TypeitSchema
 
@@ -38,14 +37,10 @@ def test_parse_structure_with_sequences():
     assert "x: Sequence[Sequence[X]]" in python_source
 
 
-def test_parser_github_pull_request_payload():
-    data = GITHUB_PR_PAYLOAD_JSON
-    github_pr_dict = json.loads(data)
-    parsed, overrides = cg.parse_mapping(github_pr_dict)
-    typ, overrides_ = cg.construct_type('main', parsed)
-    overrides = overrides.update(overrides_)
+def test_parser_github_pull_request_payload(github_pr_dict, github_pr_schema, github_pr_constructor):
+    typ, overrides = github_pr_schema.typ, github_pr_schema.overrides
 
-    python_source, __ = cg.codegen_py(TypeitSchema(typ, overrides))
+    python_source, __ = cg.codegen_py(github_pr_schema)
     assert 'overrides' in python_source
     assert "PullRequest.links: '_links'," in python_source
     assert 'mk_main, serialize_main = TypeConstructor & overrides ^ Main' in python_source
@@ -55,464 +50,21 @@ def test_parser_github_pull_request_payload():
     assert PullRequestType.links in overrides
     assert overrides[PullRequestType.links] == '_links'
 
-    constructor, serializer = typeit.TypeConstructor(
-        typ,
-        overrides=overrides
-    )
+    constructor, serializer = github_pr_constructor
     github_pr = constructor(github_pr_dict)
     assert github_pr.pull_request.links.comments.href.startswith('http')
     assert github_pr_dict == serializer(github_pr)
 
 
-GITHUB_PR_PAYLOAD_JSON = """
-{
-  "action": "closed",
-  "number": 1,
-  "pull_request": {
-    "url": "https://api.github.com/repos/Codertocat/Hello-World/pulls/1",
-    "id": 191568743,
-    "node_id": "MDExOlB1bGxSZXF1ZXN0MTkxNTY4NzQz",
-    "html_url": "https://github.com/Codertocat/Hello-World/pull/1",
-    "diff_url": "https://github.com/Codertocat/Hello-World/pull/1.diff",
-    "patch_url": "https://github.com/Codertocat/Hello-World/pull/1.patch",
-    "issue_url": "https://api.github.com/repos/Codertocat/Hello-World/issues/1",
-    "number": 1,
-    "state": "closed",
-    "locked": false,
-    "title": "Update the README with new information",
-    "user": {
-      "login": "Codertocat",
-      "id": 21031067,
-      "node_id": "MDQ6VXNlcjIxMDMxMDY3",
-      "avatar_url": "https://avatars1.githubusercontent.com/u/21031067?v=4",
-      "gravatar_id": "",
-      "url": "https://api.github.com/users/Codertocat",
-      "html_url": "https://github.com/Codertocat",
-      "followers_url": "https://api.github.com/users/Codertocat/followers",
-      "following_url": "https://api.github.com/users/Codertocat/following{/other_user}",
-      "gists_url": "https://api.github.com/users/Codertocat/gists{/gist_id}",
-      "starred_url": "https://api.github.com/users/Codertocat/starred{/owner}{/repo}",
-      "subscriptions_url": "https://api.github.com/users/Codertocat/subscriptions",
-      "organizations_url": "https://api.github.com/users/Codertocat/orgs",
-      "repos_url": "https://api.github.com/users/Codertocat/repos",
-      "events_url": "https://api.github.com/users/Codertocat/events{/privacy}",
-      "received_events_url": "https://api.github.com/users/Codertocat/received_events",
-      "type": "User",
-      "site_admin": false
-    },
-    "body": "This is a pretty simple change that we need to pull into master.",
-    "created_at": "2018-05-30T20:18:30Z",
-    "updated_at": "2018-05-30T20:18:50Z",
-    "closed_at": "2018-05-30T20:18:50Z",
-    "merged_at": null,
-    "merge_commit_sha": "414cb0069601a32b00bd122a2380cd283626a8e5",
-    "assignee": null,
-    "assignees": [
-      "undefined"
-    ],
-    "requested_reviewers": [
-
-    ],
-    "requested_teams": [
-
-    ],
-    "labels": [
-
-    ],
-    "milestone": null,
-    "commits_url": "https://api.github.com/repos/Codertocat/Hello-World/pulls/1/commits",
-    "review_comments_url": "https://api.github.com/repos/Codertocat/Hello-World/pulls/1/comments",
-    "review_comment_url": "https://api.github.com/repos/Codertocat/Hello-World/pulls/comments{/number}",
-    "comments_url": "https://api.github.com/repos/Codertocat/Hello-World/issues/1/comments",
-    "statuses_url": "https://api.github.com/repos/Codertocat/Hello-World/statuses/34c5c7793cb3b279e22454cb6750c80560547b3a",
-    "head": {
-      "label": "Codertocat:changes",
-      "ref": "changes",
-      "sha": "34c5c7793cb3b279e22454cb6750c80560547b3a",
-      "user": {
-        "login": "Codertocat",
-        "id": 21031067,
-        "node_id": "MDQ6VXNlcjIxMDMxMDY3",
-        "avatar_url": "https://avatars1.githubusercontent.com/u/21031067?v=4",
-        "gravatar_id": "",
-        "url": "https://api.github.com/users/Codertocat",
-        "html_url": "https://github.com/Codertocat",
-        "followers_url": "https://api.github.com/users/Codertocat/followers",
-        "following_url": "https://api.github.com/users/Codertocat/following{/other_user}",
-        "gists_url": "https://api.github.com/users/Codertocat/gists{/gist_id}",
-        "starred_url": "https://api.github.com/users/Codertocat/starred{/owner}{/repo}",
-        "subscriptions_url": "https://api.github.com/users/Codertocat/subscriptions",
-        "organizations_url": "https://api.github.com/users/Codertocat/orgs",
-        "repos_url": "https://api.github.com/users/Codertocat/repos",
-        "events_url": "https://api.github.com/users/Codertocat/events{/privacy}",
-        "received_events_url": "https://api.github.com/users/Codertocat/received_events",
-        "type": "User",
-        "site_admin": false
-      },
-      "repo": {
-        "id": 135493233,
-        "node_id": "MDEwOlJlcG9zaXRvcnkxMzU0OTMyMzM=",
-        "name": "Hello-World",
-        "full_name": "Codertocat/Hello-World",
-        "owner": {
-          "login": "Codertocat",
-          "id": 21031067,
-          "node_id": "MDQ6VXNlcjIxMDMxMDY3",
-          "avatar_url": "https://avatars1.githubusercontent.com/u/21031067?v=4",
-          "gravatar_id": "",
-          "url": "https://api.github.com/users/Codertocat",
-          "html_url": "https://github.com/Codertocat",
-          "followers_url": "https://api.github.com/users/Codertocat/followers",
-          "following_url": "https://api.github.com/users/Codertocat/following{/other_user}",
-          "gists_url": "https://api.github.com/users/Codertocat/gists{/gist_id}",
-          "starred_url": "https://api.github.com/users/Codertocat/starred{/owner}{/repo}",
-          "subscriptions_url": "https://api.github.com/users/Codertocat/subscriptions",
-          "organizations_url": "https://api.github.com/users/Codertocat/orgs",
-          "repos_url": "https://api.github.com/users/Codertocat/repos",
-          "events_url": "https://api.github.com/users/Codertocat/events{/privacy}",
-          "received_events_url": "https://api.github.com/users/Codertocat/received_events",
-          "type": "User",
-          "site_admin": false
-        },
-        "private": false,
-        "html_url": "https://github.com/Codertocat/Hello-World",
-        "description": null,
-        "fork": false,
-        "url": "https://api.github.com/repos/Codertocat/Hello-World",
-        "forks_url": "https://api.github.com/repos/Codertocat/Hello-World/forks",
-        "keys_url": "https://api.github.com/repos/Codertocat/Hello-World/keys{/key_id}",
-        "collaborators_url": "https://api.github.com/repos/Codertocat/Hello-World/collaborators{/collaborator}",
-        "teams_url": "https://api.github.com/repos/Codertocat/Hello-World/teams",
-        "hooks_url": "https://api.github.com/repos/Codertocat/Hello-World/hooks",
-        "issue_events_url": "https://api.github.com/repos/Codertocat/Hello-World/issues/events{/number}",
-        "events_url": "https://api.github.com/repos/Codertocat/Hello-World/events",
-        "assignees_url": "https://api.github.com/repos/Codertocat/Hello-World/assignees{/user}",
-        "branches_url": "https://api.github.com/repos/Codertocat/Hello-World/branches{/branch}",
-        "tags_url": "https://api.github.com/repos/Codertocat/Hello-World/tags",
-        "blobs_url": "https://api.github.com/repos/Codertocat/Hello-World/git/blobs{/sha}",
-        "git_tags_url": "https://api.github.com/repos/Codertocat/Hello-World/git/tags{/sha}",
-        "git_refs_url": "https://api.github.com/repos/Codertocat/Hello-World/git/refs{/sha}",
-        "trees_url": "https://api.github.com/repos/Codertocat/Hello-World/git/trees{/sha}",
-        "statuses_url": "https://api.github.com/repos/Codertocat/Hello-World/statuses/{sha}",
-        "languages_url": "https://api.github.com/repos/Codertocat/Hello-World/languages",
-        "stargazers_url": "https://api.github.com/repos/Codertocat/Hello-World/stargazers",
-        "contributors_url": "https://api.github.com/repos/Codertocat/Hello-World/contributors",
-        "subscribers_url": "https://api.github.com/repos/Codertocat/Hello-World/subscribers",
-        "subscription_url": "https://api.github.com/repos/Codertocat/Hello-World/subscription",
-        "commits_url": "https://api.github.com/repos/Codertocat/Hello-World/commits{/sha}",
-        "git_commits_url": "https://api.github.com/repos/Codertocat/Hello-World/git/commits{/sha}",
-        "comments_url": "https://api.github.com/repos/Codertocat/Hello-World/comments{/number}",
-        "issue_comment_url": "https://api.github.com/repos/Codertocat/Hello-World/issues/comments{/number}",
-        "contents_url": "https://api.github.com/repos/Codertocat/Hello-World/contents/{+path}",
-        "compare_url": "https://api.github.com/repos/Codertocat/Hello-World/compare/{base}...{head}",
-        "merges_url": "https://api.github.com/repos/Codertocat/Hello-World/merges",
-        "archive_url": "https://api.github.com/repos/Codertocat/Hello-World/{archive_format}{/ref}",
-        "downloads_url": "https://api.github.com/repos/Codertocat/Hello-World/downloads",
-        "issues_url": "https://api.github.com/repos/Codertocat/Hello-World/issues{/number}",
-        "pulls_url": "https://api.github.com/repos/Codertocat/Hello-World/pulls{/number}",
-        "milestones_url": "https://api.github.com/repos/Codertocat/Hello-World/milestones{/number}",
-        "notifications_url": "https://api.github.com/repos/Codertocat/Hello-World/notifications{?since,all,participating}",
-        "labels_url": "https://api.github.com/repos/Codertocat/Hello-World/labels{/name}",
-        "releases_url": "https://api.github.com/repos/Codertocat/Hello-World/releases{/id}",
-        "deployments_url": "https://api.github.com/repos/Codertocat/Hello-World/deployments",
-        "created_at": "2018-05-30T20:18:04Z",
-        "updated_at": "2018-05-30T20:18:50Z",
-        "pushed_at": "2018-05-30T20:18:48Z",
-        "git_url": "git://github.com/Codertocat/Hello-World.git",
-        "ssh_url": "git@github.com:Codertocat/Hello-World.git",
-        "clone_url": "https://github.com/Codertocat/Hello-World.git",
-        "svn_url": "https://github.com/Codertocat/Hello-World",
-        "homepage": null,
-        "size": 0,
-        "stargazers_count": 0,
-        "watchers_count": 0,
-        "language": null,
-        "has_issues": true,
-        "has_projects": true,
-        "has_downloads": true,
-        "has_wiki": true,
-        "has_pages": true,
-        "forks_count": 0,
-        "mirror_url": null,
-        "archived": false,
-        "open_issues_count": 1,
-        "license": null,
-        "forks": 0,
-        "open_issues": 1,
-        "watchers": 0,
-        "default_branch": "master"
-      }
-    },
-    "base": {
-      "label": "Codertocat:master",
-      "ref": "master",
-      "sha": "a10867b14bb761a232cd80139fbd4c0d33264240",
-      "user": {
-        "login": "Codertocat",
-        "id": 21031067,
-        "node_id": "MDQ6VXNlcjIxMDMxMDY3",
-        "avatar_url": "https://avatars1.githubusercontent.com/u/21031067?v=4",
-        "gravatar_id": "",
-        "url": "https://api.github.com/users/Codertocat",
-        "html_url": "https://github.com/Codertocat",
-        "followers_url": "https://api.github.com/users/Codertocat/followers",
-        "following_url": "https://api.github.com/users/Codertocat/following{/other_user}",
-        "gists_url": "https://api.github.com/users/Codertocat/gists{/gist_id}",
-        "starred_url": "https://api.github.com/users/Codertocat/starred{/owner}{/repo}",
-        "subscriptions_url": "https://api.github.com/users/Codertocat/subscriptions",
-        "organizations_url": "https://api.github.com/users/Codertocat/orgs",
-        "repos_url": "https://api.github.com/users/Codertocat/repos",
-        "events_url": "https://api.github.com/users/Codertocat/events{/privacy}",
-        "received_events_url": "https://api.github.com/users/Codertocat/received_events",
-        "type": "User",
-        "site_admin": false
-      },
-      "repo": {
-        "id": 135493233,
-        "node_id": "MDEwOlJlcG9zaXRvcnkxMzU0OTMyMzM=",
-        "name": "Hello-World",
-        "full_name": "Codertocat/Hello-World",
-        "owner": {
-          "login": "Codertocat",
-          "id": 21031067,
-          "node_id": "MDQ6VXNlcjIxMDMxMDY3",
-          "avatar_url": "https://avatars1.githubusercontent.com/u/21031067?v=4",
-          "gravatar_id": "",
-          "url": "https://api.github.com/users/Codertocat",
-          "html_url": "https://github.com/Codertocat",
-          "followers_url": "https://api.github.com/users/Codertocat/followers",
-          "following_url": "https://api.github.com/users/Codertocat/following{/other_user}",
-          "gists_url": "https://api.github.com/users/Codertocat/gists{/gist_id}",
-          "starred_url": "https://api.github.com/users/Codertocat/starred{/owner}{/repo}",
-          "subscriptions_url": "https://api.github.com/users/Codertocat/subscriptions",
-          "organizations_url": "https://api.github.com/users/Codertocat/orgs",
-          "repos_url": "https://api.github.com/users/Codertocat/repos",
-          "events_url": "https://api.github.com/users/Codertocat/events{/privacy}",
-          "received_events_url": "https://api.github.com/users/Codertocat/received_events",
-          "type": "User",
-          "site_admin": false
-        },
-        "private": false,
-        "html_url": "https://github.com/Codertocat/Hello-World",
-        "description": null,
-        "fork": false,
-        "url": "https://api.github.com/repos/Codertocat/Hello-World",
-        "forks_url": "https://api.github.com/repos/Codertocat/Hello-World/forks",
-        "keys_url": "https://api.github.com/repos/Codertocat/Hello-World/keys{/key_id}",
-        "collaborators_url": "https://api.github.com/repos/Codertocat/Hello-World/collaborators{/collaborator}",
-        "teams_url": "https://api.github.com/repos/Codertocat/Hello-World/teams",
-        "hooks_url": "https://api.github.com/repos/Codertocat/Hello-World/hooks",
-        "issue_events_url": "https://api.github.com/repos/Codertocat/Hello-World/issues/events{/number}",
-        "events_url": "https://api.github.com/repos/Codertocat/Hello-World/events",
-        "assignees_url": "https://api.github.com/repos/Codertocat/Hello-World/assignees{/user}",
-        "branches_url": "https://api.github.com/repos/Codertocat/Hello-World/branches{/branch}",
-        "tags_url": "https://api.github.com/repos/Codertocat/Hello-World/tags",
-        "blobs_url": "https://api.github.com/repos/Codertocat/Hello-World/git/blobs{/sha}",
-        "git_tags_url": "https://api.github.com/repos/Codertocat/Hello-World/git/tags{/sha}",
-        "git_refs_url": "https://api.github.com/repos/Codertocat/Hello-World/git/refs{/sha}",
-        "trees_url": "https://api.github.com/repos/Codertocat/Hello-World/git/trees{/sha}",
-        "statuses_url": "https://api.github.com/repos/Codertocat/Hello-World/statuses/{sha}",
-        "languages_url": "https://api.github.com/repos/Codertocat/Hello-World/languages",
-        "stargazers_url": "https://api.github.com/repos/Codertocat/Hello-World/stargazers",
-        "contributors_url": "https://api.github.com/repos/Codertocat/Hello-World/contributors",
-        "subscribers_url": "https://api.github.com/repos/Codertocat/Hello-World/subscribers",
-        "subscription_url": "https://api.github.com/repos/Codertocat/Hello-World/subscription",
-        "commits_url": "https://api.github.com/repos/Codertocat/Hello-World/commits{/sha}",
-        "git_commits_url": "https://api.github.com/repos/Codertocat/Hello-World/git/commits{/sha}",
-        "comments_url": "https://api.github.com/repos/Codertocat/Hello-World/comments{/number}",
-        "issue_comment_url": "https://api.github.com/repos/Codertocat/Hello-World/issues/comments{/number}",
-        "contents_url": "https://api.github.com/repos/Codertocat/Hello-World/contents/{+path}",
-        "compare_url": "https://api.github.com/repos/Codertocat/Hello-World/compare/{base}...{head}",
-        "merges_url": "https://api.github.com/repos/Codertocat/Hello-World/merges",
-        "archive_url": "https://api.github.com/repos/Codertocat/Hello-World/{archive_format}{/ref}",
-        "downloads_url": "https://api.github.com/repos/Codertocat/Hello-World/downloads",
-        "issues_url": "https://api.github.com/repos/Codertocat/Hello-World/issues{/number}",
-        "pulls_url": "https://api.github.com/repos/Codertocat/Hello-World/pulls{/number}",
-        "milestones_url": "https://api.github.com/repos/Codertocat/Hello-World/milestones{/number}",
-        "notifications_url": "https://api.github.com/repos/Codertocat/Hello-World/notifications{?since,all,participating}",
-        "labels_url": "https://api.github.com/repos/Codertocat/Hello-World/labels{/name}",
-        "releases_url": "https://api.github.com/repos/Codertocat/Hello-World/releases{/id}",
-        "deployments_url": "https://api.github.com/repos/Codertocat/Hello-World/deployments",
-        "created_at": "2018-05-30T20:18:04Z",
-        "updated_at": "2018-05-30T20:18:50Z",
-        "pushed_at": "2018-05-30T20:18:48Z",
-        "git_url": "git://github.com/Codertocat/Hello-World.git",
-        "ssh_url": "git@github.com:Codertocat/Hello-World.git",
-        "clone_url": "https://github.com/Codertocat/Hello-World.git",
-        "svn_url": "https://github.com/Codertocat/Hello-World",
-        "homepage": null,
-        "size": 0,
-        "stargazers_count": 0,
-        "watchers_count": 0,
-        "language": null,
-        "has_issues": true,
-        "has_projects": true,
-        "has_downloads": true,
-        "has_wiki": true,
-        "has_pages": true,
-        "forks_count": 0,
-        "mirror_url": null,
-        "archived": false,
-        "open_issues_count": 1,
-        "license": null,
-        "forks": 0,
-        "open_issues": 1,
-        "watchers": 0,
-        "default_branch": "master"
-      }
-    },
-    "_links": {
-      "self": {
-        "href": "https://api.github.com/repos/Codertocat/Hello-World/pulls/1"
-      },
-      "html": {
-        "href": "https://github.com/Codertocat/Hello-World/pull/1"
-      },
-      "issue": {
-        "href": "https://api.github.com/repos/Codertocat/Hello-World/issues/1"
-      },
-      "comments": {
-        "href": "https://api.github.com/repos/Codertocat/Hello-World/issues/1/comments"
-      },
-      "review_comments": {
-        "href": "https://api.github.com/repos/Codertocat/Hello-World/pulls/1/comments"
-      },
-      "review_comment": {
-        "href": "https://api.github.com/repos/Codertocat/Hello-World/pulls/comments{/number}"
-      },
-      "commits": {
-        "href": "https://api.github.com/repos/Codertocat/Hello-World/pulls/1/commits"
-      },
-      "statuses": {
-        "href": "https://api.github.com/repos/Codertocat/Hello-World/statuses/34c5c7793cb3b279e22454cb6750c80560547b3a"
-      }
-    },
-    "author_association": "OWNER",
-    "merged": false,
-    "mergeable": true,
-    "rebaseable": true,
-    "mergeable_state": "clean",
-    "merged_by": null,
-    "comments": 0,
-    "review_comments": 1,
-    "maintainer_can_modify": false,
-    "commits": 1,
-    "additions": 1,
-    "deletions": 1,
-    "changed_files": 1
-  },
-  "repository": {
-    "id": 135493233,
-    "node_id": "MDEwOlJlcG9zaXRvcnkxMzU0OTMyMzM=",
-    "name": "Hello-World",
-    "full_name": "Codertocat/Hello-World",
-    "owner": {
-      "login": "Codertocat",
-      "id": 21031067,
-      "node_id": "MDQ6VXNlcjIxMDMxMDY3",
-      "avatar_url": "https://avatars1.githubusercontent.com/u/21031067?v=4",
-      "gravatar_id": "",
-      "url": "https://api.github.com/users/Codertocat",
-      "html_url": "https://github.com/Codertocat",
-      "followers_url": "https://api.github.com/users/Codertocat/followers",
-      "following_url": "https://api.github.com/users/Codertocat/following{/other_user}",
-      "gists_url": "https://api.github.com/users/Codertocat/gists{/gist_id}",
-      "starred_url": "https://api.github.com/users/Codertocat/starred{/owner}{/repo}",
-      "subscriptions_url": "https://api.github.com/users/Codertocat/subscriptions",
-      "organizations_url": "https://api.github.com/users/Codertocat/orgs",
-      "repos_url": "https://api.github.com/users/Codertocat/repos",
-      "events_url": "https://api.github.com/users/Codertocat/events{/privacy}",
-      "received_events_url": "https://api.github.com/users/Codertocat/received_events",
-      "type": "User",
-      "site_admin": false
-    },
-    "private": false,
-    "html_url": "https://github.com/Codertocat/Hello-World",
-    "description": null,
-    "fork": false,
-    "url": "https://api.github.com/repos/Codertocat/Hello-World",
-    "forks_url": "https://api.github.com/repos/Codertocat/Hello-World/forks",
-    "keys_url": "https://api.github.com/repos/Codertocat/Hello-World/keys{/key_id}",
-    "collaborators_url": "https://api.github.com/repos/Codertocat/Hello-World/collaborators{/collaborator}",
-    "teams_url": "https://api.github.com/repos/Codertocat/Hello-World/teams",
-    "hooks_url": "https://api.github.com/repos/Codertocat/Hello-World/hooks",
-    "issue_events_url": "https://api.github.com/repos/Codertocat/Hello-World/issues/events{/number}",
-    "events_url": "https://api.github.com/repos/Codertocat/Hello-World/events",
-    "assignees_url": "https://api.github.com/repos/Codertocat/Hello-World/assignees{/user}",
-    "branches_url": "https://api.github.com/repos/Codertocat/Hello-World/branches{/branch}",
-    "tags_url": "https://api.github.com/repos/Codertocat/Hello-World/tags",
-    "blobs_url": "https://api.github.com/repos/Codertocat/Hello-World/git/blobs{/sha}",
-    "git_tags_url": "https://api.github.com/repos/Codertocat/Hello-World/git/tags{/sha}",
-    "git_refs_url": "https://api.github.com/repos/Codertocat/Hello-World/git/refs{/sha}",
-    "trees_url": "https://api.github.com/repos/Codertocat/Hello-World/git/trees{/sha}",
-    "statuses_url": "https://api.github.com/repos/Codertocat/Hello-World/statuses/{sha}",
-    "languages_url": "https://api.github.com/repos/Codertocat/Hello-World/languages",
-    "stargazers_url": "https://api.github.com/repos/Codertocat/Hello-World/stargazers",
-    "contributors_url": "https://api.github.com/repos/Codertocat/Hello-World/contributors",
-    "subscribers_url": "https://api.github.com/repos/Codertocat/Hello-World/subscribers",
-    "subscription_url": "https://api.github.com/repos/Codertocat/Hello-World/subscription",
-    "commits_url": "https://api.github.com/repos/Codertocat/Hello-World/commits{/sha}",
-    "git_commits_url": "https://api.github.com/repos/Codertocat/Hello-World/git/commits{/sha}",
-    "comments_url": "https://api.github.com/repos/Codertocat/Hello-World/comments{/number}",
-    "issue_comment_url": "https://api.github.com/repos/Codertocat/Hello-World/issues/comments{/number}",
-    "contents_url": "https://api.github.com/repos/Codertocat/Hello-World/contents/{+path}",
-    "compare_url": "https://api.github.com/repos/Codertocat/Hello-World/compare/{base}...{head}",
-    "merges_url": "https://api.github.com/repos/Codertocat/Hello-World/merges",
-    "archive_url": "https://api.github.com/repos/Codertocat/Hello-World/{archive_format}{/ref}",
-    "downloads_url": "https://api.github.com/repos/Codertocat/Hello-World/downloads",
-    "issues_url": "https://api.github.com/repos/Codertocat/Hello-World/issues{/number}",
-    "pulls_url": "https://api.github.com/repos/Codertocat/Hello-World/pulls{/number}",
-    "milestones_url": "https://api.github.com/repos/Codertocat/Hello-World/milestones{/number}",
-    "notifications_url": "https://api.github.com/repos/Codertocat/Hello-World/notifications{?since,all,participating}",
-    "labels_url": "https://api.github.com/repos/Codertocat/Hello-World/labels{/name}",
-    "releases_url": "https://api.github.com/repos/Codertocat/Hello-World/releases{/id}",
-    "deployments_url": "https://api.github.com/repos/Codertocat/Hello-World/deployments",
-    "created_at": "2018-05-30T20:18:04Z",
-    "updated_at": "2018-05-30T20:18:50Z",
-    "pushed_at": "2018-05-30T20:18:48Z",
-    "git_url": "git://github.com/Codertocat/Hello-World.git",
-    "ssh_url": "git@github.com:Codertocat/Hello-World.git",
-    "clone_url": "https://github.com/Codertocat/Hello-World.git",
-    "svn_url": "https://github.com/Codertocat/Hello-World",
-    "homepage": null,
-    "size": 0,
-    "stargazers_count": 0,
-    "watchers_count": 0,
-    "language": null,
-    "has_issues": true,
-    "has_projects": true,
-    "has_downloads": true,
-    "has_wiki": true,
-    "has_pages": true,
-    "forks_count": 0,
-    "mirror_url": null,
-    "archived": false,
-    "open_issues_count": 1,
-    "license": null,
-    "forks": 0,
-    "open_issues": 1,
-    "watchers": 0,
-    "default_branch": "master"
-  },
-  "sender": {
-    "login": "Codertocat",
-    "id": 21031067,
-    "node_id": "MDQ6VXNlcjIxMDMxMDY3",
-    "avatar_url": "https://avatars1.githubusercontent.com/u/21031067?v=4",
-    "gravatar_id": "",
-    "url": "https://api.github.com/users/Codertocat",
-    "html_url": "https://github.com/Codertocat",
-    "followers_url": "https://api.github.com/users/Codertocat/followers",
-    "following_url": "https://api.github.com/users/Codertocat/following{/other_user}",
-    "gists_url": "https://api.github.com/users/Codertocat/gists{/gist_id}",
-    "starred_url": "https://api.github.com/users/Codertocat/starred{/owner}{/repo}",
-    "subscriptions_url": "https://api.github.com/users/Codertocat/subscriptions",
-    "organizations_url": "https://api.github.com/users/Codertocat/orgs",
-    "repos_url": "https://api.github.com/users/Codertocat/repos",
-    "events_url": "https://api.github.com/users/Codertocat/events{/privacy}",
-    "received_events_url": "https://api.github.com/users/Codertocat/received_events",
-    "type": "User",
-    "site_admin": false
-  }
-}
-"""
\ No newline at end of file
+def test_github_pull_request_payload_benchmark(github_pr_dict, github_pr_constructor, request):
+    """ The only realistic payload of the test suite doubles as a benchmark of the round trip.
+    """
+    pytest.importorskip('pytest_benchmark')
+    if not request.config.pluginmanager.hasplugin('benchmark'):
+        pytest.skip('pytest-benchmark is disabled')
+    benchmark = request.getfixturevalue('benchmark')
+    constructor, serializer = github_pr_constructor
+    benchmark.extra_info['budget_ms'] = 50
+    assert github_pr_dict == benchmark(lambda: serializer(constructor(github_pr_dict)))
+    if benchmark.stats is not None:
+        assert benchmark.stats.stats.mean * 1000 < benchmark.extra_info['budget_ms']
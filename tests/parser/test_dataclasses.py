@@ -2,22 +2,28 @@ import pytest
 import typeit
 
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import List, Sequence
 
 
-def test_dataclasses():
+@dataclass
+class InventoryItem:
+    name: str
+    unit_price: float
+    quantity_on_hand: int
 
-    @dataclass
-    class InventoryItem:
-        name: str
-        unit_price: float
-        quantity_on_hand: int
 
-    overrides = {
-        (InventoryItem, 'quantity_on_hand'): 'quantity'
-    }
+OVERRIDES = {
+    (InventoryItem, 'quantity_on_hand'): 'quantity'
+}
+
 
-    mk_inv, serialize_inv = typeit.TypeConstructor.override(overrides).apply_on(InventoryItem)
+@pytest.mark.parametrize('make_type_tools', [
+    typeit.TypeConstructor.override(OVERRIDES).apply_on,
+    lambda typ: typeit.TypeConstructor & OVERRIDES ^ typ,
+])
+def test_dataclasses(make_type_tools):
+    mk_inv, serialize_inv = make_type_tools(InventoryItem)
 
     serialized = {
         'name': 'test',
@@ -28,6 +34,7 @@ def test_dataclasses():
     assert isinstance(x, InventoryItem)
     assert serialize_inv(x) == serialized
 
+
 def test_with_default_values():
 
     @dataclass
@@ -62,3 +69,67 @@ def test_inherited_dataclasses():
     y = mk_y(data_valid)
     assert isinstance(y, Y)
     assert isinstance(y, X)
+
+
+def test_keyword_only_fields():
+    @dataclass(kw_only=True)
+    class X:
+        one: int
+        two: int = 2
+
+    @dataclass
+    class Y:
+        x: X
+        three: int
+
+    data = {'x': {'one': 1}, 'three': 3}
+
+    mk_y, serialize_y = typeit.TypeConstructor ^ Y
+    y = mk_y(data)
+    assert y == Y(x=X(one=1), three=3)
+    assert serialize_y(y) == {'x': {'one': 1, 'two': 2}, 'three': 3}
+
+
+def test_frozen_slotted_dataclasses():
+    @dataclass(frozen=True, slots=True)
+    class X:
+        one: int
+        two: str = 'two'
+
+    @dataclass(frozen=True, slots=True)
+    class Y:
+        one: int
+
+        def __post_init__(self):
+            object.__setattr__(self, 'one', self.one + 1)
+
+    mk_x, serialize_x = typeit.TypeConstructor ^ X
+    x = mk_x({'one': 1})
+    assert x == X(one=1)
+    assert x.__slots__ == ('one', 'two')
+    assert serialize_x(x) == {'one': 1, 'two': 'two'}
+
+    mk_y, serialize_y = typeit.TypeConstructor ^ Y
+    # __post_init__ is still called
+    assert mk_y({'one': 1}).one == 2
+
+
+def test_default_factories():
+    @dataclass
+    class X:
+        one: int
+        two: List[int] = field(default_factory=list)
+
+    @dataclass(frozen=True, slots=True)
+    class Y:
+        one: int
+        two: Sequence[int] = field(default_factory=tuple)
+
+    mk_x, serialize_x = typeit.TypeConstructor ^ X
+    x = mk_x({'one': 1})
+    assert x == X(one=1)
+    assert x.two is not mk_x({'one': 1}).two
+    assert serialize_x(x) == {'one': 1, 'two': []}
+
+    mk_y, serialize_y = typeit.TypeConstructor ^ Y
+    assert mk_y({'one': 1}) == Y(one=1)
@@ -35,3 +35,28 @@ def test_global_and_specific_overrides():
 
     mk_x(data)
 
+
+
+def test_global_name_override_is_computed_once_per_name():
+    calls = []
+
+    def modifier(name: str) -> str:
+        calls.append(name)
+        return inflection.camelize(name, uppercase_first_letter=False)
+
+    class Item(NamedTuple):
+        item_data: int
+
+    class X(NamedTuple):
+        item_data: int
+        inner_item: Item
+
+    mk_x, serialize_x = typeit.TypeConstructor & flags.GlobalNameOverride(modifier) ^ X
+    data = {
+        'itemData': 1,
+        'innerItem': {
+            'itemData': 2,
+        },
+    }
+    assert serialize_x(mk_x(data)) == data
+    assert sorted(calls) == ['inner_item', 'item_data']
@@ -22,43 +22,59 @@ def test_type_with_unclarified_list():
     assert f'{x.x[0]} {x.y[0]}' == 'Hello World'
 
 
-def test_primitives_strictness():
-    class X(NamedTuple):
-        a: int
-        b: str
-        c: float
-        d: bool
+class Primitives(NamedTuple):
+    a: int
+    b: str
+    c: float
+    d: bool
 
-    mk_x, serialize_x = typeit.TypeConstructor ^ X
-    mk_x_nonstrict, serialize_x_nonstrict = typeit.TypeConstructor & flags.NonStrictPrimitives ^ X
 
-    data = {
-        'a': '1',
-        'b': '2',
-        'c': 5,
-        'd': 1
-    }
+@pytest.fixture(scope='module')
+def x_primitives_strict():
+    return typeit.TypeConstructor ^ Primitives
+
+
+@pytest.fixture(scope='module')
+def x_primitives_nonstrict():
+    return typeit.TypeConstructor & flags.NonStrictPrimitives ^ Primitives
 
-    data_X = X(
-        a='1',
-        b='2',
-        c=5,
-        d=1,
-    )
+
+PRIMITIVES_DATA = {
+    'a': '1',
+    'b': '2',
+    'c': 5,
+    'd': 1
+}
+
+
+PRIMITIVES_DATA_X = Primitives(
+    a='1',
+    b='2',
+    c=5,
+    d=1,
+)
+
+
+def test_primitives_strictness(x_primitives_strict):
+    mk_x, serialize_x = x_primitives_strict
 
     with pytest.raises(typeit.Error):
-        mk_x(data)
+        mk_x(PRIMITIVES_DATA)
 
     with pytest.raises(typeit.Error):
-        serialize_x(data_X)
+        serialize_x(PRIMITIVES_DATA_X)
+
 
-    assert mk_x_nonstrict(data) == X(
+def test_primitives_nonstrictness(x_primitives_nonstrict):
+    mk_x_nonstrict, serialize_x_nonstrict = x_primitives_nonstrict
+
+    assert mk_x_nonstrict(PRIMITIVES_DATA) == Primitives(
         a=1,
         b='2',
         c=5.0,
         d=True,
     )
-    assert serialize_x_nonstrict(data_X) == dict(
+    assert serialize_x_nonstrict(PRIMITIVES_DATA_X) == dict(
         a=1,
         b='2',
         c=5.0,
@@ -66,6 +82,60 @@ def test_primitives_strictness():
     )
 
 
+@pytest.mark.parametrize('data', [
+    {'a': 2 ** 70, 'b': 'x', 'c': 1e300, 'd': False},
+    {'a': -1, 'b': '', 'c': -0.0, 'd': True},
+])
+def test_primitives_roundtrip(x_primitives_strict, x_primitives_nonstrict, data):
+    for mk_x, serialize_x in (x_primitives_strict, x_primitives_nonstrict):
+        x = mk_x(data)
+        assert [type(v) for v in x] == [int, str, float, bool]
+        assert serialize_x(x) == data
+
+
+def test_top_level_primitives():
+    mk_int, serialize_int = typeit.TypeConstructor ^ int
+    assert mk_int(1) == serialize_int(1) == 1
+    with pytest.raises(typeit.Error):
+        mk_int('1')
+    with pytest.raises(typeit.Error):
+        serialize_int(1.0)
+
+    mk_int, serialize_int = typeit.TypeConstructor & typeit.flags.NonStrictPrimitives ^ int
+    assert mk_int('1') == serialize_int('1') == 1
+
+    mk_str, serialize_str = typeit.TypeConstructor ^ str
+    assert mk_str('None') == 'None'
+    assert serialize_str('x') == 'x'
+    assert serialize_str('None') is None
+
+
+def test_serialize_primitive_fields():
+    class X(NamedTuple):
+        a: int
+        b: str
+        c: bool
+        d: float
+
+    mk_x, serialize_x = typeit.TypeConstructor ^ X
+    assert serialize_x(X(a=1, b='b', c=True, d=1.5)) == {'a': 1, 'b': 'b', 'c': True, 'd': 1.5}
+    assert serialize_x(X(a=1, b='None', c=False, d=1.5)) == {'a': 1, 'b': None, 'c': False, 'd': 1.5}
+    with pytest.raises(typeit.Error) as e:
+        serialize_x(X(a=True, b=1, c=True, d=1.5))
+    assert [x.path for x in e.value] == ['a', 'b']
+
+
+def test_serialize_primitive_items():
+    class X(NamedTuple):
+        a: Sequence[str]
+        b: Sequence[bool]
+
+    mk_x, serialize_x = typeit.TypeConstructor ^ X
+    assert serialize_x(X(a=['a', 'None'], b=[True, False])) == {'a': ['a', None], 'b': [True, False]}
+    with pytest.raises(typeit.Error) as e:
+        serialize_x(X(a=[1], b=[1]))
+    assert [x.path for x in e.value] == ['a.0', 'b.0']
+
 def test_serialize_list():
     class X(NamedTuple):
         x: None | Sequence[str]
@@ -298,23 +368,57 @@ def test_enum_unions_serialization():
     assert serializer(MyType(val=E1.Z)) == {'val': 'z'}
 
 
-def test_type_with_empty_enum_variant():
-    class Types(Enum):
-        A = ''
+def test_enum_unions_deserialization():
+    class E0(Enum):
+        A = 'a'
         B = 'b'
 
-    class X(NamedTuple):
-        x: int
-        y: Types
+    class E1(Enum):
+        A = 'a'
+        Z = 'z'
 
-    mk_x, serializer = typeit.TypeConstructor(X)
+    class E2(Enum):
+        Z = 'z'
 
-    for variant in Types:
-        x = mk_x({'x': 1, 'y': variant.value})
-        assert x.y is variant
+        @classmethod
+        def _missing_(cls, value):
+            return cls.Z if value == 'zz' else None
 
+    class MyType(NamedTuple):
+        val: E0 | E1
+        other: E1 | E2
+
+    mk_x, serializer = typeit.TypeConstructor(MyType)
+
+    # the first variant that defines a value takes precedence
+    assert mk_x({'val': 'a', 'other': 'z'}) == MyType(val=E0.A, other=E1.Z)
+    assert mk_x({'val': 'z', 'other': 'zz'}) == MyType(val=E1.Z, other=E2.Z)
     with pytest.raises(typeit.Error):
-        x = mk_x({'x': 1, 'y': None})
+        mk_x({'val': 'c', 'other': 'z'})
+
+
+class TypesWithEmptyVariant(Enum):
+    A = ''
+    B = 'b'
+
+
+class WithEmptyVariant(NamedTuple):
+    x: int
+    y: TypesWithEmptyVariant
+
+
+@pytest.mark.parametrize('variant', list(TypesWithEmptyVariant), ids=lambda v: v.name)
+def test_type_with_empty_enum_variant(variant):
+    # type tools are shared between applications, the type is constructed once for all variants
+    mk_x, serializer = typeit.TypeConstructor(WithEmptyVariant)
+    x = mk_x({'x': 1, 'y': variant.value})
+    assert x.y is variant
+
+
+def test_type_with_empty_enum_variant_rejects_none():
+    mk_x, serializer = typeit.TypeConstructor(WithEmptyVariant)
+    with pytest.raises(typeit.Error):
+        mk_x({'x': 1, 'y': None})
 
 
 def test_type_with_set():
@@ -347,6 +451,30 @@ def test_type_with_set():
     assert x.d == x.h
 
 
+def test_type_with_set_items_validation():
+    class X(NamedTuple):
+        a: FrozenSet[Any]
+        b: Set[int]
+
+    mk_x, serializer = typeit.TypeConstructor(X)
+    x = mk_x({'a': [1, 'x', None], 'b': [1, 1, 2]})
+    assert x.a == frozenset({1, 'x', None})
+    assert x.b == {1, 2}
+
+    with pytest.raises(typeit.Error):
+        mk_x({'a': [], 'b': [1, '2']})
+
+
+def test_sequence_items_errors():
+    class X(NamedTuple):
+        x: int
+
+    mk_xs, serialize_xs = typeit.TypeConstructor ^ Sequence[X]
+    assert mk_xs([{'x': 1}, {'x': 2}]) == [X(x=1), X(x=2)]
+    with pytest.raises(typeit.Error) as e:
+        mk_xs([{'x': 1}, {'x': '2'}, {}])
+    assert [x.path for x in e.value] == ['1.x', '2.x']
+
 def test_parse_sequence():
     class X(NamedTuple):
         x: int
@@ -465,3 +593,54 @@ def test_default_init_based_value():
     assert isinstance(x, X)
     assert x.x == 0 and x.y == 1
     assert serialize_x(x) == {'x': 0, 'y': 1}
+
+
+def test_type_hints_are_resolved_once(monkeypatch):
+    from typeit.parser import type_info
+
+    class X(NamedTuple):
+        a: int
+        # string annotations have to be evaluated by get_type_hints()
+        b: 'str'
+
+    calls = []
+    get_type_hints = type_info.get_type_hints
+
+    def counting_get_type_hints(typ):
+        calls.append(typ)
+        return get_type_hints(typ)
+
+    monkeypatch.setattr(type_info, 'get_type_hints', counting_get_type_hints)
+    mk_x, _ = typeit.TypeConstructor ^ X
+    mk_x_nonstrict, _ = typeit.TypeConstructor & flags.NonStrictPrimitives ^ X
+    assert mk_x({'a': 1, 'b': 'x'}) == mk_x_nonstrict({'a': '1', 'b': 'x'})
+    assert calls == [X]
+
+
+def test_fields_of_the_same_name_and_type_share_nodes():
+    class Owner(NamedTuple):
+        login: str
+        id: int
+
+    class Sender(NamedTuple):
+        login: str
+        id: int = 0
+
+    class Event(NamedTuple):
+        owner: Owner
+        sender: Sender
+
+    typer = typeit.TypeConstructor & {}
+    mk_event, serialize_event = typer ^ Event
+    owner, sender = typer.memo[Owner], typer.memo[Sender]
+    assert owner['login'] is sender['login']
+    # fields with defaults keep their own nodes
+    assert owner['id'] is not sender['id']
+    assert sender['id'].missing == 0
+
+    data = {'owner': {'login': 'a', 'id': 1}, 'sender': {'login': 'b'}}
+    event = mk_event(data)
+    assert event == Event(owner=Owner(login='a', id=1), sender=Sender(login='b', id=0))
+    with pytest.raises(typeit.Error) as e:
+        mk_event({'owner': {'login': 'a'}, 'sender': {'login': 1}})
+    assert [x.path for x in e.value] == ['owner.id', 'sender.login']
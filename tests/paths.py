@@ -3,4 +3,5 @@ from pathlib import Path
 TESTS_ROOT = Path(__file__).parent.absolute()
 VCR_FIXTURES_PATH = TESTS_ROOT / "vcr"
 
-PETSTORE_SPEC = TESTS_ROOT / 'petstore.json'
\ No newline at end of file
+PETSTORE_SPEC = TESTS_ROOT / 'petstore.json'
+GITHUB_PR_PAYLOAD = TESTS_ROOT / 'github_pr_payload.json'
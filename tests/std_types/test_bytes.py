@@ -25,3 +25,18 @@ def test_bytes():
     assert x_non_strict == x_strict
 
     assert non_strict_dict_x(x_strict) == strict_dict_x(x_non_strict) == {'x': b'abc'}
+
+
+@pytest.mark.parametrize('value, expected', [
+    (b'abc', b'abc'),
+    ('abc', b'abc'),
+    ('ж', 'ж'.encode('utf-8')),
+    ('None', None),
+    (2, b'\x00\x00'),
+])
+def test_non_strict_bytes_conversions(value, expected):
+    class X(NamedTuple):
+        x: bytes
+
+    mk_x, _ = TypeConstructor & flags.NonStrictPrimitives ^ X
+    assert mk_x({'x': value}).x == expected
@@ -71,6 +71,46 @@ def test_typed_mapping_values():
     assert serialize_x(x) == data
 
 
+def test_typed_mapping_values_are_parsed_once():
+    class X(NamedTuple):
+        map: Mapping[str, Sequence[int]]
+        pmap: PMap[str, int]
+
+    mk_x, serialize_x = TypeConstructor ^ X
+
+    data = {'map': {'a': [1]}, 'pmap': {'b': 1}}
+    calls = []
+    x_schema = TypeConstructor.memo[X]
+    value_node = x_schema['map'].typ.value_node
+    deserialize = value_node.deserialize
+    value_node.deserialize = lambda v: calls.append(v) or deserialize(v)
+    try:
+        x = mk_x(data)
+    finally:
+        del value_node.deserialize
+    assert calls == [[1]]
+    assert x.pmap == {'b': 1}
+    assert serialize_x(x) == data
+
+@pytest.mark.parametrize('data', [
+    {'x': {1: [1], 'a': None}, 'y': {'a': 1}},
+    {'x': {}, 'y': {'a': 'b'}},
+    {'x': {}, 'y': {1: 1}},
+])
+def test_mappings_of_any(data):
+    class X(NamedTuple):
+        x: Mapping[Any, Any]
+        y: Dict[str, Any]
+
+    mk_x, serialize_x = TypeConstructor ^ X
+    try:
+        x = mk_x(data)
+    except Error as e:
+        assert [x.path for x in e] == ['y']
+    else:
+        assert x.x == data['x'] and x.x is not data['x']
+        assert x.y == data['y'] and x.y is not data['y']
+
 def test_sequence():
     class X(NamedTuple):
         xs: collections.abc.Sequence
@@ -123,6 +163,11 @@ def test_literals():
             'x': 2,
             'y': 'a',
         },
+        {
+            'x': 1,
+            'y': ['a'],
+            'z': {},
+        },
     ):
         with pytest.raises(Error):
             mk_x(case)
@@ -155,12 +200,15 @@ def test_literals_included():
         'z': [1, 1],
     })
 
-    with pytest.raises(Error):
-        mk_x({
-            'x': None,
-            'y': None,
-            'z': [1, 2],
-        })
+    for z in ([1, 2], [1, [1]], [None]):
+        with pytest.raises(Error) as e:
+            mk_x({
+                'x': None,
+                'y': None,
+                'z': z,
+            })
+        # only the invalid item is reported
+        assert [x.path for x in e.value] == [f'z.{len(z) - 1}']
 
 
 def test_special_case_none_type():
@@ -174,3 +222,7 @@ def test_special_case_none_type():
     mk_x, serialize_x = TypeConstructor ^ Type[None]
     assert mk_x(None) is None
     assert serialize_x(None) is None
+    with pytest.raises(Error):
+        mk_x(1)
+    with pytest.raises(Error):
+        serialize_x(1)
@@ -35,3 +35,9 @@ def test_cli(stdin_data, reference_snippet):
             out_channel.seek(0)
             code_snippet = str(out_channel.read())
             assert reference_snippet in code_snippet
+
+
+def test_cli_version(capsys):
+    with pytest.raises(SystemExit):
+        main(['-V'])
+    assert capsys.readouterr().out.startswith('typeit ')
@@ -20,6 +20,14 @@ def test_combinators():
         .apply_on(int)
 
 
+def test_later_overrides_take_precedence():
+    x = tt.TypeConstructor & tt.flags.SumTypeDict('a')
+    x = x & (tt.flags.SumTypeDict & tt.flags.NonStrictPrimitives)
+    assert x.overrides[tt.flags.SumTypeDict] == 'type'
+    assert x.overrides[tt.flags.NonStrictPrimitives] is True
+    # overrides of the original constructor are kept
+    assert (tt.TypeConstructor & 1).overrides == tt.TypeConstructor.overrides
+
 @pytest.mark.parametrize('modifier, expected_dict', [
     (
         lambda x: x,
@@ -71,3 +79,69 @@ def test_global_names_override(modifier, expected_dict):
 
     constructed = constructor(serialized)
     assert constructed == data
+
+
+def test_type_tools_are_shared():
+    class X(NamedTuple):
+        x: int
+
+    assert (tt.TypeConstructor ^ X) is (tt.TypeConstructor ^ X)
+    assert (tt.TypeConstructor & tt.flags.NonStrictPrimitives ^ X) is (tt.TypeConstructor & tt.flags.NonStrictPrimitives ^ X)
+    assert (tt.TypeConstructor & tt.flags.NonStrictPrimitives ^ X) is not (tt.TypeConstructor ^ X)
+    # overrides passed as a dict are cached as well
+    overrides = {X.x: 'y'}
+    assert tt.TypeConstructor(X, overrides=overrides) is tt.TypeConstructor(X, overrides=dict(overrides))
+    assert tt.TypeConstructor(X, overrides=overrides)[1](X(x=1)) == {'y': 1}
+
+
+def test_shared_type_tools_keep_nested_schemas_in_memo():
+    class Inner(NamedTuple):
+        x: int
+
+    class Outer(NamedTuple):
+        inner: Inner
+
+    a = tt.TypeConstructor & tt.flags.NonStrictPrimitives
+    a ^ Outer
+    b = tt.TypeConstructor & tt.flags.NonStrictPrimitives
+    assert (b ^ Outer) is (a ^ Outer)
+    assert Outer in b.memo
+    assert Inner in b.memo
+    assert b.memo[Inner] is a.memo[Inner]
+
+
+def test_type_tools_cache_is_bounded(monkeypatch):
+    from typeit.combinator import constructor
+
+    monkeypatch.setattr(constructor, '_TYPE_TOOLS_CACHE_SIZE', 1)
+
+    class X(NamedTuple):
+        x: int
+
+    class Y(NamedTuple):
+        y: int
+
+    x_tools = tt.TypeConstructor ^ X
+    assert (tt.TypeConstructor ^ Y) is (tt.TypeConstructor ^ Y)
+    assert (tt.TypeConstructor ^ X) is not x_tools
+    assert len(constructor._TYPE_TOOLS_CACHE) == 1
+
+
+def test_type_tools_evicted_concurrently(monkeypatch):
+    from collections import OrderedDict
+    from typeit.combinator import constructor
+
+    class EvictedOnHit(OrderedDict):
+        """ Another thread evicts the entry right after it is found.
+        """
+        def move_to_end(self, key, last=True):
+            self.pop(key)
+            super().move_to_end(key, last)
+
+    class X(NamedTuple):
+        x: int
+
+    monkeypatch.setattr(constructor, '_TYPE_TOOLS_CACHE', EvictedOnHit())
+    mk_x, serialize_x = tt.TypeConstructor ^ X
+    assert (tt.TypeConstructor ^ X) == (mk_x, serialize_x)
+    assert mk_x({'x': 1}) == X(x=1)
@@ -0,0 +1,458 @@
+import pathlib
+from dataclasses import dataclass
+from enum import Enum
+from typing import NamedTuple, Sequence, Optional, Any, FrozenSet, Set, Dict, Literal, Union
+
+import pytest
+from pyrsistent.typing import PVector
+
+import typeit
+from typeit import flags
+from typeit.sums import SumType
+
+
+class Kind(Enum):
+    GOODS = 'goods'
+    SERVICE = 'service'
+
+
+class Item(NamedTuple):
+    name: str
+    price: float
+    tags: FrozenSet[str]
+    kind: Kind = Kind.GOODS
+
+
+class Order(NamedTuple):
+    id: int
+    items: Sequence[Item]
+    paid: bool
+    history: PVector[int]
+    note: Optional[str]
+    extra: Any
+    seen: Set[int] = set()
+    meta: Dict[str, int] = {}
+
+
+mk_order, serialize_order = typeit.TypeConstructor ^ Order
+mk_compiled_order, serialize_compiled_order = typeit.TypeConstructor & flags.Compiled ^ Order
+
+
+@pytest.mark.parametrize('data', [
+    {
+        'id': 1,
+        'items': [{'name': 'x', 'price': 1.0, 'tags': ['a', 'b'], 'kind': 'service'}],
+        'paid': True,
+        'history': [1, 2],
+        'note': None,
+        'extra': {'any': 'thing'},
+        'seen': [1],
+        'meta': {'a': 1},
+    },
+    {
+        'id': 1,
+        'items': [],
+        'paid': False,
+        'history': [],
+        'extra': None,
+        'unknown': 'field',
+    },
+    # tuples are not on the fast path
+    {'id': 1, 'items': ({'name': 'x', 'price': 1.0, 'tags': ()},), 'paid': True, 'history': [], 'extra': None},
+])
+def test_compiled_constructor(data):
+    order = mk_compiled_order(data)
+    assert order == mk_order(data)
+    assert serialize_compiled_order(order) == serialize_order(order)
+
+
+@pytest.mark.parametrize('data', [
+    {},
+    [],
+    {'id': '1', 'items': [{'name': 1, 'price': 1}], 'paid': 1, 'history': (1,), 'extra': None},
+    {'id': 1, 'items': [{'name': 'x', 'price': 1.0, 'tags': [], 'kind': 'x'}], 'paid': True, 'history': [], 'extra': None},
+])
+def test_compiled_constructor_errors(data):
+    with pytest.raises(typeit.Error) as expected:
+        mk_order(data)
+    with pytest.raises(typeit.Error) as compiled:
+        mk_compiled_order(data)
+    assert list(compiled.value) == list(expected.value)
+
+
+@pytest.mark.parametrize('order', [
+    Order(id='1', items=[], paid=True, history=[], note=None, extra=None),
+    Order(id=1, items=[Item(name=1, price=1.0, tags=frozenset())], paid=True, history=[], note=None, extra=None),
+    Order(id=1, items=None, paid='true', history=[], note=None, extra=None),
+])
+def test_compiled_serializer_errors(order):
+    with pytest.raises(typeit.Error) as expected:
+        serialize_order(order)
+    with pytest.raises(typeit.Error) as compiled:
+        serialize_compiled_order(order)
+    assert list(compiled.value) == list(expected.value)
+
+
+def test_compiled_serializer_strings():
+    order = Order(id=1, items=[], paid=True, history=[], note='None', extra='None')
+    assert serialize_compiled_order(order) == serialize_order(order)
+
+
+def test_compiled_primitives():
+    mk_int, _ = typeit.TypeConstructor & flags.Compiled ^ int
+    assert mk_int(1) == 1
+    with pytest.raises(typeit.Error):
+        mk_int('1')
+
+
+class Base(NamedTuple):
+    x: int
+
+
+class CustomNew(Base):
+    def __new__(cls, x):
+        return super().__new__(cls, x * 2)
+
+
+@pytest.mark.parametrize('overrides', [{}, flags.Compiled])
+def test_named_tuples_with_custom_new(overrides):
+    mk_base, _ = typeit.TypeConstructor & overrides ^ Base
+    mk_custom, _ = typeit.TypeConstructor & overrides ^ CustomNew
+    assert mk_base({'x': 1}) == Base(x=1)
+    assert mk_custom({'x': 1}) == CustomNew(x=1) == (2,)
+
+
+class Primitives(NamedTuple):
+    a: int
+    b: str
+    c: float
+    d: bool
+
+
+@pytest.mark.parametrize('data', [
+    {'a': 1, 'b': '', 'c': 1.5, 'd': False},
+    {'a': '1', 'b': 'x', 'c': 5, 'd': 'false'},
+    {'a': 1.5, 'b': '2', 'c': '5.0', 'd': 1},
+])
+def test_compiled_nonstrict_primitives(data):
+    mk_x, serialize_x = typeit.TypeConstructor & flags.NonStrictPrimitives ^ Primitives
+    mk_compiled_x, _ = typeit.TypeConstructor & flags.NonStrictPrimitives & flags.Compiled ^ Primitives
+    x = mk_compiled_x(data)
+    assert x == mk_x(data)
+    assert [type(v) for v in x] == [int, str, float, bool]
+
+
+class Response(SumType):
+    class Error:
+        message: str
+
+    class Success:
+        items: Sequence[Item]
+
+
+class Shape(SumType):
+    class Point: ...
+
+    class Circle:
+        r: float
+
+    class Square:
+        side: float
+
+    class Rectangle:
+        width: float
+        height: float
+
+
+@pytest.mark.parametrize('typ, overrides, data', [
+    (Response, {}, ['error', {'message': 'x'}]),
+    (Response, {}, ['success', {'items': [{'name': 'x', 'price': 1.0, 'tags': []}]}]),
+    (Response, {flags.SumTypeDict: 'type'}, {'type': 'error', 'message': 'x'}),
+    (Shape, {}, ['point', {}]),
+    (Shape, {}, ['rectangle', {'width': 1.0, 'height': 2.0}]),
+    (Shape, {flags.SumTypeDict: 'type'}, {'type': 'circle', 'r': 1.0}),
+])
+def test_compiled_sums(typ, overrides, data):
+    mk_x, serialize_x = typeit.TypeConstructor & overrides ^ typ
+    mk_compiled_x, _ = typeit.TypeConstructor & overrides & flags.Compiled ^ typ
+    x = mk_compiled_x(data)
+    assert x == mk_x(data)
+    assert serialize_x(x) == serialize_x(mk_x(data))
+
+
+@pytest.mark.parametrize('typ, data', [
+    (Response, ['unknown', {'message': 'x'}]),
+    (Response, ['error', {'message': 1}]),
+    (Response, ['error', {'message': 'x', 'extra': 1}]),
+    (Response, [['error'], {}]),
+    (Shape, ['triangle', {}]),
+    (Shape, [['circle'], {}]),
+    (Shape, ['circle', {'r': 'x'}]),
+])
+def test_compiled_sums_errors(typ, data):
+    mk_x, _ = typeit.TypeConstructor ^ typ
+    mk_compiled_x, _ = typeit.TypeConstructor & flags.Compiled ^ typ
+    with pytest.raises(typeit.Error) as expected:
+        mk_x(data)
+    with pytest.raises(typeit.Error) as compiled:
+        mk_compiled_x(data)
+    assert list(compiled.value) == list(expected.value)
+
+
+@pytest.fixture
+def compiled(monkeypatch):
+    """ The nodes that deserializers are compiled for
+    """
+    from typeit.schema import compiler
+
+    nodes = []
+    compile_deserializer = compiler.compile_deserializer
+
+    def counting_compile_deserializer(node):
+        nodes.append(node)
+        return compile_deserializer(node)
+
+    monkeypatch.setattr(compiler, 'compile_deserializer', counting_compile_deserializer)
+    return nodes
+
+
+def test_compilation_is_deferred_till_first_call(compiled):
+    class X(NamedTuple):
+        x: int
+
+    mk_x, _ = typeit.TypeConstructor & flags.Compiled ^ X
+    assert not compiled
+    assert mk_x({'x': 1}) == mk_x({'x': 1}) == X(x=1)
+    assert len(compiled) == 1
+
+
+class Literals(NamedTuple):
+    x: Literal[1, 'a']
+    y: Sequence[Literal[None, 'b']]
+
+
+@pytest.mark.parametrize('data', [
+    {'x': 1, 'y': [None, 'b']},
+    {'x': 'a', 'y': []},
+    {'x': 2, 'y': []},
+    {'x': [1], 'y': [{}]},
+])
+def test_compiled_literals(data):
+    mk_x, serialize_x = typeit.TypeConstructor ^ Literals
+    mk_compiled_x, serialize_compiled_x = typeit.TypeConstructor & flags.Compiled ^ Literals
+    try:
+        x = mk_x(data)
+    except typeit.Error as e:
+        with pytest.raises(typeit.Error) as compiled:
+            mk_compiled_x(data)
+        assert list(compiled.value) == list(e)
+    else:
+        assert mk_compiled_x(data) == x
+        assert serialize_compiled_x(x) == serialize_x(x) == data
+
+
+class Files(NamedTuple):
+    path: pathlib.PurePosixPath
+    content: bytes
+    names: Sequence[pathlib.PurePath]
+
+
+@pytest.mark.parametrize('data', [
+    {'path': '/a/b', 'content': b'x', 'names': ['a', 'b/c']},
+    {'path': '', 'content': b'', 'names': []},
+    {'path': 1, 'content': b'', 'names': []},
+    {'path': '/', 'content': 'x', 'names': [None]},
+])
+def test_compiled_bytes_and_paths(data):
+    mk_x, serialize_x = typeit.TypeConstructor ^ Files
+    mk_compiled_x, serialize_compiled_x = typeit.TypeConstructor & flags.Compiled ^ Files
+    try:
+        x = mk_x(data)
+    except typeit.Error as e:
+        with pytest.raises(typeit.Error) as compiled:
+            mk_compiled_x(data)
+        assert list(compiled.value) == list(e)
+    else:
+        assert mk_compiled_x(data) == x
+        assert serialize_compiled_x(x) == serialize_x(x)
+
+
+class Unions(NamedTuple):
+    item: Optional[Item]
+    value: Union[int, str]
+    source: Union[pathlib.PurePath, Dict[str, int]]
+
+
+@pytest.mark.parametrize('data', [
+    {'item': {'name': 'x', 'price': 1.0, 'tags': []}, 'value': 1, 'source': '/a'},
+    {'item': None, 'value': 'x', 'source': {'a': 1}},
+    {'value': True, 'source': {}},
+    {'item': [], 'value': 1, 'source': '/a'},
+    {'item': {'name': 1}, 'value': 1.0, 'source': {'a': 'b'}},
+])
+def test_compiled_unions(data):
+    mk_x, serialize_x = typeit.TypeConstructor ^ Unions
+    mk_compiled_x, _ = typeit.TypeConstructor & flags.Compiled ^ Unions
+    try:
+        x = mk_x(data)
+    except typeit.Error as e:
+        with pytest.raises(typeit.Error) as compiled:
+            mk_compiled_x(data)
+        # messages of unions refer to the schema objects of their variants
+        assert [x.path for x in compiled.value] == [x.path for x in e]
+    else:
+        assert mk_compiled_x(data) == x
+
+
+# the values that instances of Recorded were created with
+recorded = []
+
+
+@dataclass
+class Recorded:
+    x: int
+
+    def __post_init__(self):
+        recorded.append(self.x)
+        if self.x < 0:
+            raise TypeError('negative')
+
+
+class Recordings(NamedTuple):
+    items: Sequence[Recorded]
+    optional: Optional[Recorded]
+    y: int
+
+
+@pytest.mark.parametrize('overrides', [{}, flags.Compiled])
+@pytest.mark.parametrize('data, created, paths', [
+    ({'items': [{'x': 1}, {'x': -1}], 'optional': None, 'y': 1}, [1, -1], ['items.1']),
+    ({'items': [{'x': 1}, {'x': 'a'}], 'optional': {'x': 2}, 'y': 'a'}, [1, 2], ['items.1.x', 'y']),
+    ({'items': [{'x': 1}], 'optional': {'x': -2}, 'y': 1}, [1, -2], ['optional']),
+])
+def test_types_are_made_once_when_data_is_invalid(overrides, data, created, paths):
+    mk_x, _ = typeit.TypeConstructor & overrides ^ Recordings
+    recorded.clear()
+    with pytest.raises(typeit.Error) as e:
+        mk_x(data)
+    assert [x.path for x in e.value] == paths
+    assert recorded == created
+
+
+def test_flat_structures_are_compiled_without_the_flag(compiled):
+    class Flat(NamedTuple):
+        x: int
+        y: str
+
+    class Nested(NamedTuple):
+        flat: Flat
+
+    mk_flat, _ = typeit.TypeConstructor ^ Flat
+    mk_nested, _ = typeit.TypeConstructor ^ Nested
+    assert mk_flat({'x': 1, 'y': 'a'}) == Flat(x=1, y='a')
+    assert mk_nested({'flat': {'x': 1, 'y': 'a'}}) == Nested(flat=Flat(x=1, y='a'))
+    assert len(compiled) == 1
+    with pytest.raises(typeit.Error) as e:
+        mk_flat({'x': '1'})
+    assert [x.path for x in e.value] == ['x', 'y']
+
+
+def test_flat_dataclasses_are_made_once(compiled):
+    mk_recorded, _ = typeit.TypeConstructor ^ Recorded
+    recorded.clear()
+    with pytest.raises(typeit.Error) as e:
+        mk_recorded({'x': -1})
+    assert len(compiled) == 1
+    assert [x.path for x in e.value] == ['']
+    assert recorded == [-1]
+
+
+def test_hot_type_tools_are_compiled_without_the_flag(monkeypatch, compiled):
+    from typeit.schema import compiler
+
+    class Nested(NamedTuple):
+        items: Sequence[Item]
+
+    monkeypatch.setattr(compiler, 'HOT_CALLS', 3)
+    mk_nested, serialize_nested = typeit.TypeConstructor ^ Nested
+    data = {'items': [{'name': 'x', 'price': 1.0, 'tags': ['a'], 'kind': 'service'}]}
+    for _ in range(2):
+        assert serialize_nested(mk_nested(data)) == data
+    assert not compiled
+    for _ in range(2):
+        assert serialize_nested(mk_nested(data)) == data
+    assert len(compiled) == 1
+    with pytest.raises(typeit.Error) as e:
+        mk_nested({'items': [{'name': 'x'}]})
+    assert [x.path for x in e.value] == ['items.0.price', 'items.0.tags']
+
+
+def test_hot_type_tools_make_values_once(monkeypatch):
+    from typeit.schema import compiler
+
+    monkeypatch.setattr(compiler, 'HOT_CALLS', 2)
+    mk_x, _ = typeit.TypeConstructor ^ Recordings
+    data = {'items': [{'x': 1}, {'x': -1}], 'optional': {'x': 2}, 'y': 'a'}
+    outcomes = []
+    # the first call is interpreted, the rest are compiled
+    for _ in range(3):
+        recorded.clear()
+        with pytest.raises(typeit.Error) as e:
+            mk_x(data)
+        outcomes.append(([x.path for x in e.value], list(recorded)))
+    assert outcomes == [(['items.1', 'y'], [1, -1, 2])] * 3
+
+
+class Wide(NamedTuple):
+    a: int
+    b: str
+    c: float
+    d: bool
+    e: Sequence[int]
+    f: Sequence[str]
+
+
+@pytest.mark.parametrize('data', [
+    {'a': 1, 'b': 'b', 'c': 1.5, 'd': True, 'e': [1], 'f': ['f']},
+    {'a': 1, 'b': 'b', 'c': 1.5, 'd': True, 'e': [1], 'f': ['f'], 'g': 1},
+    {'a': 1, 'b': 'b', 'c': 1.5, 'd': True, 'f': ['f']},
+    {'a': 1, 'b': 'b', 'c': 1.5, 'd': True, 'e': ['1'], 'f': ['f']},
+    {'b': 1},
+])
+def test_compiled_wide_structures(data):
+    mk_x, serialize_x = typeit.TypeConstructor ^ Wide
+    mk_compiled_x, serialize_compiled_x = typeit.TypeConstructor & flags.Compiled ^ Wide
+    try:
+        expected = mk_x(data)
+    except typeit.Error as e:
+        with pytest.raises(typeit.Error) as compiled_e:
+            mk_compiled_x(data)
+        assert list(compiled_e.value) == list(e)
+    else:
+        assert mk_compiled_x(data) == expected
+        assert serialize_compiled_x(expected) == serialize_x(expected)
+
+
+def test_fields_of_the_same_type_share_compiled_functions():
+    from typeit.schema import compiler
+
+    class Repeated(NamedTuple):
+        x: Item
+        y: Sequence[Item]
+        z: Item = Item(name='default', price=0.0, tags=frozenset())
+
+    typer = typeit.TypeConstructor & flags.Compiled
+    mk_x, serialize_x = typer ^ Repeated
+    deserializer = compiler._DeserializerCompiler()
+    deserializer.build(typer.memo[Repeated])
+    # Repeated, Item of the first field, the items of the sequence, and the defaulted Item of the last field:
+    # compiled functions report errors with the name of the node, and only clones of the same name share them
+    assert len([x for x in deserializer.definitions if x.startswith('def structure_')]) == 4
+
+    item = {'name': 'item', 'price': 1.0, 'tags': ['a'], 'kind': 'service'}
+    x = mk_x({'x': item, 'y': [item]})
+    assert x.z == Item(name='default', price=0.0, tags=frozenset())
+    assert serialize_x(x)['x'] == item
+    with pytest.raises(typeit.Error) as e:
+        mk_x({'x': item, 'y': [item, {}]})
+    assert {x.path for x in e.value} == {'y.1.name', 'y.1.price', 'y.1.tags'}
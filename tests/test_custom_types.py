@@ -1,7 +1,11 @@
 import json
-from typing import NamedTuple, Optional
+from dataclasses import dataclass
+from typing import NamedTuple, Optional, Any, Sequence
+
+import pytest
 
 from typeit.custom_types import JsonString
+import typeit
 from typeit import TypeConstructor
 
 
@@ -11,6 +15,8 @@ def test_json_string_direct_application():
     assert isinstance(js, JsonString)
     assert js.data == 5
     assert serialize_js(js) == "5"
+    # parameterized aliases are equal, hence they share the constructed type tools
+    assert (TypeConstructor ^ JsonString[int]) == (mk_js, serialize_js)
 
 
 def test_json_string_structures():
@@ -90,3 +96,54 @@ def test_nested_optional_json_string():
     assert opt2.opt.data is not None
     assert opt2.opt.data.data == 1
     assert serialize_opt(opt2) == data_2
+
+
+def test_nested_json_string_errors():
+    mk_js, _ = TypeConstructor ^ JsonString[JsonString[int]]
+    with pytest.raises(typeit.Error) as e:
+        mk_js(json.dumps(json.dumps('1')))
+    assert [x.path for x in e.value] == ['data.data']
+    with pytest.raises(typeit.Error) as e:
+        mk_js(json.dumps('{'))
+    assert [x.path for x in e.value] == ['data']
+
+
+def test_json_string_data_is_deserialized_once():
+    created = []
+
+    @dataclass
+    class Item:
+        x: int
+
+        def __post_init__(self):
+            created.append(self.x)
+
+    mk_js, _ = TypeConstructor ^ JsonString[Sequence[Item]]
+    with pytest.raises(typeit.Error) as e:
+        mk_js(json.dumps([{'x': 1}, {'x': 'a'}]))
+    assert [x.path for x in e.value] == ['data.1.x']
+    assert created == [1]
+
+
+def test_nested_json_string_schemas_are_shared():
+    typer = TypeConstructor & {}
+    typer ^ JsonString[JsonString[Optional[int]]]
+    outer = typer.memo[JsonString[JsonString[Optional[int]]]]
+    inner = typer.memo[JsonString[Optional[int]]]
+    assert outer['data'].typ is inner.typ
+    assert outer['data'].children == inner.children
+
+
+@pytest.mark.parametrize('data', [
+    '{"a": [1, 2.5, "x", null, true]}',
+    str(2 ** 70),
+    '[-1e400, 0.1]',
+    'NaN',
+    '"\\ud800"',
+])
+def test_json_string_is_parsed_as_standard_json(data):
+    mk_js, serialize_js = TypeConstructor ^ JsonString[Any]
+    js = mk_js(data)
+    expected = json.loads(data)
+    assert repr(js.data) == repr(expected)
+    assert serialize_js(js) == json.dumps(expected)
@@ -1,4 +1,5 @@
-from typing import NamedTuple
+from dataclasses import dataclass
+from typing import NamedTuple, Optional, Sequence
 
 import typeit
 
@@ -7,10 +8,99 @@ class X(NamedTuple):
     x: int
 
 
+mk_x, serialize_x = typeit.TypeConstructor ^ X
+
+
+# the values that instances of Recorded were created with
+recorded = []
+
+
+@dataclass
+class Recorded:
+    x: int
+
+    def __post_init__(self):
+        recorded.append(self.x)
+        if self.x < 0:
+            raise TypeError('negative')
+
+
 def test_error():
-    mk_x, _ = typeit.TypeConstructor ^ X
     try:
         mk_x({'x': '1'})
     except Exception as e:
         assert isinstance(e, typeit.Error)
         assert str(e).startswith('\n(1) x: ')
+
+
+def test_all_invalid_fields_are_reported():
+    class Y(NamedTuple):
+        x: int
+        y: str
+        z: int
+
+    mk_y, _ = typeit.TypeConstructor ^ Y
+    try:
+        mk_y({'x': '1', 'z': '3'})
+    except typeit.Error as e:
+        assert [x.path for x in e] == ['x', 'y', 'z']
+    else:
+        assert False, 'typeit.Error was expected'
+
+
+def test_all_missing_fields_are_reported():
+    class Y(NamedTuple):
+        x: int
+        y: Optional[str]
+        z: int
+
+    mk_y, _ = typeit.TypeConstructor ^ Y
+    try:
+        mk_y({})
+    except typeit.Error as e:
+        assert [x.path for x in e] == ['x', 'z']
+    else:
+        assert False, 'typeit.Error was expected'
+
+
+def test_all_invalid_fields_are_reported_on_serialization():
+    class Y(NamedTuple):
+        x: int
+        y: str
+        z: int
+
+    _, serialize_y = typeit.TypeConstructor ^ Y
+    try:
+        serialize_y(Y(x='1', y='2', z='3'))
+    except typeit.Error as e:
+        assert [x.path for x in e] == ['x', 'z']
+    else:
+        assert False, 'typeit.Error was expected'
+
+
+def test_valid_fields_are_deserialized_once_along_with_invalid_ones():
+    class Y(NamedTuple):
+        items: Sequence[Recorded]
+        y: int
+
+    mk_y, _ = typeit.TypeConstructor ^ Y
+    recorded.clear()
+    try:
+        mk_y({'items': [{'x': 1}, {'x': 2}], 'y': 'a'})
+    except typeit.Error as e:
+        assert [x.path for x in e] == ['y']
+    else:
+        assert False, 'typeit.Error was expected'
+    assert recorded == [1, 2]
+
+
+def test_valid_items_are_deserialized_once_along_with_invalid_ones():
+    mk_items, _ = typeit.TypeConstructor ^ Sequence[Recorded]
+    recorded.clear()
+    try:
+        mk_items([{'x': 1}, {'x': 'a'}, {'x': 2}, {'x': 'b'}])
+    except typeit.Error as e:
+        assert [x.path for x in e] == ['1.x', '3.x']
+    else:
+        assert False, 'typeit.Error was expected'
+    assert recorded == [1, 2]
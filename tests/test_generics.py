@@ -5,6 +5,7 @@ import json
 from pvectorc import pvector
 
 import typeit
+from typeit.parser import get_generic_attribute_hints
 
 
 A = TypeVar('A')
@@ -36,10 +37,10 @@ class DatabaseResponse(NamedTuple):
     items: Sequence[PersistedItem] = pvector()
 
 
-def test_generic():
+mk_response, serialize_response = typeit.TypeConstructor ^ DatabaseResponse
 
-    mk_response, serialize_response = typeit.TypeConstructor ^ DatabaseResponse
 
+def test_generic():
     serialized = {
         "name": "response",
         "items": [
@@ -58,3 +59,39 @@ def test_generic():
     x = serialize_response(mk_response(serialized))
     json.dumps(x)
     assert x == serialized
+
+
+def test_generic_with_overridden_names():
+    mk_response, serialize_response = (
+        typeit.TypeConstructor
+        & typeit.flags.GlobalNameOverride(lambda x: x.upper())
+        & {(PersistedItem, 'pk'): 'id'}
+        ^ DatabaseResponse
+    )
+    serialized = {
+        'NAME': 'response',
+        'ITEMS': [
+            {
+                'id': 1,
+                'ENTRY': {
+                    'ITEM_ID': 1,
+                    'INNER': {'ENTRY_ID': 2, 'ENTRY_NAME': 'entry_name'},
+                },
+            }
+        ],
+    }
+    response = mk_response(serialized)
+    assert response.items[0].pk == 1
+    assert serialize_response(response) == serialized
+
+
+def test_generic_attribute_hints():
+    assert get_generic_attribute_hints(Entity[Item]) == (('pk', int), ('entry', Item))
+    assert get_generic_attribute_hints(PersistedItem) == (('pk', int), ('entry', Item))
+    # parameterized types are resolved once
+    assert get_generic_attribute_hints(Entity[Item]) is get_generic_attribute_hints(Entity[Item])
+
+
+def test_default_items_are_shared():
+    response = mk_response({'name': 'response'})
+    assert response.items is DatabaseResponse._field_defaults['items']
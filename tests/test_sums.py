@@ -1,7 +1,9 @@
+from functools import cached_property
 from typing import Dict, NamedTuple
 
 import pytest
 import pickle
+import sys
 import typeit
 from typeit.sums import SumType
 
@@ -149,6 +151,8 @@ def test_sums_as_dict():
     }
     x = mk_x(data)
     assert serialize_x(x) == data
+    # tags derived from the names of variants are interned, like names of structure fields
+    assert X.VariantA.__variant_meta__.value is sys.intern('varianta')
 
 
 def test_sumtype_attr_strictness():
@@ -171,3 +175,87 @@ def test_sumtype_attr_strictness():
         x = mk_x({'payload': {'_version_': 'v1', 'a': 1, 'b': 1}})
 
     x = mk_x({'payload': {'_version_': 'v2', 'a': 1, 'b': 1}})
+
+
+def test_deserialize_unknown_tags():
+    class X(SumType):
+        class A:
+            a: int
+
+    mk_x, serialize_x = typeit.TypeConstructor ^ X
+
+    assert mk_x(('a', {'a': 1})) == X.A(a=1)
+    for data in [('b', {'a': 1}), (['a'], {'a': 1}), ('a', {'b': 1})]:
+        with pytest.raises(typeit.Error):
+            mk_x(data)
+
+
+def test_serialize_foreign_variant():
+    class X(SumType):
+        class A:
+            a: int
+
+    class Y(SumType):
+        class A:
+            a: int
+
+    mk_x, serialize_x = typeit.TypeConstructor ^ X
+
+    assert serialize_x(X.A(a=1)) == ('a', {'a': 1})
+
+    with pytest.raises(typeit.Error):
+        serialize_x(Y.A(a=1))
+
+
+def test_sum_variants_keep_their_data_in_slots():
+    class X(SumType):
+        class A:
+            a: int
+
+        class B: ...
+
+        @cached_property
+        def double(self) -> int:
+            return self.a * 2
+
+    x = X.A(a=1)
+    assert x.a == 1
+    assert x.double == 2
+    x.b = 2
+    assert x.b == 2
+    assert '__variant_data__' not in vars(x)
+
+    with pytest.raises(AttributeError):
+        X.B.a
+
+    # sums may opt out of instance dicts
+    class Y(SumType):
+        __slots__ = ()
+
+        class A:
+            a: int
+
+    y = Y.A(a=1)
+    assert y.a == 1
+    with pytest.raises(AttributeError):
+        y.b = 2
+
+
+@pytest.mark.parametrize('overrides', [{}, {typeit.flags.Compiled: True}])
+def test_deserialized_variants_hold_their_data(overrides):
+    class X(SumType):
+        class A:
+            a: int
+
+        class B: ...
+
+    mk_x, serialize_x = typeit.TypeConstructor & overrides ^ X
+
+    a = mk_x(('a', {'a': 1}))
+    assert type(a) is X
+    assert a == X.A(a=1) and a.a == 1
+    assert a.__variant_data__ == X.A(a=1).__variant_data__
+    b = mk_x(('b', {}))
+    assert b == X.B and b.__variant_data__ is None
+    with pytest.raises(AttributeError):
+        b.a
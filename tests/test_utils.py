@@ -89,4 +89,16 @@ def test_new_init():
     assert res.a == a
     assert res.b == b
 
-    res1 = utils.new(X, res)
\ No newline at end of file
+    res1 = utils.new(X, res)
+
+def test_dynamic_name_overriders_do_not_pile_up():
+    from typeit import flags
+
+    class X(NamedTuple):
+        field_name: int
+
+    for _ in range(utils._interning_overrider.cache_info().maxsize + 10):
+        mk_x, _ = typeit.TypeConstructor & flags.GlobalNameOverride(lambda s: s.upper()) ^ X
+        assert mk_x({'FIELD_NAME': 1}) == X(field_name=1)
+    info = utils._interning_overrider.cache_info()
+    assert info.currsize <= info.maxsize
@@ -1,5 +1,6 @@
 import json
-from typing import NamedTuple, Union, Any, Dict, Optional, Mapping, Literal
+from dataclasses import dataclass
+from typing import NamedTuple, Union, Any, Dict, Optional, Mapping, Literal, Sequence
 
 import pytest
 from inflection import camelize
@@ -59,6 +60,21 @@ def test_type_with_primitive_union():
     assert data == serialize_x(x)
 
 
+
+def test_primitive_unions_pass_values_through():
+    class X(NamedTuple):
+        x: Union[None, str, int]
+
+    mk_x, _ = TypeConstructor ^ X
+    assert TypeConstructor.memo[X]['x'].typ.passthrough_types == {str, int}
+    for value in ('', 'test', 0, 2 ** 70):
+        assert mk_x({'x': value}).x is value
+    # values of the other primitive types are still rejected
+    for value in (True, 1.0):
+        with pytest.raises(typeit.Error):
+            mk_x({'x': value})
+
+
 def test_union_primitive_match():
     class X(NamedTuple):
         # here, str() accepts everything that could be passed to int(),
@@ -120,6 +136,143 @@ def test_union_errors():
         serialize_x(X(x="5"))
 
 
+def test_union_of_primitive_sequences():
+    class X(NamedTuple):
+        x: Sequence[str] | Sequence[float] | Sequence[int]
+
+    mk_x, serialize_x = typeit.TypeConstructor ^ X
+
+    for data in ({'x': ['1']}, {'x': [1.0]}, {'x': [1]}, {'x': []}):
+        assert serialize_x(mk_x(data)) == data
+
+    with pytest.raises(Error) as e:
+        mk_x({'x': [1, '1']})
+    # all variants are reported, including the ones not matching the first item
+    for invalid in e.value:
+        assert invalid.reason.count('SequenceSchema') == 3
+
+
+def test_union_of_different_shapes():
+    class Item(NamedTuple):
+        x: int
+
+    class X(NamedTuple):
+        x: int | Sequence[int] | Item | str
+
+    mk_x, serialize_x = typeit.TypeConstructor ^ X
+
+    for data in ({'x': 1}, {'x': [1]}, {'x': {'x': 1}}, {'x': '1'}):
+        assert serialize_x(mk_x(data)) == data
+
+    with pytest.raises(Error) as e:
+        mk_x({'x': {'y': 1}})
+    # all variants are reported, including the ones of a different shape
+    for invalid in e.value:
+        assert 'Int(strict)' in invalid.reason
+        assert 'SequenceSchema' in invalid.reason
+
+
+def test_union_of_structures_with_different_keys():
+    class Circle(NamedTuple):
+        radius: float
+
+    class Rectangle(NamedTuple):
+        width: float
+        height: float
+        label: Optional[str] = None
+
+    class X(NamedTuple):
+        shape: Circle | Rectangle
+
+    mk_x, serialize_x = typeit.TypeConstructor ^ X
+
+    assert mk_x({'shape': {'radius': 1.0}}) == X(shape=Circle(radius=1.0))
+    assert mk_x({'shape': {'width': 1.0, 'height': 2.0}}) == X(shape=Rectangle(width=1.0, height=2.0))
+
+    with pytest.raises(Error) as e:
+        mk_x({'shape': {'width': 1.0}})
+    # variants skipped due to the missing keys are still reported
+    for invalid in e.value:
+        assert 'Circle' in invalid.reason
+        assert 'Rectangle' in invalid.reason
+
+
+def test_optional_structures():
+    class Item(NamedTuple):
+        x: int
+
+    class X(NamedTuple):
+        x: Optional[Item]
+
+    mk_x, serialize_x = typeit.TypeConstructor ^ X
+
+    for data in ({'x': {'x': 1}}, {'x': None}):
+        assert serialize_x(mk_x(data)) == data
+
+    for data in ({'x': {'y': 1}}, {'x': {'x': '1'}}):
+        with pytest.raises(Error) as e:
+            mk_x(data)
+        # the sole variant that was tried is reported
+        for invalid in e.value:
+            assert invalid.reason.startswith('No suitable variant among tried')
+            assert 'Item' in invalid.reason
+
+
+def test_union_variants_are_tried_once():
+    created = []
+
+    @dataclass
+    class Item:
+        x: int
+
+        def __post_init__(self):
+            created.append(self.x)
+
+    class Pair(NamedTuple):
+        item: Item
+        y: int
+
+    class Other(NamedTuple):
+        z: int
+
+    class X(NamedTuple):
+        x: Optional[Pair]
+        xs: Pair | Other
+
+    mk_x, serialize_x = typeit.TypeConstructor ^ X
+
+    # items of both fields are valid, the pairs are not
+    pair = {'item': {'x': 1}, 'y': 'y'}
+    with pytest.raises(Error) as e:
+        mk_x({'x': pair, 'xs': pair})
+    assert sorted(x.path for x in e.value) == ['x.y', 'xs.y', 'xs.z']
+    assert created == [1, 1]
+
+
+def test_union_of_structures_with_extra_keys(monkeypatch):
+    from typeit.schema import types
+
+    monkeypatch.setattr(types, 'MAX_UNION_KEY_SETS', 1)
+
+    class A(NamedTuple):
+        a: int
+
+    class AB(NamedTuple):
+        a: int
+        b: int
+
+    class X(NamedTuple):
+        x: AB | A
+
+    mk_x, serialize_x = typeit.TypeConstructor ^ X
+
+    for _ in range(2):
+        assert mk_x({'x': {'a': 1, 'c': 1}}) == X(x=A(a=1))
+        assert mk_x({'x': {'a': 1, 'b': 2, 'c': 1}}) == X(x=AB(a=1, b=2))
+        with pytest.raises(Error):
+            mk_x({'x': {'b': 2}})
+
+
 def test_union_literals():
     Filter = Literal['All'] | Literal['all'] | None
 
@@ -3,15 +3,26 @@
 import argparse
 import sys
 
-from pkg_resources import get_distribution
-
 from . import gen
 
 
+class _VersionAction(argparse.Action):
+    """ Looks the installed version up only when it's requested,
+    as the distribution metadata takes longer to load than the rest of the CLI.
+    """
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS,
+                 help="show program's version number and exit"):
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        from importlib.metadata import version
+        sys.stdout.write(f'typeit {version("typeit")}\n')
+        parser.exit()
+
+
 def main(args=None, stdout=sys.stdout):
     parser = argparse.ArgumentParser(description='Type it!')
-    parser.add_argument('-V', '--version', action='version',
-                        version='typeit {}'.format(get_distribution("typeit").version))
+    parser.add_argument('-V', '--version', action=_VersionAction)
     subparsers = parser.add_subparsers(title='sub-commands',
                                        description='valid sub-commands',
                                        help='additional help',
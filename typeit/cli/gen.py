@@ -1,8 +1,15 @@
 import argparse
-import json
 import sys
 from pathlib import Path
-from typing import Dict
+from typing import Any, Callable, Dict
+
+json_loads: Callable[[str], Any]
+try:
+    # orjson parses large payloads several times faster than the standard library,
+    # and produces the same plain dicts and lists
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 from .. import codegen as cg
 
@@ -34,7 +41,7 @@ def main(args: argparse.Namespace, out_channel=sys.stdout) -> None:
 def _read_data(fd) -> Dict:
     buf = fd.read()  # because stdin does not support seek
     try:
-        struct = json.loads(buf)
+        struct = json_loads(buf)
     except ValueError:
         try:
             import yaml
@@ -45,5 +52,7 @@ def _read_data(fd) -> Dict:
                 "dependency, or use the `third_party` extra tag with typeit:\n\n"
                 "$ pip install typeit[third_party]"
             )
-        struct = yaml.full_load(buf)
+        # the same loader as yaml.full_load() uses, backed by libyaml when PyYAML is built with it
+        loader = getattr(yaml, 'CFullLoader', yaml.FullLoader)
+        struct = yaml.load(buf, Loader=loader)
     return struct
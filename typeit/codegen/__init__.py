@@ -304,7 +304,9 @@ def parse_mapping(mapping: Mapping[str, Any],
     for source_name, field_struct in mapping.items():
         field_name = normalize_name(source_name)
         field_type, overrides_ = clarify_struct_type(field_name, field_struct, parent_prefix)
-        overrides = overrides.update(overrides_)
+        if overrides_:
+            # most fields have no overrides, merging an empty map would only copy the accumulated one
+            overrides = overrides.update(overrides_)
         definitions.append(FieldDefinition(source_name=source_name,
                                            field_name=field_name,
                                            field_type=field_type))
@@ -332,7 +334,8 @@ def _clarify_field_type_dict(field_name: str,
         type_name = field_name
     sub_struct, overrides = parse_mapping(field_struct, type_name)
     field_type, overrides_ = construct_type(type_name, sub_struct)
-    overrides = overrides.update(overrides_)
+    if overrides_:
+        overrides = overrides.update(overrides_)
     return field_type, overrides
 
 
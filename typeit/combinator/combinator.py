@@ -1,4 +1,3 @@
-from itertools import chain
 from typing import NamedTuple, Any
 
 from pyrsistent import pvector
@@ -13,4 +12,6 @@ class Combinator(NamedTuple):
             cmb = other.combined
         else:
             cmb = [other]
-        return self._replace(combined=pvector(chain(self.combined, cmb)))
+        # extending shares the structure of the persistent vector,
+        # rather than copying all the previously combined items on every step
+        return self._replace(combined=self.combined.extend(cmb))
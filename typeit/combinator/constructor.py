@@ -1,5 +1,6 @@
+from collections import OrderedDict
 from functools import partial
-from typing import Tuple, Callable, Dict, Any, Union, Type, Mapping, Sequence, ForwardRef
+from typing import Tuple, Callable, Dict, Any, Union, Type, Mapping, Sequence, ForwardRef, Optional
 
 from pyrsistent import pmap
 # this is different from pyrsistent.typing.PMap unfortunately
@@ -16,23 +17,98 @@ from ..schema import nodes
 TypeTools = Tuple[ Callable[[Union[int, str, float, Sequence[Any], Mapping[str, Any]]], T]
                  , Callable[[T], Union[Sequence[Any], Mapping[str, Any]] ]]
 
+TypeNode = Union[nodes.SchemaNode, nodes.TupleSchema, nodes.SequenceSchema]
+
+
+# Type tools are fully determined by a type and the overrides applied to it,
+# hence they can be shared between all type constructors (including the ones
+# produced by combining overrides) instead of being rebuilt on every application.
+# The cache is bounded, so that applications on short-lived types
+# (e.g. the ones defined in function bodies) don't pile up.
+# Along with the tools, every entry keeps the memo that the schema of the type was built with,
+# which holds the schemas of the types it refers to as well.
+_TYPE_TOOLS_CACHE: 'OrderedDict[Tuple[Type[Any], OverridesT], Tuple[TypeNode, TypeTools, PMap[Type[Any], TypeNode]]]' = OrderedDict()
+_TYPE_TOOLS_CACHE_SIZE = 512
+
 
 class _TypeConstructor:
+    __slots__ = ('overrides', 'memo')
+
     def __init__(self, overrides: Union[Dict, OverridesT] = NO_OVERRIDES):
         self.overrides = pmap(overrides)
-        self.memo: PMap[Type[Any], Union[nodes.SchemaNode, nodes.TupleSchema, nodes.SequenceSchema]] = pmap()
+        self.memo: PMap[Type[Any], TypeNode] = pmap()
 
     def __call__(self,
         typ: Type[T],
-        overrides: OverridesT = NO_OVERRIDES
+        overrides: Union[Dict, OverridesT] = NO_OVERRIDES
     ) -> TypeTools:
         """ Generate a constructor and a serializer for the given type
 
         :param overrides: a mapping of type_field => serialized_field_name.
         """
+        if isinstance(overrides, dict):
+            # the same overrides as a hashable mapping, so that such applications are cached as well
+            overrides = pmap(overrides)
+        key = (typ, overrides)
+        try:
+            main_type_node, tools, memo = _TYPE_TOOLS_CACHE[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # either the type or some of the overrides are unhashable,
+            # such applications are never cached
+            return self._make_type_tools(typ, overrides)[1]
+        else:
+            try:
+                _TYPE_TOOLS_CACHE.move_to_end(key)
+            except KeyError:
+                # evicted by another thread in the meantime, the tools are valid still
+                pass
+            # the tokenizer and other introspection tools expect the schemas of the type
+            # and of the types it refers to to be in the memo; repeated applications of the same
+            # constructor find them there already, and skip rebuilding the persistent map,
+            # which costs more than the lookup itself
+            if self._memoizes(overrides) and self.memo.get(typ) is not main_type_node:
+                self._remember(typ, main_type_node, memo)
+            return tools
+
+        main_type_node, tools, memo = self._make_type_tools(typ, overrides)
+        _TYPE_TOOLS_CACHE[key] = (main_type_node, tools, memo)
+        while len(_TYPE_TOOLS_CACHE) > _TYPE_TOOLS_CACHE_SIZE:
+            try:
+                _TYPE_TOOLS_CACHE.popitem(last=False)
+            except KeyError:
+                # emptied by other threads evicting entries at the same time
+                break
+        return tools
+
+    def _memoizes(self, overrides: OverridesT) -> bool:
+        """ Schemas in the memo are built with the overrides of this constructor,
+        applications with other overrides build and keep their schemas separately.
+        """
+        return overrides is self.overrides or overrides == self.overrides
+
+    def _remember(self, typ: Type[Any], main_type_node: TypeNode, memo: PMap[Type[Any], TypeNode]) -> None:
+        """ Adds the schemas that another constructor built for the type to the memo,
+        keeping the ones this constructor has built already, except for the type itself.
+        """
+        evolver = self.memo.evolver()
+        for memo_typ, node in memo.items():
+            if memo_typ not in self.memo:
+                evolver[memo_typ] = node
+        evolver[typ] = main_type_node
+        self.memo = evolver.persistent()
+
+    def _make_type_tools(self,
+        typ: Type[T],
+        overrides: OverridesT
+    ) -> Tuple[TypeNode, TypeTools, PMap[Type[Any], TypeNode]]:
         forward_refs = {}  # has to be mutable in the current implementation
+        memoizes = self._memoizes(overrides)
         try:
-            main_type_node, memo, forward_refs = decide_node_type(typ, overrides, self.memo, forward_refs)
+            main_type_node, memo, forward_refs = decide_node_type(
+                typ, overrides, self.memo if memoizes else pmap(), forward_refs
+            )
         except TypeError as e:
             raise TypeError(
                 f'Cannot create a type constructor for {typ}: {e}'
@@ -50,36 +126,56 @@ class _TypeConstructor:
                         resolved_node, memo, forward_refs = decide_node_type(ref.__forward_value__, overrides, memo, forward_refs)
                         forward_refs[ref] = resolved_node
 
-        self.memo = memo
-        return (
-            partial(schema.errors.errors_aware_constructor, main_type_node.deserialize),
-            partial(schema.errors.errors_aware_constructor, main_type_node.serialize)
+        if memoizes:
+            self.memo = memo
+        from ..schema import compiler
+
+        if flags.Compiled in overrides or _is_flat_structure(main_type_node):
+            deserialize = compiler.compile_lazily(compiler.compile_deserializer, main_type_node)
+            serialize = compiler.compile_lazily(compiler.compile_serializer, main_type_node)
+        else:
+            # the rest of the types are compiled once they turn out to be used a lot
+            deserialize = compiler.compile_when_hot(
+                compiler.compile_deserializer, main_type_node, main_type_node.deserialize
+            )
+            serialize = compiler.compile_when_hot(
+                compiler.compile_serializer, main_type_node, main_type_node.serialize
+            )
+        tools = (
+            _passing_through(
+                partial(schema.errors.errors_aware_constructor, deserialize),
+                _deserialized_passthrough_type(main_type_node),
+            ),
+            _passing_through(
+                partial(schema.errors.errors_aware_constructor, serialize),
+                _serialized_passthrough_type(main_type_node),
+            ),
         )
+        return main_type_node, tools, memo
 
     def __and__(self, override: OverrideT) -> '_TypeConstructor':
         combined = Combinator() & override
 
-        overrides = pmap()
+        # all overrides are applied to a single evolver, instead of
+        # merging the existing ones into a new map for every combined override
+        overrides = self.overrides.evolver()
         for override in combined.combined:
             if isinstance(override, flags._Flag):
-                upd = self.overrides.set(override, override.default_setting)
+                overrides[override] = override.default_setting
 
             elif isinstance(override, flags._ModifiedFlag):
                 # override is a flag with extra settings
-                upd = self.overrides.set(override[0], override[1])
+                overrides[override[0]] = override[1]
 
             elif isinstance(override, schema.meta.TypeExtension):
-                upd = self.overrides.set(override.typ, override)
+                overrides[override.typ] = override
 
             elif isinstance(override, (dict, RealPMapType)):
                 # override is a field mapping
-                upd = self.overrides.update(override)
-            else:
-                continue
+                for key, value in override.items():
+                    overrides[key] = value
 
-            overrides = overrides.update(upd)
-
-        return self.__class__(overrides=overrides)
+        return self.__class__(overrides=overrides.persistent())
 
     def __xor__(self, typ: Type[T]) -> TypeTools:
         return self.__call__(typ, self.overrides)
@@ -89,5 +185,63 @@ class _TypeConstructor:
     apply_on = __xor__
 
 
+NoneType = type(None)
+
+
+def _is_plain_node(node: TypeNode) -> bool:
+    return type(node) is nodes.SchemaNode and node.preparer is None and node.validator is None
+
+
+def _deserialized_passthrough_type(node: TypeNode) -> Optional[Type[Any]]:
+    """ Returns the type of values that the whole type deserializes into themselves,
+    like None of ``Type[None]``, or ints of ``int``.
+    """
+    if _is_plain_node(node) and type(node.typ) is schema.types.Literal and node.typ.variants == {None}:
+        return NoneType
+    value_type = schema.primitives.passthrough_item_type(node)
+    # typing.Any is left to the schema, as it doesn't pass colander.null through
+    return None if value_type is object else value_type
+
+
+def _serialized_passthrough_type(node: TypeNode) -> Optional[Type[Any]]:
+    """ Returns the type of values that the whole type serializes into themselves.
+    """
+    if not _is_plain_node(node):
+        return None
+    if type(node.typ) is schema.types.Literal and node.typ.variants == {None}:
+        return NoneType
+    value_type = schema.primitives.serialized_passthrough_type(node.typ)
+    # the string 'None' is serialized into None
+    return None if value_type is str else value_type
+
+
+def _is_flat_structure(node: TypeNode) -> bool:
+    """ Whether the type is a structure of primitive fields only. Such structures
+    are compiled regardless of the flag: their compiled functions are straight-line
+    field checks, which report errors and make the structure once, as the schema does.
+    """
+    if type(node) is not nodes.SchemaNode or type(node.typ) is not schema.types.Structure or node.fields is None:
+        return False
+    return all(
+        schema.primitives.passthrough_item_type(child) not in (None, object)
+        for child in node.children
+    )
+
+
+def _passing_through(tool: Callable[[Any], Any], value_type: Optional[Type[Any]]) -> Callable[[Any], Any]:
+    """ Returns values of the given type as they are, without calling the type tool.
+    The schema of such types is decided at construction time, and there's nothing
+    to do for the values on every call.
+    """
+    if value_type is None:
+        return tool
+
+    def tool_passing_through(value):
+        if type(value) is value_type:
+            return value
+        return tool(value)
+    return tool_passing_through
+
+
 type_constructor = _TypeConstructor() & JsonStringSchema[JsonString]
 TypeConstructor = type_constructor
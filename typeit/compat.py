@@ -1,11 +1,7 @@
 import sys
+from typing import Literal, Tuple
 
-PY_VERSION = sys.version_info[:2]
-
-if PY_VERSION < (3, 8):
-    from typing_extensions import Literal
-else:
-    from typing import Literal
+PY_VERSION: Tuple[int, int] = sys.version_info[:2]
 
 
 __all__ = ('PY_VERSION', 'Literal')
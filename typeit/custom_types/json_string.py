@@ -1,13 +1,40 @@
 import json
+import re
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from typing import Any, Callable, Generic, Optional, TypeVar, cast, get_origin
 
 from ..schema import Invalid
 from ..schema.types import Structure
 
+_orjson_loads: Optional[Callable[..., Any]]
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:
+    _orjson_loads = None
+
 
 T = TypeVar('T')
 
+_std_json = json
+
+
+# orjson parses integers wider than 64 bits into floats, whereas the standard library
+# keeps them as they are; such numbers can only appear where there's a run of 19+ digits
+_LONG_DIGITS = re.compile('[0-9]{19}')
+
+
+def _loads(s):
+    """ orjson parses JSON several times faster than the standard library. It differs
+    on a few inputs though (NaN, lone surrogates, integers wider than 64 bits),
+    hence such inputs are parsed by the standard library, as before.
+    """
+    if _orjson_loads is not None and type(s) is str and not _LONG_DIGITS.search(s):
+        try:
+            return _orjson_loads(s)
+        except ValueError:
+            pass
+    return json.loads(s)
+
 
 @dataclass(frozen=True)
 class JsonString(Generic[T]):
@@ -18,17 +45,35 @@ class JsonStringSchema(Structure):
     def __init__(self, *args, json=json, **kwargs):
         super().__init__(*args, **kwargs)
         self.json = json
+        # output of orjson.dumps() differs from json.dumps() in formatting,
+        # therefore only parsing is delegated to it
+        self.loads = _loads if json is _std_json and _orjson_loads is not None else json.loads
+        # parameterized aliases like JsonString[int] make instances of the bare class
+        self.make_json_string = cast(Callable[[Any], JsonString], get_origin(self.typ) or self.typ)
 
     def deserialize(self, node, cstruct: str) -> JsonString:
         """ Converts input string value ``cstruct`` to ``PortMapping``
         """
         try:
-            data = self.json.loads(cstruct)
+            data = self.loads(cstruct)
         except Exception as e:
             raise Invalid(node,
                 f'Value is not a JSON string',
                 cstruct
             ) from e
+        fields = node.fields
+        if fields is not None and len(fields) == 1:
+            # the parsed value is handed straight to the data field, rather than
+            # wrapped into a mapping for the structure to walk, so that nested
+            # JSON strings are decoded by a chain of direct calls
+            try:
+                value = fields[0].deserialize(data)
+            except Invalid as e:
+                # reported the way the structure reports errors of its fields
+                error = Invalid(node)
+                error.add(e, 0)
+                raise error
+            return self.make_json_string(value)
         return super().deserialize(node, {'data': data})
 
     def serialize(self, node, appstruct: JsonString) -> str:
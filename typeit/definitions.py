@@ -1,4 +1,4 @@
-from typing import NamedTuple, Union, Any, Type
+from typing import NamedTuple, Union, Any, Type, Tuple
 
 from pyrsistent import pmap
 from pyrsistent.typing import PMap
@@ -10,6 +10,8 @@ OverridesT = PMap[
     Union[
         # field name override
         property,
+        # field name override of dataclasses and init-based types
+        Tuple[Type, str],
         # flag override
         _Flag,
         # new type extension
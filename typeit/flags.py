@@ -8,6 +8,8 @@ class _ModifiedFlag(NamedTuple):
 
 
 class _Flag:
+    __slots__ = ('name', 'default_setting')
+
     def __init__(self, name: str, default_setting: Any):
         """ Default settings should not be modified once they are
         set by object instantiation. If you need to override them,
@@ -44,6 +46,11 @@ SumTypeDict = _Flag('SumTypeDict', 'type')
 GlobalNameOverride = _Flag('GlobalNameOverride', Identity)
 
 
+# Compile specialised Python functions out of the type schemas
+# instead of traversing the schemas on every call
+Compiled = _Flag('Compiled', True)
+
+
 # fo b/w compatibility
 NON_STRICT_PRIMITIVES = NonStrictPrimitives
 SUM_TYPE_DICT = SumTypeDict
\ No newline at end of file
@@ -1,12 +1,16 @@
 from types import UnionType
 from typing import (
     Type, Tuple, Optional, Any, Union, List, Set,
-    Dict, Sequence, MutableSet, TypeVar, FrozenSet, Mapping, ForwardRef, NewType,
+    Dict, Sequence, MutableSet, TypeVar, FrozenSet, Mapping, ForwardRef, NewType, Callable, cast,
 )
 
 import inspect
 import collections
+import sys
+from functools import lru_cache
+from operator import itemgetter, attrgetter
 
+import colander as col
 import typing_inspect as insp
 from pyrsistent import pmap, pvector
 from pyrsistent import typing as pyt
@@ -25,6 +29,8 @@ from .. import interface as iface
 
 T = TypeVar('T')
 MemoType = TypeVar('MemoType')
+# attribute names along with their annotations, which may be forward references
+AttributeHints = Sequence[Tuple[str, Union[Type, ForwardRef]]]
 
 OverrideT = (   flags._Flag     # flag override
             |   TypeExtension   # new type extension
@@ -104,7 +110,39 @@ def _maybe_node_for_primitive(
     except KeyError:
         return None, memo, forward_refs
 
-    return schema.nodes.SchemaNode(schema_type), memo, forward_refs
+    return _primitive_node(schema_type), memo, forward_refs
+
+
+# Nodes of primitive and subclass-based types carry no state of their own,
+# and the parser clones them before customising them as fields, optional variants etc.,
+# therefore they are shared between all types instead of being created per occurrence.
+@lru_cache(maxsize=None)  # bounded by the primitives registry
+def _primitive_node(schema_type: schema.meta.SchemaType) -> schema.nodes.SchemaNode:
+    return schema.nodes.SchemaNode(schema_type)
+
+
+@lru_cache(maxsize=1024)
+def _subclass_based_node(
+    schema_type_type: Type[schema.meta.SchemaType],
+    typ: Type[iface.IType],
+) -> schema.nodes.SchemaNode:
+    return schema.nodes.SchemaNode(schema_type_type(typ, allow_empty=True))
+
+
+@lru_cache(maxsize=4096)
+def _field_node(node: schema.nodes.SchemaNode, name: str) -> schema.nodes.SchemaNode:
+    """ Returns the node of a field without a default value.
+
+    Fields of the same name and type, like the ones of structures repeated
+    in different parts of a payload, share their node instead of cloning it every time.
+    """
+    # clonning because we mutate it next, and the node
+    # might be from the cache already
+    node = clone_schema_node(node)
+    # interned names let dict lookups of payload keys succeed on the identity check
+    # whenever the keys are interned as well, e.g. by a JSON parser
+    node.name = sys.intern(name)
+    return node
 
 
 def is_type_var_placeholder(t) -> bool:
@@ -143,7 +181,7 @@ def _maybe_node_for_subclass_based(
             break
         else:
             if is_target:
-                rv = schema.nodes.SchemaNode(schema_typ(typ, allow_empty=True))
+                rv = _subclass_based_node(schema_typ, typ)
                 break
 
     return rv, memo, forward_refs
@@ -223,8 +261,8 @@ def _maybe_node_for_sum_type(
 
     sum_node = None
     if matched:
-        # represents a 2-tuple of (type_from_signature, associated_schema_node)
-        variant_nodes: List[Tuple[Type, schema.nodes.SchemaNode]] = []
+        # represents a 2-tuple of (variant, associated_schema_node)
+        variant_nodes: List[Tuple[sums.SumType, schema.nodes.SchemaNode]] = []
         for variant in typ:
             node, memo, forward_refs = decide_node_type(
                 variant.__variant_meta__.constructor,
@@ -236,7 +274,8 @@ def _maybe_node_for_sum_type(
             variant_nodes.append((variant, node))
         sum_node = schema.nodes.SchemaNode(
             schema.types.Sum(
-                typ=typ,
+                # checked by issubclass() above
+                typ=cast(Type[sums.SumType], typ),
                 variant_nodes=variant_nodes,
                 as_dict_key=overrides.get(flags.SumTypeDict),
             )
@@ -305,9 +344,21 @@ def _maybe_node_for_sequence(
             seq_type = schema.nodes.SequenceSchema
         node, memo, forward_refs = decide_node_type(inner, overrides, memo, forward_refs)
         rv = seq_type(node)
+        _set_item_shortcuts(rv, node)
     return rv, memo, forward_refs
 
 
+def _set_item_shortcuts(sequence_node: schema.nodes.SequenceSchema, item_node) -> None:
+    """ Lets the sequence node skip deserialization of items that would be returned as they are
+    """
+    sequence_node.item_type = schema.primitives.passthrough_item_type(item_node)
+    if (type(item_node) is schema.nodes.SchemaNode
+            and type(item_node.typ) is schema.types.Literal
+            and item_node.preparer is None
+            and item_node.validator is None):
+        sequence_node.item_literals = item_node.typ.variants
+
+
 def get_origin_39(typ: Type[Any]) -> Type[Any]:
     """python3.9 aware origin"""
     origin = insp.get_origin(typ)
@@ -352,6 +403,7 @@ def _maybe_node_for_set(
                 origin in (frozenset, FrozenSet)
             )
         )
+        _set_item_shortcuts(rv, node)
     return rv, memo, forward_refs
 
 
@@ -469,6 +521,62 @@ def _maybe_node_for_dict(
     return rv, memo, forward_refs
 
 
+def get_generic_attribute_hints(typ: type) -> AttributeHints:
+    """ Returns the attribute names and types of the given generic type, with its type variables
+    substituted by the types it is parameterized with.
+    """
+    try:
+        return _generic_attribute_hints(typ)
+    except TypeError:
+        # unhashable type arguments
+        return _resolve_generic_attribute_hints(typ)
+
+
+@lru_cache(maxsize=1024)
+def _generic_attribute_hints(typ: type) -> AttributeHints:
+    """ Generic bases are walked and type variables are substituted once per parameterized type,
+    whereas the same type is parsed by every type constructor it is a part of.
+    """
+    return _resolve_generic_attribute_hints(typ)
+
+
+def _resolve_generic_attribute_hints(typ: type) -> AttributeHints:
+    hints_source = get_origin_39(typ) or typ
+    # now we need to map generic type variables to the bound class types,
+    # e.g. we map Entity[T,U,V, ...] to actual types of Entity[int, float, str, ...]
+    generic_repr = insp.get_generic_bases(hints_source)
+    generic_vars_ordered = [insp.get_args(x)[0] for x in generic_repr]
+    bound_type_args = insp.get_args(typ)
+    type_var_to_type = pmap(zip(generic_vars_ordered, bound_type_args))
+    if type_var_to_type:
+        # Resolve type hints.
+        # We have to match all generic type parameter placeholders with the actual types passed as implementations
+        # of the interface. However, we need to keep in mind that not all attributes of the generic type have generic
+        # placeholders. Hence, in places where we cannot find the generic placeholder name, we just assume that there's
+        # no placeholder, and therefore ``type_var`` is automatically a concrete type
+        return tuple(
+            (   field_name
+            ,   type_var_to_type.get(type_var_or_concrete_type) or type_var_or_concrete_type
+            )
+            for field_name, type_var_or_concrete_type in (
+                (x, raw_type)
+                for x, _resolved_type, raw_type in get_type_attribute_info(hints_source)
+            )
+        )
+    else:
+        # Here we have a situation with a concrete type after the generic type is clarified
+        # into a concrete type, i.e. when we have Entity[T] and later:
+        # class MyType(Entity[MyOtherType]): ...
+        #
+        # In this situation type_var_to_type will be empty, and we need to infer attributes
+        # of MyType via concrete types
+        clarified = iter(generic_vars_ordered)
+        return tuple(
+            (attr_name, next(clarified) if is_type_var_placeholder(raw_type) else raw_type)
+            for attr_name, _resolved_type, raw_type in get_type_attribute_info(hints_source)
+        )
+
+
 def _maybe_node_for_user_type(
     typ: Type[iface.IType],
     overrides: OverridesT,
@@ -481,6 +589,8 @@ def _maybe_node_for_user_type(
     """
     global_name_overrider = get_global_name_overrider(overrides)
     is_generic = insp.is_generic_type(typ)
+    attribute_hints: AttributeHints
+    get_override_identifier: Callable[[str], Union[property, Tuple[Type, str]]]
 
     if is_generic:
         # get the base class that was turned into Generic[T, ...]
@@ -490,77 +600,16 @@ def _maybe_node_for_user_type(
         # below: "elif is_named_tuple(typ)"
         hints_source = get_origin_39(typ) or typ
 
-        # now we need to map generic type variables to the bound class types,
-        # e.g. we map Entity[T,U,V, ...] to actual types of Entity[int, float, str, ...]
-        generic_repr = insp.get_generic_bases(hints_source)
-        generic_vars_ordered = [insp.get_args(x)[0] for x in generic_repr]
-        bound_type_args = insp.get_args(typ)
-        type_var_to_type = pmap(zip(generic_vars_ordered, bound_type_args))
-        if type_var_to_type:
-            # Resolve type hints.
-            # We have to match all generic type parameter placeholders with the actual types passed as implementations
-            # of the interface. However, we need to keep in mind that not all attributes of the generic type have generic
-            # placeholders. Hence, in places where we cannot find the generic placeholder name, we just assume that there's
-            # no placeholder, and therefore ``type_var`` is automatically a concrete type
-            attribute_hints = [
-                (   field_name
-                ,   type_var_to_type.get(type_var_or_concrete_type) or type_var_or_concrete_type
-                )
-                for field_name, type_var_or_concrete_type in (
-                    (x, raw_type)
-                    for x, _resolved_type, raw_type in get_type_attribute_info(hints_source)
-                )
-            ]
-        else:
-            # Here we have a situation with a concrete type after the generic type is clarified
-            # into a concrete type, i.e. when we have Entity[T] and later:
-            # class MyType(Entity[MyOtherType]): ...
-            #
-            # In this situation type_var_to_type will be empty, and we need to infer attributes
-            # of MyType via concrete types
-            clarified = iter(generic_vars_ordered)
-            attribute_hints = [
-                (attr_name, next(clarified) if is_type_var_placeholder(raw_type) else raw_type)
-                for attr_name, _resolved_type, raw_type in get_type_attribute_info(hints_source)
-            ]
+        attribute_hints = get_generic_attribute_hints(typ)
+        get_override_identifier = lambda x: (typ, x)
         # Generic types should not have default values
         defaults_source = lambda: ()
-        # Overrides should be the same as class-based ones, as Generics are not NamedTuple classes,
-        # TODO: consider reducing duplication between this and the logic from init-based types (see below)
-        deserialize_overrides = pmap({
-            # try to get a specific override for a field, if it doesn't exist, use the global modifier
-            overrides.get(
-                (typ, python_field_name),
-                global_name_overrider(python_field_name)
-            ): python_field_name
-            for python_field_name, _ in attribute_hints
-        })
-        # apply a local optimisation that discards `deserialize_overrides`
-        # if there is no difference with the original field_names;
-        # it is done to occupy less memory with unnecessary mappings
-        if deserialize_overrides == pmap({x: x for x, _ in attribute_hints}) and global_name_overrider is flags.Identity:
-            deserialize_overrides = pmap({})
 
     elif is_named_tuple(typ):
         hints_source = typ
         attribute_hints = [(x, raw_type) for x, y, raw_type in get_type_attribute_info(hints_source)]
         get_override_identifier = lambda x: getattr(typ, x)
         defaults_source = typ.__new__
-
-        deserialize_overrides = pmap({
-            # try to get a specific override for a field, if it doesn't exist, use the global modifier
-            overrides.get(
-                getattr(typ, python_field_name),
-                global_name_overrider(python_field_name)
-            ): python_field_name
-            for python_field_name in typ._fields
-        })
-
-        # apply a local optimisation that discards `deserialize_overrides`
-        # if there is no difference with the original field_names;
-        # it is done to occupy less memory with unnecessary mappings
-        if deserialize_overrides == pmap({x: x for x in typ._fields}) and global_name_overrider is flags.Identity:
-            deserialize_overrides = pmap({})
     else:
         # use init-based types
         hints_source = typ.__init__
@@ -568,19 +617,26 @@ def _maybe_node_for_user_type(
         get_override_identifier = lambda x: (typ, x)
         defaults_source = typ.__init__
 
+    # field names are overridden once per field here,
+    # both the structure and the field nodes use the same names
+    serialized_field_names = [
+        # try to get a specific override for a field, if it doesn't exist, use the global modifier
+        overrides.get(get_override_identifier(field_name), global_name_overrider(field_name))
+        for field_name, _ in attribute_hints
+    ]
+    # apply a local optimisation that discards `deserialize_overrides`
+    # if there is no difference with the original field_names;
+    # it is done to occupy less memory with unnecessary mappings
+    if global_name_overrider is flags.Identity and all(
+        serialized_field_name == field_name
+        for serialized_field_name, (field_name, _) in zip(serialized_field_names, attribute_hints)
+    ):
+        deserialize_overrides: pyt.PMap[str, str] = pmap({})
+    else:
         deserialize_overrides = pmap({
-            # try to get a specific override for a field, if it doesn't exist, use the global modifier
-            overrides.get(
-                (typ, python_field_name),
-                global_name_overrider(python_field_name)
-            ): python_field_name
-            for python_field_name, _ in attribute_hints
+            serialized_field_name: field_name
+            for serialized_field_name, (field_name, _) in zip(serialized_field_names, attribute_hints)
         })
-        # apply a local optimisation that discards `deserialize_overrides`
-        # if there is no difference with the original field_names;
-        # it is done to occupy less memory with unnecessary mappings
-        if deserialize_overrides == pmap({x: x for x, _ in attribute_hints}) and global_name_overrider is flags.Identity:
-            deserialize_overrides = pmap({})
 
     defaults = {
         k: v.default
@@ -604,27 +660,35 @@ def _maybe_node_for_user_type(
 
     type_schema = schema.nodes.SchemaNode(schema_type)
 
-    for field_name, field_type in attribute_hints:
-        globally_modified_field_name = global_name_overrider(field_name)
-        # apply field override, if available
-        if deserialize_overrides:
-            field = get_override_identifier(field_name)
-            serialized_field_name = overrides.get(field, globally_modified_field_name)
-        else:
-            serialized_field_name = globally_modified_field_name
-
+    for (field_name, field_type), serialized_field_name in zip(attribute_hints, serialized_field_names):
         node, memo, forward_refs = decide_node_type(field_type, overrides, memo, forward_refs)
         if node is None:
             raise TypeError(
                 f'Cannot recognise type "{field_type}" of the field '
                 f'"{typ.__name__}.{field_name}" (from {typ.__module__})'
             )
-        # clonning because we mutate it next, and the node
-        # might be from the cache already
-        node = clone_schema_node(node)
-        node.name = serialized_field_name
-        node.missing = defaults.get(field_name, node.missing)
+        if field_name in defaults:
+            # clonning because we mutate it next, and the node
+            # might be from the cache already
+            node = clone_schema_node(node)
+            node.name = sys.intern(serialized_field_name)
+            node.missing = defaults[field_name]
+        else:
+            node = _field_node(node, serialized_field_name)
         type_schema.add(node)
+    type_schema.required_keys = frozenset(
+        x.name for x in type_schema.children if x.missing is col.required
+    )
+    type_schema.fields = fields = schema_type.fields_of(type_schema)
+    type_schema.field_keys = frozenset(x.name for x in fields)
+    type_schema.droppable_keys = frozenset(x.name for x in fields if x.is_droppable)
+    if len(type_schema.required_keys) == len(fields):
+        type_schema.field_values = schema.types.values_getter(itemgetter, [x.name for x in fields])
+    type_schema.field_deserializers = tuple(x.deserialize for x in fields)
+    type_schema.attribute_values = schema.types.values_getter(attrgetter, [x.field_name for x in fields])
+    type_schema.field_serialized_types = tuple(
+        schema.primitives.serialized_passthrough_item_type(x) for x in type_schema.children
+    )
     return type_schema, memo, forward_refs
 
 
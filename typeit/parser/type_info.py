@@ -1,4 +1,6 @@
-from typing import Type, get_type_hints, NamedTuple, Union, ForwardRef, Any, Generator
+from functools import lru_cache
+from types import GenericAlias
+from typing import Type, get_type_hints, NamedTuple, Union, ForwardRef, Any, Iterator, Tuple
 
 NoneType = type(None)
 
@@ -9,7 +11,39 @@ class AttrInfo(NamedTuple):
     raw_type: Union[Type, ForwardRef]
 
 
-def get_type_attribute_info(typ: Type) -> Generator[AttrInfo, Any, None]:
+def _resolved_hints(typ: Type) -> Tuple[Tuple[str, Type], ...]:
+    annotations = getattr(typ, '__annotations__', None)
+    if (annotations
+            and tuple(annotations) == getattr(typ, '_fields', None)
+            and all(_is_plain_class(x) for x in annotations.values())):
+        # annotations of named tuples are exactly their fields,
+        # and when they're plain classes there's nothing to evaluate
+        return tuple(annotations.items())
+    return tuple(get_type_hints(typ).items())
+
+
+def _is_plain_class(annotation: Any) -> bool:
+    # generic aliases pass isinstance(x, type) on some Python versions
+    return isinstance(annotation, type) and not isinstance(annotation, GenericAlias)
+
+
+def get_type_attribute_info(typ: type) -> Iterator[AttrInfo]:
+    try:
+        return iter(_attribute_info(typ))
+    except TypeError:
+        # unhashable hints source
+        return _make_attribute_info(typ, tuple(get_type_hints(typ).items()))
+
+
+@lru_cache(maxsize=1024)
+def _attribute_info(typ: type) -> Tuple[AttrInfo, ...]:
+    """ get_type_hints() evaluates string annotations and walks the MRO on every call,
+    whereas the same type is parsed by every type constructor it is a part of.
+    """
+    return tuple(_make_attribute_info(typ, _resolved_hints(typ)))
+
+
+def _make_attribute_info(typ: Type, hints: Tuple[Tuple[str, Type], ...]) -> Iterator[AttrInfo]:
     raw = getattr(typ, '__annotations__', {})
     existing_only = lambda x: x[1] is not NoneType
-    return (AttrInfo(name, t, raw.get(name, t)) for name, t in filter(existing_only, get_type_hints(typ).items()))
+    return (AttrInfo(name, t, raw.get(name, t)) for name, t in filter(existing_only, hints))
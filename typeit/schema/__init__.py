@@ -4,4 +4,5 @@ from . import types
 from . import nodes
 from .errors import Invalid
 
-__all__ = ['meta', 'primitives', 'types', 'nodes', 'Invalid']
+# the compiler is only needed for flags.Compiled, hence it is imported on demand
+__all__ = ['meta', 'primitives', 'types', 'nodes', 'compiler', 'Invalid']
@@ -0,0 +1,647 @@
+""" Compiles schema trees into straight-line Python functions.
+
+A generic colander traversal dispatches through several method calls per node
+on every value. Most of those calls are decided by the schema alone, therefore
+they can be resolved once, at type construction time, by generating the source
+of a specialised function, e.g. for::
+
+    class Item(NamedTuple):
+        x: int
+        y: Sequence[str]
+
+the constructor becomes roughly::
+
+    def structure_0(d):
+        if type(d) is not dict:
+            return node_0(d)
+        v0 = d.get('x', Null)
+        v1 = d.get('y', Null)
+        error = None
+        try:
+            v0 = (v0 if type(v0) is int else node_1(v0))
+        except Invalid as e:
+            error = add_error(error, schema_node_0, e, 0)
+        try:
+            v1 = ([(x1 if type(x1) is str else node_3(x1)) for x1 in v1] if type(v1) is list else node_2(v1))
+        except Invalid as e:
+            error = add_error(error, schema_node_0, e, 1)
+        if error is not None:
+            raise error
+        try:
+            return new_0(typ_1, (v0, v1, ))
+        except TypeError:
+            raise invalid_2(schema_node_0)
+
+where ``node_*`` are the ``deserialize`` methods of the original schema nodes,
+and ``new_0`` is ``tuple.__new__``, creating an ``Item`` out of positional values
+(other structures are created by a ``make_*`` function of the schema).
+Serializers are compiled in the same way, e.g. the serializer of ``Item`` becomes::
+
+    def structure_0(o):
+        if type(o) is not typ_0:
+            return node_0(o)
+        v0, v1, = o
+        return {
+            'x': (v0 if type(v0) is int else node_1(v0)),
+            'y': ([(x1 if type(x1) is str and x1 != 'None' else node_3(x1)) for x1 in v1] if type(v1) in seq_2 else node_2(v1)),
+        }
+
+Nodes that are not supported by the compiler (serialized unions, extensions etc),
+as well as the values that don't match the fast path, are passed through
+the original schema nodes. Compiled deserializers collect errors of fields and items
+the same way the schema does, and make every value exactly once, whether the data is valid
+or not, as the types being made may have side effects (e.g. ``__post_init__()``).
+Serializers don't make user types, and whenever a compiled serializer fails,
+the value is passed through the original schema, so that errors are reported exactly the same way.
+"""
+import typing as t
+from itertools import count
+
+import colander as col
+from pyrsistent import pvector
+
+from . import nodes
+from . import primitives
+from . import types
+from .errors import Invalid
+from ..sums.impl import variant_with_data
+
+
+Null = nodes.Null
+
+Compiled = t.Callable[[t.Any], t.Any]
+
+# Sum types with fewer variants are dispatched with a chain of tag comparisons,
+# which is cheaper than hashing the tag for a dict lookup
+MAX_SUM_TAG_COMPARISONS = 3
+
+# Values of structures with at least that many fields, all of them required, are taken
+# from the dict by a single itemgetter call, which is cheaper than a dict.get() per field
+MIN_FIELDS_TAKEN_AT_ONCE = 5
+
+
+def _add_error(error: t.Optional[col.Invalid], node, e: col.Invalid, pos: int) -> col.Invalid:
+    """ Adds the error of a child at the position ``pos`` to the error of the ``node``,
+    the way colander collects errors of mappings and sequences.
+    """
+    if error is None:
+        error = Invalid(node)
+    error.add(e, pos)
+    return error
+
+
+def _makes_no_user_types(node) -> bool:
+    """ Whether deserializing a value with the node calls no user code,
+    hence it may be done once again without side effects.
+    """
+    if type(node) is not nodes.SchemaNode or not _is_plain(node):
+        return False
+    schema_type = node.typ
+    if type(schema_type) is types.Enum:
+        return not schema_type.has_custom_missing
+    return (
+        primitives.passthrough_type(schema_type) is not None
+        or type(schema_type) in (types.Literal, types.Path, primitives.AcceptEverything)
+    )
+
+
+def _is_plain(node) -> bool:
+    """ Nodes with preparers and validators are never produced by the parser,
+    but they still may come from extensions and should be handled by colander.
+    """
+    return node.preparer is None and node.validator is None
+
+
+class _Compiler:
+    """ Generates the source of a function that does the same as the ``method``
+    of a schema node.
+    """
+    method: str
+    # the attribute of nodes holding the value that the method returns for missing values
+    missing_attribute: str
+    # whether the whole value is passed through the original method when the compiled function fails
+    falls_back_on_errors: bool
+
+    def __init__(self) -> None:
+        self.namespace: t.Dict[str, t.Any] = {
+            'Null': Null,
+            'Invalid': Invalid,
+            'add_error': _add_error,
+            'variant_with_data': variant_with_data,
+        }
+        self.definitions: t.List[str] = []
+        # function_key(node) => name of the function compiled for the node
+        self.compiled_functions: t.Dict[t.Tuple[int, ...], str] = {}
+        self.counter = count()
+        # whether any of the nodes got a specialised expression
+        self.specialised = False
+
+    def ref(self, prefix: str, obj: t.Any) -> str:
+        """ Makes the object accessible from the generated source by a unique name
+        """
+        name = f'{prefix}_{next(self.counter)}'
+        self.namespace[name] = obj
+        return name
+
+    def function_key(self, node) -> t.Tuple[t.Any, ...]:
+        """ The parser clones the node of a type for every field of that type. The clones share
+        the schema type and the children, and differ in their names and in the values of
+        missing fields only. The names end up in the paths of the errors that compiled functions
+        report, hence clones with the same name and missing values share a single compiled function.
+        """
+        return (id(node.typ), id(getattr(node, self.missing_attribute)), node.name, *map(id, node.children))
+
+    def literal(self, node, var: str) -> str:
+        # literal values are of hashable types, and values of other types are never looked up,
+        # as unhashable ones would raise TypeError
+        literal_types = frozenset(type(x) for x in node.typ.variants)
+        return (
+            f'({var} if type({var}) in {self.ref("literal_types", literal_types)} '
+            f'and {var} in {self.ref("literals", node.typ.variants)} else {self.fallback(node)}({var}))'
+        )
+
+    def fallback(self, node) -> str:
+        """ Returns the name of the original method of the node
+        """
+        return self.ref('node', getattr(node, self.method))
+
+    def expression(self, node, var: str, depth: int) -> str:
+        """ Returns a Python expression that processes the value of ``var``
+        according to the schema ``node``.
+        """
+        expression = self.specialised_expression(node, var, depth)
+        if expression is None:
+            return f'{self.fallback(node)}({var})'
+        self.specialised = True
+        return expression
+
+    def specialised_expression(self, node, var: str, depth: int) -> t.Optional[str]:
+        raise NotImplementedError
+
+    def build(self, node) -> Compiled:
+        expression = self.expression(node, 'value', 0)
+        if not self.specialised:
+            # nothing to specialise, the node is handled by colander entirely
+            return getattr(node, self.method)
+
+        if self.falls_back_on_errors:
+            entry_point = (
+                f'def {self.method}(value):\n'
+                f'    try:\n'
+                f'        return {expression}\n'
+                f'    except (Invalid, TypeError):\n'
+                f'        return {self.fallback(node)}(value)\n'
+            )
+        else:
+            entry_point = (
+                f'def {self.method}(value):\n'
+                f'    return {expression}\n'
+            )
+        source = '\n\n'.join(self.definitions + [entry_point])
+        code = compile(source, f'<typeit:{self.method}:{node.typ!r}>', 'exec')
+        exec(code, self.namespace)
+        return self.namespace[self.method]
+
+
+class _DeserializerCompiler(_Compiler):
+    method = 'deserialize'
+    missing_attribute = 'missing'
+    # the values of fields and items are made exactly once, errors are collected where they occur
+    falls_back_on_errors = False
+
+    def specialised_expression(self, node, var: str, depth: int) -> t.Optional[str]:
+        if _is_plain(node):
+            schema_type = node.typ
+            if type(node) is nodes.SchemaNode:
+                passthrough_type = primitives.passthrough_type(schema_type)
+                if passthrough_type is not None:
+                    return (
+                        f'({var} if type({var}) is {self.ref("type", passthrough_type)} '
+                        f'else {self.fallback(node)}({var}))'
+                    )
+                members: t.Optional[t.Mapping[t.Any, types.EnumLike]]
+                if type(schema_type) is types.Enum:
+                    members = schema_type.members
+                elif type(schema_type) is types.Union:
+                    members = schema_type.enum_members
+                else:
+                    members = None
+                if members:
+                    members_ref = self.ref('members', members)
+                    return (
+                        f'({members_ref}[{var}] if type({var}) is str and {var} in {members_ref} '
+                        f'else {self.fallback(node)}({var}))'
+                    )
+                if type(schema_type) is types.Union:
+                    union = self.union(node)
+                    if union is not None:
+                        return f'{union}({var})'
+                if type(schema_type) is primitives.AcceptEverything:
+                    return f'({self.fallback(node)}({var}) if {var} is Null else {var})'
+                if type(schema_type) is types.Literal:
+                    return self.literal(node, var)
+                if type(schema_type) is types.Path:
+                    # empty strings depend on the settings of the schema type, leaving them to it
+                    return (
+                        f'({self.ref("path", schema_type.typ)}({var}) if type({var}) is str and {var} '
+                        f'else {self.fallback(node)}({var}))'
+                    )
+                if type(schema_type) is types.Structure and schema_type.unknown in ('ignore', 'raise'):
+                    structure = self.structure(node)
+                    if structure is not None:
+                        return f'{structure}({var})'
+                if type(schema_type) is types.Sum:
+                    return f'{self.sum(node)}({var})'
+            elif type(node) in (nodes.SequenceSchema, nodes.PVectorSchema, nodes.SetSchema):
+                if not schema_type.accept_scalar:
+                    return self.sequence(node, var, depth)
+        return None
+
+    def sequence(self, node, var: str, depth: int) -> str:
+        return f'{self.sequence_function(node)}({var})'
+
+    def sequence_function(self, node) -> str:
+        try:
+            return self.compiled_functions[self.function_key(node)]
+        except KeyError:
+            pass
+        name = f'sequence_{next(self.counter)}'
+        self.compiled_functions[self.function_key(node)] = name
+
+        item_node = node.children[0]
+        item = self.expression(item_node, 'x', 0)
+        fallback = self.fallback(node)
+        lines = [
+            f'def {name}(v):',
+            f'    if type(v) is not list:',
+            f'        return {fallback}(v)',
+        ]
+        if _makes_no_user_types(item_node):
+            # making the items once again is harmless, hence the original node
+            # reports the errors when any of the items is invalid
+            lines.extend([
+                f'    try:',
+                f'        items = [{item} for x in v]',
+                f'    except Invalid:',
+                f'        return {fallback}(v)',
+            ])
+        else:
+            node_ref = self.ref('schema_node', node)
+            lines.extend([
+                f'    items = []',
+                f'    error = None',
+                f'    for x in v:',
+                f'        try:',
+                f'            items.append({item})',
+                f'        except Invalid as e:',
+                f'            error = add_error(error, {node_ref}, e, len(items))',
+                f'            items.append(None)',
+                f'    if error is not None:',
+                f'        raise error',
+            ])
+        if type(node) is nodes.PVectorSchema:
+            lines.append(f'    return {self.ref("pvector", pvector)}(items)')
+        elif type(node) is nodes.SetSchema:
+            lines.append(f'    return {self.ref("set", frozenset if node.frozen else set)}(items)')
+        else:
+            lines.append(f'    return items')
+
+        self.definitions.append('\n'.join(lines))
+        return name
+
+    def structure(self, node) -> t.Optional[str]:
+        try:
+            return self.compiled_functions[self.function_key(node)]
+        except KeyError:
+            pass
+        schema_type: types.Structure = node.typ
+        if any(child.missing is col.drop for child in node.children):
+            return None
+
+        name = f'structure_{next(self.counter)}'
+        self.compiled_functions[self.function_key(node)] = name
+
+        fallback = self.fallback(node)
+        lines = [
+            f'def {name}(d):',
+            f'    if type(d) is not dict:',
+            f'        return {fallback}(d)',
+        ]
+        if schema_type.unknown == 'raise':
+            keys = frozenset(child.name for child in node.children)
+            lines.extend([
+                f'    if not d.keys() <= {self.ref("keys", keys)}:',
+                f'        return {fallback}(d)',
+            ])
+        positional = schema_type.make is not None and node.fields is not None
+        if (node.field_values is not None
+                and node.fields is not None
+                and MIN_FIELDS_TAKEN_AT_ONCE <= len(node.fields) == len(node.children)):
+            lines.extend([
+                f'    try:',
+                f'        {", ".join(f"v{num}" for num in range(len(node.children)))} = '
+                f'{self.ref("values", node.field_values)}(d)',
+                f'    except KeyError:',
+                f'        return {fallback}(d)',
+            ])
+        else:
+            lines.extend(
+                f'    v{num} = d.get({child.name!r}, Null)'
+                for num, child in enumerate(node.children)
+            )
+        # every field is deserialized, and errors of all of them are reported
+        node_ref = self.ref('schema_node', node)
+        lines.append(f'    error = None')
+        for num, child in enumerate(node.children):
+            lines.extend([
+                f'    try:',
+                f'        v{num} = {self.expression(child, f"v{num}", 0)}',
+                f'    except Invalid as e:',
+                f'        error = add_error(error, {node_ref}, e, {num})',
+            ])
+        lines.extend([
+            f'    if error is not None:',
+            f'        raise error',
+            f'    try:',
+        ])
+        # the type is made outside of the checks above, errors of its constructor are reported once
+        values = ''.join(f'v{num}, ' for num in range(len(node.children)))
+        if positional and schema_type.is_tuple:
+            # named tuples are made by tuple.__new__() anyway, the call is emitted without the partial() around it
+            lines.append(f'        return {self.ref("new", tuple.__new__)}({self.ref("typ", schema_type.typ)}, ({values}))')
+        elif positional:
+            lines.append(f'        return {self.ref("make", schema_type.make)}(({values}))')
+        else:
+            arguments = ', '.join(
+                f'{schema_type.deserialize_overrides.get(child.name, child.name)}=v{num}'
+                for num, child in enumerate(node.children)
+            )
+            lines.append(f'        return {self.ref("typ", schema_type.typ)}({arguments})')
+        lines.extend([
+            f'    except TypeError:',
+            f'        raise {self.ref("invalid", schema_type.construction_error)}({node_ref})',
+        ])
+
+        self.definitions.append('\n'.join(lines))
+        return name
+
+
+    def union(self, node) -> t.Optional[str]:
+        """ Values of the built-in types that only one of the variants may accept
+        are dispatched to that variant directly by the type of the value.
+        """
+        try:
+            return self.compiled_functions[self.function_key(node)]
+        except KeyError:
+            pass
+        schema_type: types.Union = node.typ
+        # value type => the variant that deserializes values of the type, None for the values returned as they are
+        branches: t.List[t.Tuple[t.Type, t.Optional[types._UnionVariant]]] = []
+        for value_type, candidates in schema_type.candidates_by_type.items():
+            primitive = schema_type.tried_primitive(value_type)
+            if primitive is not None:
+                # the primitive variant is tried first, and it returns such values as they are
+                if primitives.passthrough_type(primitive) is value_type:
+                    branches.append((value_type, None))
+            elif len(candidates) == 1:
+                branches.append((value_type, candidates[0]))
+        if not branches:
+            return None
+
+        name = f'union_{next(self.counter)}'
+        self.compiled_functions[self.function_key(node)] = name
+        lines = [
+            f'def {name}(v):',
+            f'    t = type(v)',
+        ]
+        for value_type, variant in branches:
+            lines.append(f'    if t is {value_type.__name__}:')
+            if variant is None:
+                lines.append(f'        return v')
+                continue
+            # the rest of the variants are tried by the union, along with the error of this one
+            lines.extend([
+                f'        try:',
+                f'            return {self.expression(variant.node, "v", 0)}',
+                f'        except Invalid as e:',
+                f'            return {self.ref("variants", schema_type.deserialize_variants)}'
+                f'({self.ref("schema_node", node)}, v, ({self.ref("variant", variant)}, e))',
+            ])
+        lines.extend([
+            f'    if v is None:',
+            f'        return None',
+            f'    return {self.fallback(node)}(v)',
+        ])
+        self.definitions.append('\n'.join(lines))
+        return name
+
+    def variant(self, node_ref: str, schema_type: types.Sum, var_type, var_schema, indent: str) -> t.List[str]:
+        """ Returns the lines that return the variant made out of ``payload``
+        """
+        variant = self.ref('variant', var_type)
+        if type(var_schema.typ) is types.Structure and var_schema.typ.typ is var_type.__variant_meta__.constructor:
+            # the structure deserializes the payload into the data of the variant
+            made = f'variant_with_data({variant}, data)'
+        else:
+            made = f'{variant}(**data._asdict())'
+        return [
+            f'{indent}try:',
+            f'{indent}    data = {self.expression(var_schema, "payload", 0)}',
+            f'{indent}except Invalid:',
+            f'{indent}    raise {self.ref("invalid", schema_type.payload_error)}({node_ref}, {variant}, c)',
+            f'{indent}return {made}',
+        ]
+
+    def sum(self, node) -> str:
+        try:
+            return self.compiled_functions[self.function_key(node)]
+        except KeyError:
+            pass
+        schema_type: types.Sum = node.typ
+        name = f'sum_{next(self.counter)}'
+        self.compiled_functions[self.function_key(node)] = name
+
+        fallback = self.fallback(node)
+        lines = [f'def {name}(c):']
+        if schema_type.as_dict_key is None:
+            lines.extend([
+                f'    if type(c) is not list or len(c) != 2:',
+                f'        return {fallback}(c)',
+                f'    tag, payload = c',
+            ])
+        else:
+            key = schema_type.as_dict_key
+            lines.extend([
+                f'    if type(c) is not dict or {key!r} not in c:',
+                f'        return {fallback}(c)',
+                f'    tag = c[{key!r}]',
+                f'    payload = {{k: v for k, v in c.items() if k != {key!r}}}',
+            ])
+
+        node_ref = self.ref('schema_node', node)
+        # variants_by_tag preserves the declaration order of variants,
+        # so the first variant with a given tag takes precedence, as in Sum.deserialize()
+        variants = schema_type.variants_by_tag.items()
+        if len(variants) <= MAX_SUM_TAG_COMPARISONS:
+            for tag, (var_type, var_schema) in variants:
+                tag_ref = repr(tag) if type(tag) is str else self.ref('tag', tag)
+                lines.append(f'    if tag == {tag_ref}:')
+                lines.extend(self.variant(node_ref, schema_type, var_type, var_schema, '        '))
+            lines.append(f'    return {fallback}(c)')
+        else:
+            dispatch = {}
+            for tag, (var_type, var_schema) in variants:
+                variant_name = f'variant_{next(self.counter)}'
+                self.definitions.append('\n'.join(
+                    [f'def {variant_name}(c, payload):']
+                    + self.variant(node_ref, schema_type, var_type, var_schema, '    ')
+                ))
+                dispatch[tag] = variant_name
+            dispatch_items = ', '.join(f'{self.ref("tag", tag)}: {fn}' for tag, fn in dispatch.items())
+            dispatch_name = f'dispatch_{next(self.counter)}'
+            # the table refers to the variant functions, hence it's defined right after them
+            self.definitions.append(f'{dispatch_name} = {{{dispatch_items}}}')
+            lines.extend([
+                f'    try:',
+                f'        variant = {dispatch_name}[tag]',
+                f'    except (KeyError, TypeError):',
+                f'        # TypeError stands for unhashable tags',
+                f'        return {fallback}(c)',
+                f'    return variant(c, payload)',
+            ])
+
+        self.definitions.append('\n'.join(lines))
+        return name
+
+
+class _SerializerCompiler(_Compiler):
+    method = 'serialize'
+    missing_attribute = 'default'
+    falls_back_on_errors = True
+
+    def specialised_expression(self, node, var: str, depth: int) -> t.Optional[str]:
+        if _is_plain(node):
+            schema_type = node.typ
+            if type(node) is nodes.SchemaNode:
+                passthrough_type = primitives.serialized_passthrough_type(schema_type)
+                if passthrough_type is str:
+                    return (
+                        f"({var} if type({var}) is str and {var} != 'None' "
+                        f"else {self.fallback(node)}({var}))"
+                    )
+                if passthrough_type is not None:
+                    return (
+                        f'({var} if type({var}) is {self.ref("type", passthrough_type)} '
+                        f'else {self.fallback(node)}({var}))'
+                    )
+                if type(schema_type) is primitives.AcceptEverything:
+                    return f'({self.fallback(node)}({var}) if {var} is Null else {var})'
+                if type(schema_type) is types.Literal:
+                    return self.literal(node, var)
+                if type(schema_type) is types.Structure:
+                    structure = self.structure(node)
+                    if structure is not None:
+                        return f'{structure}({var})'
+            elif type(node) in (nodes.SequenceSchema, nodes.PVectorSchema, nodes.SetSchema):
+                if not schema_type.accept_scalar:
+                    return self.sequence(node, var, depth)
+        return None
+
+    def sequence(self, node, var: str, depth: int) -> str:
+        item = f'x{depth + 1}'
+        items = f'[{self.expression(node.children[0], item, depth + 1)} for {item} in {var}]'
+        sequence_types = self.ref('seq', SERIALIZED_SEQUENCE_TYPES)
+        return f'({items} if type({var}) in {sequence_types} else {self.fallback(node)}({var}))'
+
+    def structure(self, node) -> t.Optional[str]:
+        try:
+            return self.compiled_functions[self.function_key(node)]
+        except KeyError:
+            pass
+        schema_type: types.Structure = node.typ
+        if node.fields is None or any(child.default is col.drop for child in node.children):
+            return None
+
+        name = f'structure_{next(self.counter)}'
+        self.compiled_functions[self.function_key(node)] = name
+
+        fallback = self.fallback(node)
+        lines = [
+            f'def {name}(o):',
+            f'    if type(o) is not {self.ref("typ", schema_type.typ)}:',
+            f'        return {fallback}(o)',
+        ]
+        if schema_type.is_tuple and node.fields:
+            # named tuples are unpacked at once, in the order of their attributes
+            lines.append(f'    {", ".join(f"v{num}" for num in range(len(node.fields)))}, = o')
+        values = []
+        for num, field in enumerate(node.fields):
+            if not schema_type.is_tuple:
+                lines.append(f'    v{num} = o.{field.field_name}')
+            values.append(f'        {field.name!r}: {self.expression(node.children[num], f"v{num}", 0)},')
+        lines.append(f'    return {{')
+        lines.extend(values)
+        lines.append(f'    }}')
+
+        self.definitions.append('\n'.join(lines))
+        return name
+
+
+# types of values that sequences are serialized from on the fast path
+SERIALIZED_SEQUENCE_TYPES = frozenset({list, tuple, set, frozenset, type(pvector())})
+
+
+def compile_deserializer(node) -> Compiled:
+    """ Returns a function that deserializes data the same way as ``node.deserialize``
+    """
+    return _DeserializerCompiler().build(node)
+
+
+def compile_serializer(node) -> Compiled:
+    """ Returns a function that serializes data the same way as ``node.serialize``
+    """
+    return _SerializerCompiler().build(node)
+
+
+def compile_lazily(compile_node: t.Callable[[t.Any], Compiled], node) -> Compiled:
+    """ Defers ``compile_node(node)`` till the first call of the returned function.
+
+    Generating and compiling the source takes longer than parsing the type itself,
+    and it is not worth it for type tools that are never used, e.g. serializers
+    of the types that are only ever parsed.
+    """
+    compiled: t.Optional[Compiled] = None
+
+    def process(value):
+        nonlocal compiled
+        if compiled is None:
+            compiled = compile_node(node)
+        return compiled(value)
+
+    return process
+
+
+# Type tools of the types without the Compiled flag are compiled after that many calls:
+# compiling a schema costs about as much as interpreting it on a hundred values,
+# which pays off for the types parsed over and over, and is not wasted on the rest
+HOT_CALLS = 100
+
+
+def compile_when_hot(compile_node: t.Callable[[t.Any], Compiled], node, interpreted: Compiled) -> Compiled:
+    """ Calls ``interpreted`` till the returned function is called ``HOT_CALLS`` times,
+    and ``compile_node(node)`` after that.
+    """
+    compiled: t.Optional[Compiled] = None
+    calls = 0
+
+    def process(value):
+        nonlocal compiled, calls
+        if compiled is not None:
+            return compiled(value)
+        calls += 1
+        if calls < HOT_CALLS:
+            return interpreted(value)
+        compiled = compile_node(node)
+        return compiled(value)
+
+    return process
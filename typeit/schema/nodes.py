@@ -1,4 +1,6 @@
-from typing import Iterable
+from functools import partial
+from operator import itemgetter
+from typing import Iterable, FrozenSet, Optional, Tuple, Any, Callable, List
 
 from pyrsistent import pvector, pmap
 import colander as col
@@ -12,6 +14,24 @@ class SchemaNode(col.SchemaNode):
     we fix it with this subclass.
     """
     children: Iterable
+    # names of children that have to be present in a payload,
+    # populated by the parser once all children are added
+    required_keys: FrozenSet[str] = frozenset()
+    # names of all children, and of those that are left out when missing,
+    # populated by the parser along with the fields
+    field_keys: FrozenSet[str] = frozenset()
+    droppable_keys: FrozenSet[str] = frozenset()
+    # types.StructureField of every child of a structure node, populated by the parser
+    fields: Optional[Tuple[Any, ...]] = None
+    # the payload values of all fields at once, when all of them are required,
+    # their deserializers, and the attribute values of all fields at once,
+    # populated by the parser along with the fields (see types.values_getter)
+    field_values: Optional[Callable[[Any], Tuple[Any, ...]]] = None
+    field_deserializers: Tuple[Callable[[Any], Any], ...] = ()
+    attribute_values: Optional[Callable[[Any], Tuple[Any, ...]]] = None
+    # the types of values that every field serializes into themselves (None for the other fields),
+    # populated by the parser along with the fields (see primitives.serialized_passthrough_item_type)
+    field_serialized_types: Tuple[Optional[type], ...] = ()
 
     def __repr__(self) -> str:
         return f'{self.typ}'
@@ -22,7 +42,97 @@ class TupleSchema(col.TupleSchema):
 
 
 class SequenceSchema(col.SequenceSchema):
-    pass
+    # items of this type are deserialized into themselves (`object` stands for typing.Any),
+    # populated by the parser
+    item_type: Optional[type] = None
+    # literal values that items are deserialized into themselves from, populated by the parser
+    item_literals: Optional[FrozenSet[Any]] = None
+
+    def deserialize(self, *args, **kwargs):
+        if args and type(args[0]) is list:
+            items = args[0]
+            if self._passes_items(items):
+                # every item would be returned as is by the item node,
+                # hence the result can be built from the list right away
+                return self.collect(items)
+            if self._maps_items():
+                return self.collect(self._deserialize_items(items))
+        r = super().deserialize(*args, **kwargs)
+        if r in (Null, None) or r is self.missing:
+            # defaults of missing fields are shared as they are, rather than copied on every fill
+            # (including the default_factory marker of dataclasses, which their __init__ replaces)
+            return r
+        return self.collect(r)
+
+    def collect(self, items: list) -> Any:
+        """ Builds the deserialized value out of the deserialized items
+        """
+        return list(items)
+
+    def _deserialize_items(self, items: list) -> list:
+        """ Deserializes every item exactly once, collecting errors of all items
+        the way colander does it.
+        """
+        item_node = self.children[0]
+        plain = type(item_node) is SchemaNode and item_node.preparer is None and item_node.validator is None
+        if plain:
+            # the item node would return whatever its type returns, unless it's null
+            deserialize_item = partial(item_node.typ.deserialize, item_node)
+        else:
+            deserialize_item = item_node.deserialize
+        values: list = []
+        # (position, error) of the items that failed
+        failures: List[Tuple[int, col.Invalid]] = []
+        remaining = map(deserialize_item, items)
+        while True:
+            try:
+                values.extend(remaining)
+            except col.Invalid as e:
+                # the map resumes with the next item
+                failures.append((len(values), e))
+                values.append(e)
+            else:
+                break
+        if plain:
+            failed = len(failures)
+            for num, value in enumerate(values):
+                if value is Null:
+                    # the item node decides what becomes of null values
+                    try:
+                        values[num] = item_node.deserialize(items[num])
+                    except col.Invalid as e:
+                        failures.append((num, e))
+            if len(failures) > failed:
+                failures.sort(key=itemgetter(0))
+        if failures:
+            error = col.Invalid(self)
+            for num, item_error in failures:
+                error.add(item_error, num)
+            raise error
+        return values
+
+    def _maps_items(self) -> bool:
+        """ Whether the items can be deserialized with a plain map() over the item node,
+        which is the case unless colander has to drop some of them, or to post-process the result.
+        """
+        return self.preparer is None and self.validator is None and self.children[0].missing is not col.drop
+
+    def _passes_items(self, items: list) -> bool:
+        if self.preparer is not None or self.validator is not None:
+            return False
+        item_type = self.item_type
+        if item_type is object:
+            return all(x is not Null for x in items)
+        if item_type is not None:
+            return all(type(x) is item_type for x in items)
+        if self.item_literals is not None:
+            try:
+                # a single set operation instead of validating items one by one
+                return self.item_literals.issuperset(items)
+            except TypeError:
+                # unhashable items are never among the literals
+                return False
+        return False
 
 
 class SetSchema(SequenceSchema):
@@ -30,21 +140,15 @@ class SetSchema(SequenceSchema):
         super().__init__(*args, **kwargs)
         self.frozen = frozen
 
-    def deserialize(self, *args, **kwargs):
-        r = super().deserialize(*args, **kwargs)
-        if r in (Null, None):
-            return r
+    def collect(self, items: list) -> Any:
         if self.frozen:
-            return frozenset(r)
-        return set(r)
+            return frozenset(items)
+        return set(items)
 
 
 class PVectorSchema(SequenceSchema):
-    def deserialize(self, *args, **kwargs):
-        r = super().deserialize(*args, **kwargs)
-        if r in (Null, None):
-            return r
-        return pvector(r)
+    def collect(self, items: list) -> Any:
+        return pvector(items)
 
 
 class PMapSchema(SchemaNode):
@@ -1,40 +1,61 @@
 import typing as t
+from functools import lru_cache
 
 import colander as col
 from . import meta
+from . import nodes
 from .errors import Invalid
 
 
 Null = col.null
 
 
-def _strict_deserialize(node, allowed_type: t.Type, cstruct):
-    if cstruct in (Null, None):
+# Rejections are common when union variants are tried in turn,
+# and formatting reprs of the types takes longer than raising the error itself,
+# hence messages are formatted once per combination of the types.
+@lru_cache(maxsize=256)
+def _strict_type_message(passed_type: type, allowed_type: type, direction: str) -> str:
+    return (
+        f'Primitive values should adhere strict type semantics: '
+        f'{passed_type} was passed, {allowed_type} is expected by {direction}.'
+    )
+
+
+def _strict_deserialize(node, allowed_type: type, cstruct):
+    if cstruct is Null or cstruct is None:
         return cstruct
-    if type(cstruct) is not allowed_type:
+    passed_type: type = type(cstruct)
+    if passed_type is not allowed_type:
         raise Invalid(
             node,
-            f'Primitive values should adhere strict type semantics: '
-            f'{type(cstruct)} was passed, {allowed_type} is expected by deserializer.',
+            _strict_type_message(passed_type, allowed_type, 'deserializer'),
             cstruct
         )
     return cstruct
 
 
-def _strict_serialize(node, allowed_type: t.Type, appstruct):
-    if appstruct in (Null, None):
+def _strict_serialize(node, allowed_type: type, appstruct):
+    if appstruct is Null or appstruct is None:
         return appstruct
 
-    if type(appstruct) is not allowed_type:
+    passed_type: type = type(appstruct)
+    if passed_type is not allowed_type:
         raise Invalid(
             node,
-            f'Primitive values should adhere strict type semantics: '
-            f'{type(appstruct)} was passed, {allowed_type} is expected by serializer.',
+            _strict_type_message(passed_type, allowed_type, 'serializer'),
             appstruct
         )
     return appstruct
 
 
+@lru_cache(maxsize=256)
+def _bytes_conversion_message(passed_type: type, supported_conversions: t.Tuple[type, ...]) -> str:
+    return (
+        f'Cannot convert a source value of type {passed_type} to bytes: '
+        f'supported source types are {supported_conversions}.'
+    )
+
+
 class AcceptEverything(meta.SchemaType):
     """ A schema type to correspond to typing.Any, i.e. allows
     any data to pass through the type constructor.
@@ -50,10 +71,19 @@ class NonStrictInt(meta.Int):
     def __repr__(self) -> str:
         return 'Int(coercible)'
 
+    def deserialize(self, node, cstruct):
+        if type(cstruct) is int:
+            # int(cstruct) would be the same value
+            return cstruct
+        return super().deserialize(node, cstruct)
+
     def serialize(self, node, appstruct):
         """ Default colander integer serializer returns a string representation
         of a number, whereas we want identical representation of the original data.
         """
+        if type(appstruct) is int:
+            # int(str(appstruct)) would be the same value
+            return appstruct
         r = super().serialize(node, appstruct)
         if r in (Null, 'None'):
             return None
@@ -65,6 +95,8 @@ class Int(NonStrictInt):
         return 'Int(strict)'
 
     def deserialize(self, node, cstruct):
+        if type(cstruct) is int:
+            return cstruct
         cstruct = _strict_deserialize(node, int, cstruct)
         return super().deserialize(node, cstruct)
 
@@ -72,18 +104,40 @@ class Int(NonStrictInt):
         """ Default colander integer serializer returns a string representation
         of a number, whereas we want identical representation of the original data.
         """
+        if type(appstruct) is int:
+            return appstruct
         appstruct = _strict_serialize(node, int, appstruct)
         return super().serialize(node, appstruct)
 
 
 class NonStrictBool(meta.Bool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # whether bool values are deserialized into themselves with the given choices,
+        # which is the case with the default ones
+        self.passes_bools = (
+            'false' in self.false_choices
+            and 'true' not in self.false_choices
+            and (not self.true_choices or 'true' in self.true_choices)
+        )
+        # whether bool values are serialized into themselves with the given values,
+        # which is the case with the default ones
+        self.serializes_bools = self.true_val == 'true' and self.false_val == 'false'
+
     def __repr__(self) -> str:
         return 'Bool(coercible)'
 
+    def deserialize(self, node, cstruct):
+        if type(cstruct) is bool and self.passes_bools:
+            return cstruct
+        return super().deserialize(node, cstruct)
+
     def serialize(self, node, appstruct):
         """ Default colander bool serializer returns a string representation
         of a boolean flag, whereas we want identical representation of the original data.
         """
+        if type(appstruct) is bool and self.serializes_bools:
+            return appstruct
         r = super().serialize(node, appstruct)
         if r in (Null, 'None'):
             return None
@@ -96,6 +150,8 @@ class Bool(NonStrictBool):
         return 'Bool(strict)'
 
     def deserialize(self, node, cstruct) -> bool:
+        if type(cstruct) is bool and self.passes_bools:
+            return cstruct
         cstruct = _strict_deserialize(node, bool, cstruct)
         return super().deserialize(node, cstruct)
 
@@ -103,6 +159,8 @@ class Bool(NonStrictBool):
         """ Default colander bool serializer returns a string representation
         of a boolean flag, whereas we want identical representation of the original data.
         """
+        if type(appstruct) is bool and self.serializes_bools:
+            return appstruct
         appstruct = _strict_serialize(node, bool, appstruct)
         return super().serialize(node, appstruct)
 
@@ -114,20 +172,31 @@ class Bytes(meta.SchemaType):
     ):
         super().__init__()
         self.supported_conversions = tuple(supported_conversions)
+        # conversions of the usual values are decided once here,
+        # rather than by a chain of isinstance() checks on every call
+        self.passes_bytes = bytes in self.supported_conversions
+        self.encodes_str = str in self.supported_conversions
 
     def serialize(self, node, appstruct):
         """ Default colander str serializer serializes None as 'None',
         whereas we want identical representation of the original data,
         with strict primitive type semantics
         """
+        value_type = type(appstruct)
+        if value_type is bytes and self.passes_bytes:
+            # bytes(appstruct) would be the same object
+            return appstruct
+        if value_type is str and self.encodes_str and appstruct != 'None':
+            return appstruct.encode('utf-8')
+
         if appstruct in (Null, 'None'):
             return None
 
         if not isinstance(appstruct, self.supported_conversions):
+            passed_type: type = type(appstruct)
             raise Invalid(
                 node,
-                f'Cannot convert a source value of type {type(appstruct)} to bytes: '
-                f'supported source types are {self.supported_conversions}.',
+                _bytes_conversion_message(passed_type, self.supported_conversions),
                 appstruct
             )
         if isinstance(appstruct, str):
@@ -142,11 +211,19 @@ class Bytes(meta.SchemaType):
 
 class NonStrictStr(meta.Str):
 
+    def deserialize(self, node, cstruct):
+        if type(cstruct) is str and (cstruct or self.allow_empty):
+            return cstruct
+        return super().deserialize(node, cstruct)
+
     def serialize(self, node, appstruct):
         """ Default colander str serializer serializes None as 'None',
         whereas we want identical representation of the original data,
         with strict primitive type semantics
         """
+        if type(appstruct) is str and not self.encoding:
+            # str(appstruct) would be the same value
+            return None if appstruct == 'None' else appstruct
         r = super().serialize(node, appstruct)
         if r in (Null, 'None'):
             return None
@@ -156,14 +233,18 @@ class NonStrictStr(meta.Str):
 class Str(NonStrictStr):
 
     def deserialize(self, node, cstruct):
+        if type(cstruct) is str and (cstruct or self.allow_empty):
+            return cstruct
         cstruct = _strict_deserialize(node, str, cstruct)
         return super().deserialize(node, cstruct)
 
-    def serialize(self, node, appstruct) -> str:
+    def serialize(self, node, appstruct) -> t.Optional[str]:
         """ Default colander str serializer serializes None as 'None',
         whereas we want identical representation of the original data,
         with strict primitive type semantics
         """
+        if type(appstruct) is str and not self.encoding:
+            return None if appstruct == 'None' else appstruct
         appstruct = _strict_serialize(node, str, appstruct)
         return super().serialize(node, appstruct)
 
@@ -173,7 +254,16 @@ class NonStrictFloat(meta.Float):
     def __repr__(self) -> str:
         return 'Float(coercible)'
 
+    def deserialize(self, node, cstruct):
+        if type(cstruct) is float:
+            # float(cstruct) would be the same value
+            return cstruct
+        return super().deserialize(node, cstruct)
+
     def serialize(self, node, appstruct):
+        if type(appstruct) is float:
+            # float(str(appstruct)) would be the same value
+            return appstruct
         r = super().serialize(node, appstruct)
         if r in (Null, 'None'):
             return None
@@ -185,14 +275,84 @@ class Float(NonStrictFloat):
         return 'Float(strict)'
 
     def deserialize(self, node, cstruct):
+        if type(cstruct) is float:
+            return cstruct
         cstruct = _strict_deserialize(node, float, cstruct)
         return super().deserialize(node, cstruct)
 
     def serialize(self, node, appstruct):
+        if type(appstruct) is float:
+            return appstruct
         appstruct = _strict_serialize(node, float, appstruct)
         return super().serialize(node, appstruct)
 
 
+# Python types of values that strict primitive schema types accept
+STRICT_PRIMITIVE_TYPES: t.Mapping[t.Type[meta.SchemaType], t.Type] = {
+    Str: str,
+    Int: int,
+    Float: float,
+    Bool: bool,
+}
+
+
+def passthrough_type(schema_type: meta.SchemaType) -> t.Optional[t.Type]:
+    """ Returns the type of values that the given primitive schema type
+    deserializes into themselves, if there's one.
+    """
+    schema_type_type = type(schema_type)
+    if schema_type_type in (Int, NonStrictInt):
+        return int
+    if schema_type_type in (Float, NonStrictFloat):
+        return float
+    if schema_type_type in (Str, NonStrictStr) and schema_type.allow_empty:
+        return str
+    if schema_type_type in (Bool, NonStrictBool) and schema_type.passes_bools:
+        return bool
+    if schema_type_type is Bytes and schema_type.passes_bytes:
+        return bytes
+    return None
+
+
+def passthrough_item_type(node: nodes.SchemaNode) -> t.Optional[t.Type]:
+    """ Returns the type of values that the given node deserializes into themselves,
+    ``object`` if the node accepts any value as is.
+    """
+    if type(node) is not nodes.SchemaNode or node.preparer is not None or node.validator is not None:
+        return None
+    if type(node.typ) is AcceptEverything:
+        return object
+    return passthrough_type(node.typ)
+
+
+def serialized_passthrough_type(schema_type: meta.SchemaType) -> t.Optional[t.Type]:
+    """ Returns the type of values that the given primitive schema type
+    serializes into themselves, if there's one. Note that strings are serialized
+    into themselves with the exception of 'None', which becomes None.
+    """
+    schema_type_type = type(schema_type)
+    if schema_type_type in (Int, NonStrictInt):
+        return int
+    if schema_type_type in (Float, NonStrictFloat):
+        return float
+    if schema_type_type in (Str, NonStrictStr) and not schema_type.encoding:
+        return str
+    if schema_type_type in (Bool, NonStrictBool) and schema_type.serializes_bools:
+        return bool
+    if schema_type_type is Bytes and schema_type.passes_bytes:
+        return bytes
+    return None
+
+
+def serialized_passthrough_item_type(node: nodes.SchemaNode) -> t.Optional[t.Type]:
+    """ Returns the type of values that the given node serializes into themselves,
+    as long as they are not the string 'None'.
+    """
+    if type(node) is not nodes.SchemaNode:
+        return None
+    return serialized_passthrough_type(node.typ)
+
+
 NonStrictPrimitiveSchemaTypeT = t.Union[
     AcceptEverything,
     NonStrictStr,
@@ -1,6 +1,12 @@
+import dataclasses
 import enum as std_enum
+import inspect
 import typing as t
 import pathlib
+import sys
+from functools import partial, lru_cache
+from itertools import repeat
+from types import MemberDescriptorType
 
 import typing_inspect as insp
 import colander as col
@@ -18,17 +24,40 @@ from . import nodes
 Null = nodes.Null
 
 
+def _passes(item_type: t.Optional[t.Type], items: t.Iterable[t.Any]) -> bool:
+    """ Whether all items are deserialized into themselves by a node
+    with the given ``passthrough_item_type()``.
+    """
+    if item_type is object:
+        return all(x is not Null for x in items)
+    if item_type is not None:
+        return all(type(x) is item_type for x in items)
+    return False
+
+
 class TypedMapping(meta.Mapping):
     def __init__(self, *, key_node: nodes.SchemaNode, value_node: nodes.SchemaNode):
         # https://docs.pylonsproject.org/projects/colander/en/latest/api.html#colander.Mapping
         super().__init__(unknown='preserve')
         self.key_node = key_node
         self.value_node = value_node
+        # keys and values of these types are deserialized into themselves
+        # (`object` stands for typing.Any)
+        self.key_type = primitives.passthrough_item_type(key_node)
+        self.value_type = primitives.passthrough_item_type(value_node)
 
     def deserialize(self, node, cstruct):
-        r = super().deserialize(node, cstruct)
-        if r in (Null, None):
-            return r
+        if type(cstruct) is dict:
+            if _passes(self.key_type, cstruct.keys()) and _passes(self.value_type, cstruct.values()):
+                # every item would be deserialized into itself
+                return dict(cstruct)
+            # colander would make a deep copy of the mapping
+            # only for its items to be parsed into another one below
+            r = cstruct
+        else:
+            r = super().deserialize(node, cstruct)
+            if r in (Null, None):
+                return r
         rv = {}
         for k, v in r.items():
             try:
@@ -46,12 +75,15 @@ class TypedMapping(meta.Mapping):
                     raise error
                 else:
                     rv[key] = val
-        return {self.key_node.deserialize(k): self.value_node.deserialize(v) for k, v in r.items()}
+        return rv
 
     def serialize(self, node, appstruct):
-        r = super().serialize(node, appstruct)
-        if r in (Null, None):
-            return r
+        if type(appstruct) is dict:
+            r = appstruct
+        else:
+            r = super().serialize(node, appstruct)
+            if r in (Null, None):
+                return r
 
         return {self.key_node.serialize(k): self.value_node.serialize(v) for k, v in r.items()}
 
@@ -77,6 +109,112 @@ class Path(primitives.Str):
             raise Invalid(node, f'Invalid variant of {self.typ.__name__}', cstruct)
 
 
+def _positional_constructor(
+    typ: t.Type[iface.IType],
+    attrs: t.Sequence[str]
+) -> t.Optional[t.Callable[[t.Sequence[t.Any]], iface.IType]]:
+    """ Returns a function that creates an instance of ``typ`` out of the values
+    of the given attributes, passed positionally in the same order.
+
+    Named tuples are created with tuple.__new__() directly, skipping keyword arguments
+    processing and the length check of the named tuple constructor. It bypasses __new__
+    and __init__ though, hence it's only used when neither of them is customised in subclasses.
+    Frozen slotted dataclasses get their slots written directly, see ``_slots_writer()``.
+    Other types are called with positional arguments, when their signature allows it.
+    """
+    if not isinstance(typ, type):
+        return None
+    slots_writer = _slots_writer(typ, attrs)
+    if slots_writer is not None:
+        return slots_writer
+    if issubclass(typ, tuple) and hasattr(typ, '_make'):
+        if tuple(attrs) != typ._fields:
+            return None
+        named_tuple_base: t.Type[tuple] = next(x for x in typ.__mro__ if '_make' in x.__dict__)
+        if typ.__new__ is not named_tuple_base.__new__ or typ.__init__ is not tuple.__init__:
+            return None
+        return partial(tuple.__new__, typ)
+    try:
+        parameters = list(inspect.signature(typ).parameters.values())
+    except (TypeError, ValueError):
+        return None
+    leading, rest = parameters[:len(attrs)], parameters[len(attrs):]
+    if [x.name for x in leading] != list(attrs):
+        return None
+    if any(x.kind is not inspect.Parameter.POSITIONAL_OR_KEYWORD for x in leading):
+        return None
+    if any(x.default is inspect.Parameter.empty and x.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                                                               inspect.Parameter.KEYWORD_ONLY)
+           for x in rest):
+        return None
+    return lambda values: typ(*values)
+
+
+def _slots_writer(
+    typ: t.Type[iface.IType],
+    attrs: t.Sequence[str]
+) -> t.Optional[t.Callable[[t.Sequence[t.Any]], iface.IType]]:
+    """ __init__ of frozen dataclasses assigns every field through object.__setattr__(),
+    which is looked up and called per field. When the fields are slots, and there's
+    nothing else for __init__ to do, their descriptors are written to directly instead,
+    by a function unrolled over the attributes.
+    """
+    if not dataclasses.is_dataclass(typ):
+        return None
+    owner = next(x for x in typ.__mro__ if '__dataclass_fields__' in x.__dict__)
+    if not (owner.__dataclass_params__.frozen and '__slots__' in owner.__dict__):
+        return None
+    if typ.__new__ is not object.__new__ or typ.__init__ is not owner.__init__ or hasattr(typ, '__post_init__'):
+        return None
+    fields = dataclasses.fields(owner)
+    if [x.name for x in fields] != list(attrs):
+        return None
+    # default factories are called by __init__, when it's given the marker of a missing value
+    if not all(x.init and x.default_factory is dataclasses.MISSING for x in fields):
+        return None
+    slots = [owner.__dict__.get(x) for x in attrs]
+    if not all(isinstance(x, MemberDescriptorType) for x in slots):
+        return None
+    namespace = {'new': object.__new__, 'typ': typ}
+    lines = ['def make(values):', '    instance = new(typ)']
+    for i, slot in enumerate(slots):
+        namespace[f'set_{i}'] = slot.__set__
+        lines.append(f'    set_{i}(instance, values[{i}])')
+    lines.append('    return instance')
+    exec('\n'.join(lines), namespace)
+    return namespace['make']
+
+
+def values_getter(
+    getter_type: t.Callable[..., t.Callable[[t.Any], t.Any]],
+    names: t.Sequence[str]
+) -> t.Callable[[t.Any], t.Tuple[t.Any, ...]]:
+    """ Returns ``operator.itemgetter`` or ``operator.attrgetter`` of the given names
+    that always returns a tuple, including the case of a single name.
+    """
+    if not names:
+        return lambda x: ()
+    if len(names) == 1:
+        get_value = getter_type(names[0])
+        return lambda x: (get_value(x),)
+    return getter_type(*names)
+
+
+class StructureField(t.NamedTuple):
+    """ Everything the structure needs to know about its child node
+    to (de)serialize the corresponding field
+    """
+    # the key of the field in the serialized data
+    name: str
+    # the attribute name of the structure type
+    field_name: str
+    deserialize: t.Callable[[t.Any], t.Any]
+    is_droppable: bool
+    serialize: t.Callable[[t.Any], t.Any]
+    # whether a missing value of the field is left out of the serialized data
+    drops_default: bool
+
+
 class Structure(meta.Mapping):
     """ SchemaNode for NamedTuples and derived types.
     """
@@ -92,6 +230,9 @@ class Structure(meta.Mapping):
         super().__init__(unknown)
         self.typ = typ
         self.attrs = attrs
+        self.make = _positional_constructor(typ, attrs)
+        # instances of named tuples made positionally are read positionally as well
+        self.is_tuple = self.make is not None and issubclass(typ, tuple)
         self.deserialize_overrides = deserialize_overrides
         # struct_field_name => source_field_name
         self.serialize_overrides = pmap({
@@ -102,33 +243,148 @@ class Structure(meta.Mapping):
         return f'Structure({self.typ})'
 
     def deserialize(self, node, cstruct):
+        if cstruct is Null:
+            return cstruct
+        fields = self.fields_of(node)
+        values = self._deserialize_values(node, fields, cstruct)
+        try:
+            if values is None:
+                return self.typ(**self._deserialize_with_colander(node, cstruct))
+            if self.make is not None and fields is node.fields:
+                # the fields precomputed by the parser follow the order of the attributes
+                return self.make(values)
+            return self.typ(**{field.field_name: value for field, value in zip(fields, values)})
+        except TypeError:
+            raise self.construction_error(node)
+
+    def construction_error(self, node) -> col.Invalid:
+        """ Returns the error reported when the type cannot be made out of
+        the deserialized values of its fields.
+        """
+        return Invalid(
+            node,
+            "Are you trying to use generically defined type Name(Generic[A]) via Name[<MyType>]? "
+            "Python doesn't support it, you have to use subclassing with a concrete type, like "
+            "class MySubtype(Name[ConcreteType])"
+        )
+
+    def fields_of(self, node) -> t.Tuple[StructureField, ...]:
+        """ Returns the fields of the structure, as they were precomputed
+        by the parser, or computes them from the current children of the node.
+        """
+        if node.fields is not None:
+            return node.fields
+        return tuple(
+            StructureField(
+                name=child.name,
+                field_name=self.deserialize_overrides.get(child.name, child.name),
+                deserialize=child.deserialize,
+                is_droppable=child.missing is col.drop,
+                serialize=child.serialize,
+                drops_default=child.default is col.drop,
+            )
+            for child in node.children
+        )
+
+    def _deserialize_values(
+        self,
+        node,
+        fields: t.Tuple[StructureField, ...],
+        cstruct
+    ) -> t.Optional[t.List[t.Any]]:
+        """ Returns deserialized values of all ``fields``, in the same order.
+
+        Plain dicts are walked directly, without the generic machinery of
+        colander.Mapping, yet every field is deserialized exactly once, and errors of all fields
+        are collected and reported the way colander does it. None is returned before any field
+        is deserialized, when the payload has to be passed through colander instead
+        (missing required keys, absent droppable fields, or unknown keys that have to be reported).
+        """
+        if not (type(cstruct) is dict
+                and self.unknown in ('ignore', 'raise')
+                and node.required_keys <= cstruct.keys()):
+            return None
+        if fields is node.fields:
+            field_keys = node.field_keys
+            droppable_keys = node.droppable_keys
+        else:
+            field_keys = frozenset(x.name for x in fields)
+            droppable_keys = frozenset(x.name for x in fields if x.is_droppable)
+        if not (droppable_keys <= cstruct.keys()
+                and (self.unknown == 'ignore' or cstruct.keys() <= field_keys)):
+            return None
+        if node.field_values is not None and fields is node.fields:
+            # all fields are required, hence present, and their values are taken at once
+            pairs: t.Iterator[t.Tuple[t.Callable[[t.Any], t.Any], t.Any]] = zip(
+                node.field_deserializers, node.field_values(cstruct)
+            )
+        else:
+            pairs = ((x.deserialize, cstruct.get(x.name, Null)) for x in fields)
+        values: t.List[t.Any] = []
+        error = None
+        while True:
+            try:
+                for deserialize, value in pairs:
+                    values.append(deserialize(value))
+            except Invalid as e:
+                # the walk resumes with the next field
+                if error is None:
+                    error = Invalid(node)
+                error.add(e, len(values))
+                values.append(None)
+            else:
+                break
+        if error is not None:
+            raise error
+        return values
+
+    def _deserialize_with_colander(self, node, cstruct) -> t.Dict[str, t.Any]:
+        """ Returns a mapping of struct_field_name => deserialized value.
+        """
         r = super().deserialize(node, cstruct)
-        if r is Null:
-            return r
-        d = {
+        return {
             self.deserialize_overrides.get(k, k): v
             for k, v in r.items()
         }
-        try:
-            return self.typ(**d)
-        except TypeError:
-            raise Invalid(
-                node,
-                "Are you trying to use generically defined type Name(Generic[A]) via Name[<MyType>]? "
-                "Python doesn't support it, you have to use subclassing with a concrete type, like "
-                "class MySubtype(Name[ConcreteType])"
-            )
 
     def serialize(self, node, appstruct: iface.IType) -> t.Mapping[str, t.Any]:
         if appstruct is Null:
             return super().serialize(node, appstruct)
-        return super().serialize(
-            node,
-            {
-                self.serialize_overrides.get(attr_name, attr_name): getattr(appstruct, attr_name)
-                for attr_name in self.attrs
-            }
-        )
+        fields = self.fields_of(node)
+        values: t.Iterable[t.Any]
+        if self.is_tuple and fields is node.fields and type(appstruct) is self.typ:
+            # named tuples are iterated over in the order of their attributes,
+            # which is the order of the precomputed fields (a tuple, as checked by is_tuple)
+            values = appstruct  # type: ignore[assignment]
+        elif fields is node.fields:
+            values = node.attribute_values(appstruct)
+        else:
+            values = [getattr(appstruct, field.field_name) for field in fields]
+        serialized_types: t.Iterable[t.Optional[type]]
+        if fields is node.fields:
+            serialized_types = node.field_serialized_types
+        else:
+            serialized_types = repeat(None)
+        rv = {}
+        try:
+            for field, value, serialized_type in zip(fields, values, serialized_types):
+                if type(value) is serialized_type and (serialized_type is not str or value != 'None'):
+                    # primitive values are put as they are, without calling their node
+                    rv[field.name] = value
+                    continue
+                if value is Null and field.drops_default:
+                    continue
+                rv[field.name] = field.serialize(value)
+        except Invalid:
+            # let colander collect and report errors of all fields
+            return super().serialize(
+                node,
+                {
+                    self.serialize_overrides.get(attr_name, attr_name): getattr(appstruct, attr_name)
+                    for attr_name in self.attrs
+                }
+            )
+        return rv
 
 
 Tuple = meta.Tuple
@@ -137,10 +393,10 @@ Tuple = meta.Tuple
 class Sum(meta.SchemaType):
     def __init__(
         self,
-        typ: sums.SumType,
+        typ: t.Type[sums.SumType],
         variant_nodes: t.Sequence[
             t.Tuple[
-                t.Type, t.Union[nodes.SchemaNode, col.SequenceSchema, col.TupleSchema]
+                sums.SumType, t.Union[nodes.SchemaNode, col.SequenceSchema, col.TupleSchema]
             ],
         ],
         as_dict_key: t.Optional[str] = None,
@@ -148,10 +404,24 @@ class Sum(meta.SchemaType):
         super().__init__()
         self.typ = typ
         self.variant_nodes = variant_nodes
-        self.as_dict_key = as_dict_key
+        # the key is looked up in every payload, like the interned names of structure fields
+        self.as_dict_key = as_dict_key if as_dict_key is None else sys.intern(as_dict_key)
         self.variant_schema_types: t.Set[meta.SchemaType] = {
             x.typ for _, x in variant_nodes
         }
+        # variant_name => (variant, variant_schema_node);
+        # variants of the same sum type are distinguished by their names only
+        # (see SumType.__instancecheck__), which gives us a direct lookup
+        # instead of trying every variant with isinstance()
+        self.variants_by_name: PMap[str, t.Tuple[sums.SumType, nodes.SchemaNode]] = pmap({
+            var_type.__variant_meta__.variant_name: (var_type, var_schema)
+            for var_type, var_schema in variant_nodes
+        })
+        # tag => (variant, variant_schema_node), for direct dispatch of deserialized tags;
+        # in case of duplicate tags the first variant takes precedence
+        self.variants_by_tag: t.Dict[t.Any, t.Tuple[sums.SumType, nodes.SchemaNode]] = {}
+        for var_type, var_schema in variant_nodes:
+            self.variants_by_tag.setdefault(var_type.__variant_meta__.value, (var_type, var_schema))
 
     def deserialize(self, node, cstruct):
         if cstruct in (Null, None):
@@ -186,46 +456,58 @@ class Sum(meta.SchemaType):
                     'Incorrect data layout for this type.',
                     cstruct
                 )
-        # next, iterate over available variants and return the first
-        # matched structure.
-        for var_type, var_schema in self.variant_nodes:
-            if var_type.__variant_meta__.value != tag:
-                continue
-            try:
-                variant_struct = var_schema.deserialize(payload)
-            except Invalid as e:
-                raise Invalid(
-                    node,
-                    f'Incorrect payload format for '
-                    f'{var_type.__variant_meta__.variant_of.__name__}.{var_type.__variant_meta__.variant_name}',
-                    cstruct
-                )
-            return var_type(**variant_struct._asdict())
-
-        raise Invalid(
+        try:
+            var_type, var_schema = self.variants_by_tag[tag]
+        except (KeyError, TypeError):
+            # TypeError stands for unhashable tags
+            raise Invalid(
+                node,
+                'None of the expected variants matches provided data',
+                cstruct
+            )
+        try:
+            variant_struct = var_schema.deserialize(payload)
+        except Invalid:
+            raise self.payload_error(node, var_type, cstruct)
+        if type(variant_struct) is var_type.__variant_meta__.constructor:
+            return sums.impl.variant_with_data(var_type, variant_struct)
+        return var_type(**variant_struct._asdict())
+
+    def payload_error(self, node, var_type: sums.SumType, cstruct) -> col.Invalid:
+        """ Returns the error reported when the payload of ``cstruct``
+        doesn't match the variant it is tagged with.
+        """
+        return Invalid(
             node,
-            'None of the expected variants matches provided data',
+            f'Incorrect payload format for '
+            f'{var_type.__variant_meta__.variant_of.__name__}.{var_type.__variant_meta__.variant_name}',
             cstruct
         )
 
     def serialize(self, node, appstruct: t.Any):
-        if appstruct in (Null, None):
+        if appstruct is None or appstruct is Null:
             return None
 
-        for var_type, var_schema in self.variant_nodes:
-            if isinstance(appstruct, var_type):
-                if self.as_dict_key:
-                    rv = var_schema.serialize(appstruct)
-                    rv[self.as_dict_key] = var_type.__variant_meta__.value
-                    return rv
-                else:
-                    return (var_type.__variant_meta__.value, var_schema.serialize(appstruct))
+        try:
+            variant_meta = appstruct.__variant_meta__
+            var_type, var_schema = self.variants_by_name[variant_meta.variant_name]
+        except (AttributeError, KeyError):
+            matched = False
+        else:
+            matched = issubclass(variant_meta.variant_of, self.typ)
 
-        raise Invalid(
-            node,
-            'None of the expected variants matches provided structure',
-            appstruct
-        )
+        if not matched:
+            raise Invalid(
+                node,
+                'None of the expected variants matches provided structure',
+                appstruct
+            )
+
+        if self.as_dict_key:
+            rv = var_schema.serialize(appstruct)
+            rv[self.as_dict_key] = var_type.__variant_meta__.value
+            return rv
+        return (var_type.__variant_meta__.value, var_schema.serialize(appstruct))
 
 
 EnumLike = std_enum.Enum
@@ -235,6 +517,18 @@ class Enum(primitives.Str):
     def __init__(self, typ: t.Type[EnumLike], *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.typ = typ
+        # value => member, so that valid values don't go through EnumMeta.__call__;
+        # other values are still passed to the enum class, as it may define _missing_()
+        try:
+            self.members: t.Mapping[t.Any, EnumLike] = {
+                member.value: member for member in typ.__members__.values()
+            }
+        except TypeError:
+            # unhashable values
+            self.members = {}
+        self.has_custom_missing = (
+            getattr(typ._missing_, '__func__', None) is not getattr(std_enum.Enum._missing_, '__func__')
+        )
 
     def serialize(self, node, appstruct):
         if appstruct is Null:
@@ -243,9 +537,19 @@ class Enum(primitives.Str):
         return r
 
     def deserialize(self, node, cstruct) -> std_enum.Enum:
+        if type(cstruct) is str and (cstruct or self.allow_empty):
+            # the string schema type would return the same value
+            try:
+                return self.members[cstruct]
+            except KeyError:
+                pass
         r = super().deserialize(node, cstruct)
         if r is Null:
             return r
+        try:
+            return self.members[r]
+        except KeyError:
+            pass
         try:
             return self.typ(r)
         except ValueError:
@@ -258,14 +562,22 @@ generic_type_bases: t.Callable[[t.Type], t.Tuple[t.Type, ...]] = lambda x: (insp
 class Literal(meta.SchemaType):
     def __init__(self, variants: t.FrozenSet):
         super().__init__()
+        # literal values are hashable, hence the set makes every check a single lookup
         self.variants = variants
 
+    def matches(self, value: t.Any) -> bool:
+        try:
+            return value in self.variants
+        except TypeError:
+            # unhashable values are never among the variants
+            return False
+
     def deserialize(self, node, cstruct):
         if cstruct is Null:
             # explicitly passed None is not col.null
             # therefore we must handle it separately
             return cstruct
-        if cstruct in self.variants:
+        if self.matches(cstruct):
             return cstruct
         raise Invalid(
             node,
@@ -276,7 +588,7 @@ class Literal(meta.SchemaType):
     def serialize(self, node, appstruct: t.Any):
         if appstruct is Null:
             return None
-        if appstruct in self.variants:
+        if self.matches(appstruct):
             return appstruct
         raise Invalid(
             node,
@@ -285,6 +597,100 @@ class Literal(meta.SchemaType):
         )
 
 
+class _VariantKind(std_enum.Enum):
+    # Mappings (which are not structs) have their own serializer
+    MAPPING = 'mapping'
+    # Sequences and tuples require special treatment:
+    # since there is no direct reference to the target python data type
+    # through variant.typ.typ that we could use to compare this variant
+    # with appstruct's type, we just check if the appstruct is a list-like
+    # object. And if it is, we apply SequenceSchema's serializer on it,
+    # otherwise we skip this variant (we need to do that to make sure that
+    # a Union variant matches appstruct's type as close as possible)
+    SEQUENCE = 'sequence'
+    TUPLE = 'tuple'
+    # nodes.SchemaNode, matched against the type of appstruct
+    NODE = 'node'
+
+
+class _UnionVariant(t.NamedTuple):
+    kind: _VariantKind
+    typ: t.Any
+    node: t.Union[nodes.SchemaNode, col.SequenceSchema, col.TupleSchema]
+    # types of appstruct that the variant accepts without the issubclass() check
+    matching_types: t.Tuple[t.Any, ...] = ()
+    is_forward_ref: bool = False
+    # for sequences of strict primitives, the only type their items may have
+    item_type: t.Optional[t.Type] = None
+    # for structures, the keys that a mapping must have to be accepted
+    required_keys: t.FrozenSet[str] = frozenset()
+
+    def may_accept(self, value_type: t.Type) -> bool:
+        """ Returns False if the variant rejects any value of the given built-in type.
+        """
+        schema_type = self.node.typ
+        if self.kind is _VariantKind.MAPPING or type(schema_type) is Structure:
+            # colander.Mapping accepts dict-like values only
+            return hasattr(value_type, 'items')
+        if self.kind is _VariantKind.SEQUENCE and not schema_type.accept_scalar:
+            # colander.Sequence accepts non-string iterables that are not dict-like
+            return (
+                hasattr(value_type, '__iter__')
+                and not hasattr(value_type, 'get')
+                and not issubclass(value_type, str)
+            )
+        allowed_type = primitives.STRICT_PRIMITIVE_TYPES.get(type(schema_type))
+        if allowed_type is not None:
+            return value_type is allowed_type
+        return True
+
+    @classmethod
+    def of(cls, var_type: t.Any, var_schema) -> '_UnionVariant':
+        if isinstance(var_schema.typ, TypedMapping):
+            return cls(_VariantKind.MAPPING, var_type, var_schema)
+        if isinstance(var_schema, col.SequenceSchema):
+            item_schema_type = type(var_schema.children[0].typ)
+            return cls(
+                _VariantKind.SEQUENCE,
+                var_type,
+                var_schema,
+                item_type=primitives.STRICT_PRIMITIVE_TYPES.get(item_schema_type),
+            )
+        if isinstance(var_schema, col.TupleSchema):
+            return cls(_VariantKind.TUPLE, var_type, var_schema)
+        if type(var_schema.typ) is Structure:
+            required_keys = var_schema.required_keys
+        else:
+            required_keys = frozenset()
+        # get_origin() normalizes meta-types like `typing.Dict` to dict class etc.
+        if insp.is_generic_type(var_type):
+            matching_types = (var_type,) + generic_type_bases(var_type)
+        else:
+            matching_types = (insp.get_origin(var_type), var_type)
+        return cls(
+            _VariantKind.NODE,
+            var_type,
+            var_schema,
+            matching_types=matching_types,
+            is_forward_ref=isinstance(var_type, t.ForwardRef),
+            required_keys=required_keys,
+        )
+
+
+# The number of distinct sets of required keys that a union remembers the matching structures for,
+# the sets come from the data, and the limit keeps the memory bounded on arbitrary payloads
+MAX_UNION_KEY_SETS = 64
+
+
+# The nodes of the variants that fail on a value are usually the same for all invalid values,
+# and formatting their reprs takes longer than the rest of the error,
+# hence messages are formatted once per combination of the nodes.
+@lru_cache(maxsize=256)
+def _no_suitable_variant_message(variant_nodes: t.Tuple[t.Any, ...]) -> str:
+    errors = "\n\t * ".join(str(x) for x in variant_nodes)
+    return f'No suitable variant among tried:\n\t * {errors}\n'
+
+
 class Union(meta.SchemaType):
     """ This node handles typing.Union[T1, T2, ...] cases.
     Please note that typing.Optional[T] is normalized by parser as typing.Union[None, T],
@@ -317,16 +723,154 @@ class Union(meta.SchemaType):
         self.variant_schema_literals: t.FrozenSet[t.Any] = frozenset().union(
             *[x.variants for x in self.variant_schema_types if isinstance(x, Literal)]
         )
+        # The way a variant is tried depends on the variant only,
+        # therefore it is decided once here rather than on every (de)serialize() call.
+        self.variants: t.Tuple[_UnionVariant, ...] = tuple(
+            _UnionVariant.of(var_type, var_schema) for var_type, var_schema in variant_nodes
+        )
+        self.has_typed_sequences = any(x.item_type is not None for x in self.variants)
+        self.has_required_keys = any(x.required_keys for x in self.variants)
+        # Dicts are matched against structures by the required keys they have, which are
+        # a subset of all the required keys of the variants. The structures matching each subset
+        # are looked up in a table, filled in with the subsets that occur in the data.
+        self.required_keys: t.FrozenSet[str] = frozenset().union(*[x.required_keys for x in self.variants])
+        self.candidates_by_keys: t.Dict[t.FrozenSet[str], t.Tuple[_UnionVariant, ...]] = {}
+        # Variants that are tried in turn for values of the built-in types
+        # that deserialized data usually consists of, and the ones among them
+        # that may accept such values: variants of a different shape are not tried at all,
+        # e.g. a dict is never tried against sequences and strict primitives.
+        self.remaining_by_type: t.Mapping[t.Type, t.Tuple[_UnionVariant, ...]] = {
+            value_type: self._remaining_variants(self.tried_primitive(value_type))
+            for value_type in (dict, list, str, int, float, bool)
+        }
+        self.candidates_by_type: t.Mapping[t.Type, t.Tuple[_UnionVariant, ...]] = {
+            value_type: tuple(x for x in remaining if x.may_accept(value_type))
+            for value_type, remaining in self.remaining_by_type.items()
+        }
+        # Values of a type that only one variant may accept, like dicts of Optional[SomeStructure],
+        # are dispatched straight to that variant by a single lookup.
+        self.sole_candidate_by_type: t.Mapping[t.Type, _UnionVariant] = {
+            value_type: candidates[0]
+            for value_type, candidates in self.candidates_by_type.items()
+            if len(candidates) == 1 and self.tried_primitive(value_type) is None
+        }
+        # Values of the types that the tried primitive variant deserializes into themselves,
+        # e.g. strings of Optional[str], are returned as they are, without trying the variant.
+        self.passthrough_types: t.FrozenSet[t.Type] = frozenset(
+            value_type for value_type, primitive in (
+                (x, self.tried_primitive(x)) for x in self.remaining_by_type
+            )
+            if primitive is not None and primitives.passthrough_type(primitive) is value_type
+        )
+        # Unions of enums are resolved with a single lookup in a merged value => member table,
+        # where the first variant defining a value takes precedence, as it would be tried first.
+        self.enum_members: t.Optional[t.Mapping[t.Any, EnumLike]] = None
+        variant_schema_types = [x.typ for _, x in variant_nodes]
+        if all(type(x) is Enum and not x.has_custom_missing for x in variant_schema_types):
+            self.enum_members = {}
+            for schema_type in reversed(variant_schema_types):
+                self.enum_members.update(schema_type.members)
 
     def __repr__(self) -> str:
         return f'Optional({self.variant_schema_types})' if len(self.variant_schema_types) == 1 else f'Union({self.variant_schema_types})'
 
+    def tried_primitive(self, value_type: t.Type) -> t.Optional[meta.SchemaType]:
+        """ Returns the primitive schema type of a variant that is tried
+        first for values of the given type, if there's one.
+        """
+        prim_schema_type = self.primitive_types.get(value_type)
+        if prim_schema_type in self.variant_schema_types:
+            return prim_schema_type
+        return None
+
+    def _remaining_variants(self, prim_schema_type) -> t.Tuple[_UnionVariant, ...]:
+        return tuple(
+            x for x in self.variants
+            if x.node.typ is not prim_schema_type
+        )
+
+    def _filter_typed_sequences(
+        self,
+        variants: t.Tuple[_UnionVariant, ...],
+        value: t.Any
+    ) -> t.Tuple[_UnionVariant, ...]:
+        """ A list cannot match a sequence of strict primitives if its first
+        item is of a different type, e.g. [1] for ``Sequence[str] | Sequence[int]``.
+        Such variants are excluded up front, without trying them item by item.
+        """
+        if not self.has_typed_sequences or type(value) is not list or not value or value[0] is None:
+            return variants
+        item_type = type(value[0])
+        candidates = tuple(x for x in variants if x.item_type in (None, item_type))
+        if len(candidates) == len(variants):
+            return variants
+        return candidates
+
+    def _filter_structures(
+        self,
+        variants: t.Tuple[_UnionVariant, ...],
+        value: t.Any
+    ) -> t.Tuple[_UnionVariant, ...]:
+        """ A dict cannot match a structure if any of the structure's required keys
+        is missing from it. Such variants are excluded with a set comparison,
+        instead of raising and catching their Invalid errors.
+        """
+        if not self.has_required_keys or type(value) is not dict:
+            return variants
+        if variants is not self.candidates_by_type[dict]:
+            return self._variants_with_keys(variants, value.keys())
+        present = self.required_keys.intersection(value)
+        try:
+            return self.candidates_by_keys[present]
+        except KeyError:
+            candidates = self._variants_with_keys(variants, present)
+            if len(self.candidates_by_keys) < MAX_UNION_KEY_SETS:
+                self.candidates_by_keys[present] = candidates
+            return candidates
+
+    @staticmethod
+    def _variants_with_keys(
+        variants: t.Tuple[_UnionVariant, ...],
+        keys: t.AbstractSet[str]
+    ) -> t.Tuple[_UnionVariant, ...]:
+        candidates = tuple(x for x in variants if x.required_keys <= keys)
+        if len(candidates) == len(variants):
+            return variants
+        return candidates
+
     def deserialize(self, node, cstruct):
-        if cstruct in (Null, None):
+        if cstruct is None or cstruct is Null:
             # explicitly passed None is not col.null
             # therefore we must handle both
             return cstruct
 
+        if type(cstruct) in self.passthrough_types:
+            return cstruct
+
+        if self.enum_members is not None and type(cstruct) is str:
+            try:
+                return self.enum_members[cstruct]
+            except KeyError:
+                pass
+
+        sole_candidate = self.sole_candidate_by_type.get(type(cstruct))
+        if sole_candidate is not None:
+            try:
+                return sole_candidate.node.deserialize(cstruct)
+            except Invalid as e:
+                return self.deserialize_variants(node, cstruct, (sole_candidate, e))
+        return self.deserialize_variants(node, cstruct)
+
+    def deserialize_variants(
+        self,
+        node,
+        cstruct,
+        failed: t.Optional[t.Tuple[_UnionVariant, col.Invalid]] = None
+    ):
+        """ Tries the variants in turn, and returns the value of the first matching one.
+        Every variant is tried once at most: the ``failed`` variant, that was tried
+        by the caller already, is reported with the error it raised.
+        """
         collected_errors: t.List[Invalid] = []
         # Firstly, let's see if `cstruct` is one of the primitive types
         # supported by Python, and if this primitive type is specified
@@ -337,7 +881,8 @@ class Union(meta.SchemaType):
         # fact that both str() and int() constructors can happily
         # handle that value and return one of the expected variants
         # (but incorrectly!)
-        prim_schema_type = self.primitive_types.get(type(cstruct))
+        cstruct_type = type(cstruct)
+        prim_schema_type = self.primitive_types.get(cstruct_type)
         if prim_schema_type in self.variant_schema_types:
             try:
                 return prim_schema_type.deserialize(node, cstruct)
@@ -346,21 +891,39 @@ class Union(meta.SchemaType):
 
         # next, iterate over available variants and return the first
         # matched structure.
-        remaining_variants = (
-            x for _, x in self.variant_nodes
-            if x.typ is not prim_schema_type
-        )
-        for variant in remaining_variants:
+        try:
+            remaining_variants = self.remaining_by_type[cstruct_type]
+        except KeyError:
+            remaining_variants = candidates = self._remaining_variants(prim_schema_type)
+        else:
+            candidates = self.candidates_by_type[cstruct_type]
+        candidates = self._filter_structures(self._filter_typed_sequences(candidates, cstruct), cstruct)
+        # id(variant) => the error the variant raised
+        variant_errors: t.Dict[int, col.Invalid] = {}
+        if failed is not None:
+            variant_errors[id(failed[0])] = failed[1]
+        for variant in candidates:
+            if id(variant) in variant_errors:
+                continue
             try:
-                return variant.deserialize(cstruct)
+                return variant.node.deserialize(cstruct)
             except Invalid as e:
-                collected_errors.append(e)
-                continue
+                variant_errors[id(variant)] = e
+
+        for variant in remaining_variants:
+            if id(variant) not in variant_errors:
+                # the variant was not tried, we need its error to report
+                try:
+                    variant.node.deserialize(cstruct)
+                except Invalid as e:
+                    variant_errors[id(variant)] = e
+        collected_errors.extend(
+            variant_errors[id(x)] for x in remaining_variants if id(x) in variant_errors
+        )
 
-        errors = "\n\t * ".join(str(x.node) for x in collected_errors)
         error = Invalid(
             node,
-            f'No suitable variant among tried:\n\t * {errors}\n',
+            _no_suitable_variant_message(tuple(x.node for x in collected_errors)),
             cstruct
         )
         for e in collected_errors:
@@ -368,7 +931,7 @@ class Union(meta.SchemaType):
         raise error
 
     def serialize(self, node, appstruct: t.Any):
-        if appstruct in (Null, None):
+        if appstruct is None or appstruct is Null:
             return None
 
         struct_type = type(appstruct)
@@ -385,67 +948,36 @@ class Union(meta.SchemaType):
             except Invalid:
                 pass
 
-        remaining_variants = (
-            (t, s)
-            for (t, s) in self.variant_nodes
-            if s.typ is not prim_schema_type
-        )
-
         collected_errors = []
-        for var_type, var_schema in remaining_variants:
-            # Mappings (which are not structs) have their own serializer
-            if isinstance(var_schema.typ, TypedMapping) and not isinstance(var_schema, Structure):
-                try:
-                    return var_schema.serialize(appstruct)
-                except Invalid as e:
-                    collected_errors.append(e)
-                    continue
+        for variant in self._filter_typed_sequences(self.variants, appstruct):
+            var_schema = variant.node
+            if var_schema.typ is prim_schema_type:
+                continue
 
-            # Sequences and tuples require special treatment here:
-            # since there is no direct reference to the target python data type
-            # through variant.typ.typ that we could use to compare this variant
-            # with appstruct's type, we just check if the appstruct is a list-like
-            # object. And if it is, we apply SequenceSchema's serializer on it,
-            # otherwise we skip this variant (we need to do that to make sure that
-            # a Union variant matches appstruct's type as close as possible)
-            # if isinstance(struct_type, (list, tuple, set))
-            if isinstance(var_schema, col.SequenceSchema):
+            if variant.kind is _VariantKind.SEQUENCE:
                 if not isinstance(appstruct, list):
                     continue
-                try:
-                    return var_schema.serialize(appstruct)
-                except Invalid as e:
-                    collected_errors.append(e)
-                    continue
-
-            elif isinstance(var_schema, col.TupleSchema):
+            elif variant.kind is _VariantKind.TUPLE:
                 if not isinstance(appstruct, tuple):
                     continue
-                try:
-                    return var_schema.serialize(appstruct)
-                except Invalid as e:
-                    collected_errors.append(e)
-                    continue
-
-            else:
-                # nodes.SchemaNode
+            elif variant.kind is _VariantKind.NODE:
                 # We need to check if the type of the appstruct
                 # is the same as the type that appears in the Union
                 # definition and is associated with this SchemaNode.
-                # get_origin() normalizes meta-types like `typing.Dict`
-                # to dict class etc.
                 #  Please note that the order of checks matters here, since
                 # subscripted generics like typing.Dict cannot be used with
                 # issubclass
-                if insp.is_generic_type(var_type):
-                    matching_types = (var_type,) + generic_type_bases(var_type)
-                else:
-                    matching_types = (insp.get_origin(var_type), var_type)
-                if struct_type in matching_types or isinstance(var_type, t.ForwardRef) or issubclass(struct_type, var_type):
-                    try:
-                        return var_schema.serialize(appstruct)
-                    except Invalid as e:
-                        collected_errors.append(e)
+                if not (
+                    struct_type in variant.matching_types
+                    or variant.is_forward_ref
+                    or issubclass(struct_type, variant.typ)
+                ):
+                    continue
+
+            try:
+                return var_schema.serialize(appstruct)
+            except Invalid as e:
+                collected_errors.append(e)
 
         raise Invalid(
             node,
@@ -1,4 +1,5 @@
 import re
+import sys
 from typing import Dict, Any, get_type_hints, Type, Iterator, Set, NamedTuple
 
 
@@ -61,7 +62,7 @@ class SumTypeMetaclass(type):
             if SUM_TYPE_VARIANT_NAME_RE.match(x[0])
         )
 
-        for variant_name, data_constructor in data_constructors:
+        for variant_name, definition in data_constructors:
             if variant_name in variants:
                 raise TypeError(f'Variant {variant_name} is already defined for {class_name}')
 
@@ -71,15 +72,19 @@ class SumTypeMetaclass(type):
                 base_variant = getattr(base, variant_name)
                 variant_tag = base_variant.__variant_meta__.value
             else:
-                variant_tag = getattr(data_constructor, '__tag__', variant_name.lower())
-
-            data_constructor_hints = get_type_hints(data_constructor)
-            if data_constructor_hints:
-                data_constructor = NamedTuple(variant_name, data_constructor_hints.items())
-            else:
-                data_constructor = data_constructor.__bases__[0]
-                if data_constructor is object:
-                    data_constructor = NamedTuple(variant_name, ())
+                variant_tag = getattr(definition, '__tag__', variant_name.lower())
+                if type(variant_tag) is str:
+                    # tags are written into and looked up in the serialized data of every variant,
+                    # interned ones are compared by identity with the interned keys and values of payloads
+                    variant_tag = sys.intern(variant_tag)
+
+            data_constructor_hints = get_type_hints(definition)
+            data_constructor = (
+                # a data constructor the variant is derived from
+                definition.__bases__[0]
+                if not data_constructor_hints and definition.__bases__[0] is not object else
+                NamedTuple(variant_name, data_constructor_hints.items())
+            )
 
             # necessary for ``type(SumType.X) is SumType``
             variant = object.__new__(user_defined_sum_class)
@@ -129,6 +134,8 @@ class SumTypeMetaclass(type):
 
 
 class SumType(metaclass=SumTypeMetaclass):
+    __slots__ = ('__variant_meta__', '__variant_data__', '__weakref__')
+
     __sum_meta__: SumTypeMetaData = None
 
     def __instancecheck__(self, other) -> bool:
@@ -158,12 +165,15 @@ class SumType(metaclass=SumTypeMetaclass):
         :param constructor: constructor for a data that this variant can hold
         """
         self.__variant_meta__ = variant_meta
+        self.__variant_data__ = None
         if data_args or data_kwargs:
-            data = variant_meta.constructor(*data_args, **data_kwargs)
-            self.__getattribute__ = data.__getattribute__
+            self.__variant_data__ = variant_meta.constructor(*data_args, **data_kwargs)
 
     def __getattr__(self, item):
-        return self.__getattribute__(item)
+        data = self.__variant_data__
+        if data is None:
+            raise AttributeError(item)
+        return getattr(data, item)
 
     def __call__(self, *data_args, **data_kwargs) -> 'SumType':
         """ Returns a data-holding variant"""
@@ -226,6 +236,18 @@ class SumType(metaclass=SumTypeMetaclass):
         return self.__class__, (self.__variant_meta__.value, )
 
 
+def variant_with_data(variant: SumType, data: Any) -> SumType:
+    """ Returns a data-holding variant, the same as ``variant(**data._asdict())`` does,
+    for data that is an instance of the variant's data constructor already,
+    without re-creating the data out of keyword arguments.
+    """
+    instance = object.__new__(variant.__sum_meta__.type)
+    instance.__variant_meta__ = variant.__variant_meta__
+    # variants without attributes hold no data, see SumType.__init__
+    instance.__variant_data__ = data if len(data) else None
+    return instance
+
+
 def verify_consistency(base_variants, variants):
     if len(base_variants) != len(variants):
         raise TypeError()
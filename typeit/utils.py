@@ -1,7 +1,9 @@
 import re
+import sys
 import keyword
 import string
 import inspect as ins
+from functools import lru_cache
 from typing import Any, Type, TypeVar, Callable, Optional
 
 from colander import TupleSchema, SequenceSchema
@@ -42,20 +44,45 @@ def is_named_tuple(typ: Type[Any]) -> bool:
 
 def clone_schema_node(node: T) -> T:
     """ Clonning the node and reassigning the same children,
-    because clonning is recursive, but we are only interested
+    because colander's clone() is recursive, but we are only interested
     in a new version of the outermost schema node, the children nodes
     should be shared to avoid unnecessary duplicates.
     """
-    new_node = node.clone()
-    # a list comprehension to place the same nodes into
+    # the same as node.clone() does for the outermost node,
+    # without constructing a node only to overwrite its attributes
+    new_node = object.__new__(node.__class__)
+    new_node.__dict__.update(node.__dict__)
     # a new wrapping list object, so that extending
     # the cloned node with new children doesn't affect the original node
-    new_node.children = [x for x in node.children]
+    new_node.children = list(node.children)
     return new_node
 
 
 def get_global_name_overrider(overrides: OverridesT) -> Callable[[str], str]:
-    return overrides.get(flags.GlobalNameOverride, flags.Identity)
+    overrider = overrides.get(flags.GlobalNameOverride, flags.Identity)
+    if overrider is flags.Identity:
+        # the parser checks for identity to skip overrides altogether
+        return overrider
+    try:
+        return _interning_overrider(overrider)
+    except TypeError:
+        # unhashable callable objects cannot be memoized
+        return overrider
+
+
+# overriders may be created dynamically (e.g. lambdas passed to throwaway constructors),
+# the cache is bounded, so that they don't pile up
+@lru_cache(maxsize=512)
+def _interning_overrider(overrider: Callable[[str], str]) -> Callable[[str], str]:
+    """ Name modifiers such as ``inflection.camelize`` are regex-heavy
+    and get called for every field of every type being parsed.
+    The results are memoized per overrider and interned,
+    so that all schema nodes share the same key objects.
+    """
+    @lru_cache(maxsize=1024)
+    def override(name: str) -> str:
+        return sys.intern(overrider(name))
+    return override
 
 
 def new(t: Type[A], scope: Optional[B] = None) -> A: